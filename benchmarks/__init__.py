@@ -0,0 +1,3 @@
+"""
+ResumeFit AI benchmark scripts
+"""
@@ -0,0 +1,69 @@
+"""
+Run the bulk ingestion CLI end to end on a small synthetic corpus.
+
+    python -m benchmarks.bulk_ingest --pages 1 3 --copies 2 --workers 2
+
+The CLI runs twice against a fresh output file: the first run must write
+one record per file and the second must skip them all. Each run is a
+subprocess with a timeout, so a pool that never shuts down fails the
+check instead of hanging it. Exits non-zero on any failure.
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from benchmarks.corpus import build_pdf_corpus, write_txt_resume
+
+
+def run_cli(paths, output: str, workers: int, timeout: float) -> float:
+    """Run utils.bulk_ingest once and return its wall-clock seconds"""
+    start = time.perf_counter()
+    subprocess.run([sys.executable, "-m", "utils.bulk_ingest", *paths, "-o", output, "--workers", str(workers)],
+                   cwd=PROJECT_ROOT, check=True, timeout=timeout, capture_output=True)
+    return time.perf_counter() - start
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--pages", type=int, nargs="+", default=[1, 3])
+    parser.add_argument("--copies", type=int, default=2)
+    parser.add_argument("--workers", type=int, default=2)
+    parser.add_argument("--timeout", type=float, default=60.0, help="Seconds allowed per CLI run")
+    parser.add_argument("--corpus-dir", default=os.path.join(tempfile.gettempdir(), "resumefit_bench_ingest"))
+    args = parser.parse_args(argv)
+
+    paths = build_pdf_corpus(args.corpus_dir, args.pages, args.copies)
+    paths.append(write_txt_resume(os.path.join(args.corpus_dir, "resume.txt"), 4))
+
+    with tempfile.TemporaryDirectory(prefix="resumefit_ingest_") as scratch:
+        output = os.path.join(scratch, "resumes.jsonl")
+        try:
+            first = run_cli(paths, output, args.workers, args.timeout)
+            second = run_cli(paths, output, args.workers, args.timeout)
+        except subprocess.TimeoutExpired as e:
+            print(f"FAIL: bulk ingest did not finish within {e.timeout:.0f}s")
+            return 1
+        except subprocess.CalledProcessError as e:
+            print(f"FAIL: bulk ingest exited with {e.returncode}\n{e.stderr.decode(errors='replace')}")
+            return 1
+        with open(output, "r", encoding="utf-8") as f:
+            records = [json.loads(line) for line in f]
+
+    print(f"Corpus: {len(paths)} files | first run {first:.2f}s ({len(paths) / first:.1f} files/s), "
+          f"re-run {second:.2f}s")
+    if len(records) != len(paths) or any(record["error"] for record in records):
+        print(f"FAIL: expected {len(paths)} successful records after both runs, found {len(records)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
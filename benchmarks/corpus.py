@@ -0,0 +1,178 @@
+import os
+import random
+from typing import Dict, List
+
+SECTION_TITLES = ["Professional Summary", "Experience", "Education", "Skills", "Projects", "Certifications"]
+WORDS = (
+    "developed implemented optimized led designed migrated automated analyzed delivered scaled "
+    "python java sql kubernetes docker aws react pipelines dashboards customers revenue latency "
+    "team stakeholders platform services reporting infrastructure testing deployment quality"
+).split()
+
+
+def _sentence(rng: random.Random) -> str:
+    words = [rng.choice(WORDS) for _ in range(rng.randint(8, 18))]
+    return " ".join(words).capitalize() + f", improving results by {rng.randint(5, 60)}%."
+
+
+FONTS = [("Helvetica", "Helvetica-Bold"), ("Times-Roman", "Times-Bold"), ("Courier", "Courier-Bold")]
+
+
+def _noise_image(rng: random.Random, size_kb: int):
+    """Incompressible RGB image of roughly `size_kb`, standing in for photos and logos"""
+    from PIL import Image
+    from reportlab.lib.utils import ImageReader
+
+    side = max(8, int((size_kb * 1024 / 3) ** 0.5))
+    return ImageReader(Image.frombytes("RGB", (side, side), bytes(rng.getrandbits(8) for _ in range(side * side * 3))))
+
+
+def write_pdf_resume(path: str, pages: int, seed: int = 0, font: int = 0, font_size: int = 10,
+                     table: bool = False, image_kb: int = 0) -> str:
+    """Write a synthetic multi-page resume PDF with reportlab.
+
+    `font` picks a standard font family from FONTS, `table` draws a gridded
+    skills table on every page and `image_kb` embeds a photo-sized image to
+    grow the file without adding text.
+    """
+    from reportlab.lib.pagesizes import A4
+    from reportlab.pdfgen import canvas
+
+    rng = random.Random(seed)
+    regular, bold = FONTS[font % len(FONTS)]
+    line_height = font_size + 4
+    width, height = A4
+    pdf = canvas.Canvas(path, pagesize=A4)
+    for page in range(pages):
+        y = height - 60
+        if page == 0:
+            pdf.setFont(bold, font_size + 8)
+            pdf.drawString(50, y, f"Candidate {seed}")
+            y -= 20
+            pdf.setFont(regular, font_size)
+            pdf.drawString(50, y, f"candidate{seed}@example.com | +1 555 010 {seed:04d}")
+            y -= 30
+            if image_kb:
+                pdf.drawImage(_noise_image(rng, image_kb), width - 130, height - 130, 80, 80)
+        if table:
+            pdf.setFont(regular, font_size)
+            for row in range(4):
+                cells = [rng.choice(WORDS).capitalize(), f"{rng.randint(1, 10)} years", rng.choice(WORDS)]
+                for col, cell in enumerate(cells):
+                    pdf.rect(50 + col * 160, y - 4, 160, line_height)
+                    pdf.drawString(55 + col * 160, y, cell)
+                y -= line_height
+            y -= 16
+        while y > 80:
+            pdf.setFont(bold, font_size + 2)
+            pdf.drawString(50, y, rng.choice(SECTION_TITLES))
+            y -= line_height + 4
+            pdf.setFont(regular, font_size)
+            for _ in range(rng.randint(3, 6)):
+                pdf.drawString(60, y, "- " + _sentence(rng)[:int(950 / font_size)])
+                y -= line_height
+            y -= 10
+        pdf.showPage()
+    pdf.save()
+    return path
+
+
+def build_pdf_corpus(directory: str, page_counts: List[int], copies: int = 3) -> List[str]:
+    """Generate `copies` PDFs for each page count and return their paths"""
+    os.makedirs(directory, exist_ok=True)
+    paths = []
+    for pages in page_counts:
+        for copy in range(copies):
+            path = os.path.join(directory, f"resume_{pages}p_{copy}.pdf")
+            if not os.path.exists(path):
+                write_pdf_resume(path, pages, seed=pages * 100 + copy)
+            paths.append(path)
+    return paths
+
+
+def write_docx_resume(path: str, sections: int, table_rows: int = 4, seed: int = 0) -> str:
+    """Write a synthetic DOCX resume with paragraphs and layout tables using python-docx"""
+    import docx
+
+    rng = random.Random(seed)
+    document = docx.Document()
+    document.add_heading(f"Candidate {seed}", level=0)
+    document.add_paragraph(f"candidate{seed}@example.com | +1 555 010 {seed:04d}")
+    for _ in range(sections):
+        document.add_heading(rng.choice(SECTION_TITLES), level=1)
+        for _ in range(rng.randint(3, 6)):
+            document.add_paragraph(_sentence(rng), style="List Bullet")
+        if table_rows:
+            table = document.add_table(rows=table_rows, cols=3)
+            for row in table.rows:
+                row.cells[0].text = rng.choice(WORDS).capitalize()
+                row.cells[1].text = f"{rng.randint(2010, 2024)}"
+                row.cells[2].text = _sentence(rng)
+    document.save(path)
+    return path
+
+
+def build_docx_corpus(directory: str, section_counts: List[int], copies: int = 3) -> List[str]:
+    """Generate `copies` DOCX files for each section count and return their paths"""
+    os.makedirs(directory, exist_ok=True)
+    paths = []
+    for sections in section_counts:
+        for copy in range(copies):
+            path = os.path.join(directory, f"resume_{sections}s_{copy}.docx")
+            if not os.path.exists(path):
+                write_docx_resume(path, sections, seed=sections * 100 + copy)
+            paths.append(path)
+    return paths
+
+
+def write_txt_resume(path: str, size_kb: int, seed: int = 0) -> str:
+    """Write a plain-text resume of roughly `size_kb`"""
+    rng = random.Random(seed)
+    lines = [f"Candidate {seed}", f"candidate{seed}@example.com"]
+    size = 0
+    while size < size_kb * 1024:
+        lines.append(rng.choice(SECTION_TITLES))
+        for _ in range(rng.randint(3, 6)):
+            lines.append("- " + _sentence(rng))
+        size = sum(len(line) + 1 for line in lines)
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("\n".join(lines))
+    return path
+
+
+CORPUS_PROFILES = {
+    "quick": {"pdf_pages": [1, 5], "docx_sections": [3, 10], "txt_kb": [4], "copies": 3},
+    "full": {"pdf_pages": [1, 2, 3, 5, 10, 20, 40], "docx_sections": [3, 10, 30, 100],
+             "txt_kb": [4, 16, 64], "copies": 3},
+}
+
+
+def build_corpus(directory: str, profile: str = "full") -> List[Dict]:
+    """Generate a deterministic mixed-format corpus and return one entry per file.
+
+    Copies of each size vary font family, tables and embedded images so the
+    corpus covers both text-heavy and byte-heavy documents.
+    """
+    spec = CORPUS_PROFILES[profile]
+    os.makedirs(directory, exist_ok=True)
+    entries = []
+    for pages in spec["pdf_pages"]:
+        for copy in range(spec["copies"]):
+            path = os.path.join(directory, f"corpus_{pages}p_{copy}.pdf")
+            if not os.path.exists(path):
+                write_pdf_resume(path, pages, seed=pages * 100 + copy, font=copy, font_size=9 + copy,
+                                 table=copy % 2 == 1, image_kb=256 if copy == 2 else 0)
+            entries.append({"path": path, "format": "pdf", "pages": pages})
+    for sections in spec["docx_sections"]:
+        for copy in range(spec["copies"]):
+            path = os.path.join(directory, f"corpus_{sections}s_{copy}.docx")
+            if not os.path.exists(path):
+                write_docx_resume(path, sections, table_rows=0 if copy == 0 else 4, seed=sections * 100 + copy)
+            entries.append({"path": path, "format": "docx", "pages": 1})
+    for size_kb in spec["txt_kb"]:
+        for copy in range(spec["copies"]):
+            path = os.path.join(directory, f"corpus_{size_kb}kb_{copy}.txt")
+            if not os.path.exists(path):
+                write_txt_resume(path, size_kb, seed=size_kb * 100 + copy)
+            entries.append({"path": path, "format": "txt", "pages": 1})
+    return entries
@@ -0,0 +1,80 @@
+"""
+Compare the streaming DOCX reader with the python-docx object model.
+
+    python -m benchmarks.docx_extraction --sections 5 20 100 --copies 3 --repeat 3
+
+Both readers are pure Python, so tracemalloc peaks are a fair memory
+comparison. The characters column shows how much text each path recovers;
+python-docx skips table content.
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from typing import Callable, Dict, List
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from benchmarks.corpus import build_docx_corpus
+
+
+def _measure(name: str, reader: Callable, blobs: List[bytes], repeat: int) -> Dict:
+    from utils.document_source import open_document_source
+
+    def extract(blob):
+        with open_document_source(blob) as source:
+            return reader(source)
+
+    extract(blobs[0])
+    chars = 0
+    total_bytes = 0
+    tracemalloc.start()
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for blob in blobs:
+            chars += len(extract(blob))
+            total_bytes += len(blob)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {
+        "reader": name,
+        "files_per_sec": len(blobs) * repeat / elapsed if elapsed else 0.0,
+        "mb_per_sec": total_bytes / (1024 * 1024) / elapsed if elapsed else 0.0,
+        "peak_mb": peak / (1024 * 1024),
+        "chars_per_file": chars // (len(blobs) * repeat),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sections", type=int, nargs="+", default=[5, 20, 100])
+    parser.add_argument("--copies", type=int, default=3)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--corpus-dir", default=os.path.join(tempfile.gettempdir(), "resumefit_bench_docx"))
+    args = parser.parse_args(argv)
+
+    from utils.resume_processor import ResumeProcessor
+    processor = ResumeProcessor()
+
+    paths = build_docx_corpus(args.corpus_dir, args.sections, args.copies)
+    blobs = []
+    for path in paths:
+        with open(path, "rb") as f:
+            blobs.append(f.read())
+
+    print(f"Corpus: {len(paths)} DOCX files, repeat x{args.repeat}")
+    print(f"{'reader':<14}{'files/s':>10}{'MB/s':>9}{'peak MB':>10}{'chars/file':>12}")
+    for name, extract in (("streaming", processor._extract_from_docx),
+                          ("python-docx", processor._extract_from_docx_object_model)):
+        r = _measure(name, extract, blobs, args.repeat)
+        print(f"{r['reader']:<14}{r['files_per_sec']:>10.1f}{r['mb_per_sec']:>9.2f}"
+              f"{r['peak_mb']:>10.2f}{r['chars_per_file']:>12}")
+
+
+if __name__ == "__main__":
+    main()
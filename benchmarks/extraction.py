@@ -0,0 +1,184 @@
+"""
+Extraction benchmark suite for ResumeProcessor.extract_text.
+
+Generates a deterministic synthetic corpus (PDF, DOCX, TXT with varied page
+counts, fonts, tables and sizes), then reports pages/sec, MB/sec, p50/p95
+latency and peak RSS for every format and backend. Each backend runs in its
+own process so peak RSS is attributable.
+
+    python -m benchmarks.extraction --profile full --save-baseline baseline.json
+    python -m benchmarks.extraction --profile full --baseline baseline.json --threshold 0.15
+
+With --baseline the exit status is 1 when any throughput drops, or p95
+latency or peak RSS grows, by more than --threshold.
+"""
+import argparse
+import io
+import json
+import multiprocessing
+import os
+import resource
+import statistics
+import sys
+import tempfile
+import time
+from typing import Dict, List
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from benchmarks.corpus import CORPUS_PROFILES, build_corpus
+
+# (format, backend) pairs; DOCX and TXT have a single code path
+BACKENDS = [("pdf", "pymupdf"), ("pdf", "pypdf2"), ("docx", "default"), ("txt", "default")]
+
+# metric -> True when higher is better
+METRICS = {"pages_per_sec": True, "mb_per_sec": True, "p50_ms": False, "p95_ms": False, "peak_rss_mb": False}
+
+
+def _max_rss_mb() -> float:
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS reports bytes
+    return rss / (1024 * 1024) if sys.platform == "darwin" else rss / 1024
+
+
+def _percentile(values: List[float], pct: float) -> float:
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def _run_backend(file_format: str, backend: str, entries: List[Dict], repeat: int, queue):
+    from utils.extraction_cache import ExtractionCache
+    from utils.resume_processor import MIME_TYPES, ResumeProcessor
+
+    class NoCache(ExtractionCache):
+        """Measure extraction, not cache lookups"""
+
+        def get(self, key):
+            return None
+
+        def put(self, key, value):
+            pass
+
+    class Upload(io.BytesIO):
+        """Stand-in for Streamlit's UploadedFile"""
+
+        def __init__(self, data: bytes, file_type: str):
+            super().__init__(data)
+            self.type = file_type
+
+    processor = ResumeProcessor(
+        cache=NoCache(), pdf_engine=backend if file_format == "pdf" else None, parallel_min_pages=0
+    )
+    mime = MIME_TYPES[f".{file_format}"]
+    files = []
+    for entry in entries:
+        with open(entry["path"], "rb") as f:
+            files.append((f.read(), entry["pages"]))
+
+    processor.extract_text(Upload(files[0][0], mime))
+    latencies = []
+    pages = 0
+    total_bytes = 0
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for data, page_count in files:
+            file_start = time.perf_counter()
+            text = processor.extract_text(Upload(data, mime))
+            latencies.append((time.perf_counter() - file_start) * 1000)
+            if not text:
+                queue.put({"format": file_format, "backend": backend, "error": "extraction returned no text"})
+                return
+            pages += page_count
+            total_bytes += len(data)
+    elapsed = time.perf_counter() - start
+
+    queue.put({
+        "format": file_format,
+        "backend": backend,
+        "files": len(latencies),
+        "pages_per_sec": pages / elapsed,
+        "mb_per_sec": total_bytes / (1024 * 1024) / elapsed,
+        "p50_ms": statistics.median(latencies),
+        "p95_ms": _percentile(latencies, 95),
+        "peak_rss_mb": _max_rss_mb(),
+    })
+
+
+def run_suite(entries: List[Dict], repeat: int) -> List[Dict]:
+    ctx = multiprocessing.get_context("spawn")
+    results = []
+    for file_format, backend in BACKENDS:
+        subset = [e for e in entries if e["format"] == file_format]
+        if not subset:
+            continue
+        queue = ctx.Queue()
+        proc = ctx.Process(target=_run_backend, args=(file_format, backend, subset, repeat, queue))
+        proc.start()
+        results.append(queue.get())
+        proc.join()
+    return results
+
+
+def find_regressions(results: List[Dict], baseline: List[Dict], threshold: float) -> List[str]:
+    """Compare against a saved run; returns one message per metric past the threshold"""
+    previous = {(r["format"], r["backend"]): r for r in baseline if "error" not in r}
+    regressions = []
+    for result in results:
+        old = previous.get((result["format"], result["backend"]))
+        if old is None or "error" in result:
+            continue
+        for metric, higher_is_better in METRICS.items():
+            if not old.get(metric):
+                continue
+            change = (result[metric] - old[metric]) / old[metric]
+            if (-change if higher_is_better else change) > threshold:
+                regressions.append(
+                    f"{result['format']}/{result['backend']} {metric}: "
+                    f"{old[metric]:.2f} -> {result[metric]:.2f} ({change:+.0%})"
+                )
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--profile", choices=sorted(CORPUS_PROFILES), default="quick")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--corpus-dir", default=os.path.join(tempfile.gettempdir(), "resumefit_bench_corpus"))
+    parser.add_argument("--baseline", help="JSON results of a previous run to compare against")
+    parser.add_argument("--save-baseline", help="Write this run's results as JSON")
+    parser.add_argument("--threshold", type=float, default=0.2, help="Allowed relative regression (0.2 = 20%%)")
+    args = parser.parse_args(argv)
+
+    entries = build_corpus(args.corpus_dir, args.profile)
+    print(f"Corpus '{args.profile}': {len(entries)} files, repeat x{args.repeat}")
+    results = run_suite(entries, args.repeat)
+
+    print(f"{'format':<7}{'backend':<10}{'pages/s':>10}{'MB/s':>9}{'p50 ms':>9}{'p95 ms':>9}{'peak RSS MB':>13}")
+    failed = False
+    for r in results:
+        if "error" in r:
+            failed = True
+            print(f"{r['format']:<7}{r['backend']:<10}{r['error']}")
+            continue
+        print(f"{r['format']:<7}{r['backend']:<10}{r['pages_per_sec']:>10.1f}{r['mb_per_sec']:>9.2f}"
+              f"{r['p50_ms']:>9.2f}{r['p95_ms']:>9.2f}{r['peak_rss_mb']:>13.1f}")
+
+    if args.save_baseline:
+        with open(args.save_baseline, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+
+    if args.baseline:
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            regressions = find_regressions(results, json.load(f), args.threshold)
+        for message in regressions:
+            print(f"REGRESSION {message}")
+        failed = failed or bool(regressions)
+
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
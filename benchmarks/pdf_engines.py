@@ -0,0 +1,112 @@
+"""
+Compare PDF extraction engines on a synthetic multi-page resume corpus.
+
+    python -m benchmarks.pdf_engines --pages 1 2 5 10 20 --copies 3 --repeat 3
+
+Each engine runs in a fresh process so peak memory figures are not
+polluted by the other engine's allocations.
+"""
+import argparse
+import multiprocessing
+import os
+import resource
+import sys
+import tempfile
+import time
+import tracemalloc
+from typing import Dict, List
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from benchmarks.corpus import build_pdf_corpus
+
+
+def _max_rss_mb() -> float:
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS reports bytes
+    return rss / (1024 * 1024) if sys.platform == "darwin" else rss / 1024
+
+
+def _run_engine(engine_name: str, paths: List[str], repeat: int, queue):
+    from utils.document_source import open_document_source
+    from utils.resume_processor import PDF_ENGINES
+
+    def extract(blob):
+        with open_document_source(blob) as source:
+            return engine.extract_pages(source)
+
+    engine = PDF_ENGINES[engine_name]
+    if not engine.available():
+        queue.put({"engine": engine_name, "error": "not installed"})
+        return
+
+    blobs = []
+    for path in paths:
+        with open(path, "rb") as f:
+            blobs.append(f.read())
+
+    # Warm up imports and font caches before taking the memory baseline
+    extract(blobs[0])
+    rss_before = _max_rss_mb()
+    tracemalloc.start()
+
+    pages = 0
+    total_bytes = 0
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for blob in blobs:
+            pages += len(extract(blob))
+            total_bytes += len(blob)
+    elapsed = time.perf_counter() - start
+
+    _, py_peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    queue.put({
+        "engine": engine_name,
+        "pages": pages,
+        "seconds": elapsed,
+        "pages_per_sec": pages / elapsed if elapsed else 0.0,
+        "mb_per_sec": total_bytes / (1024 * 1024) / elapsed if elapsed else 0.0,
+        "peak_rss_mb": _max_rss_mb(),
+        "rss_growth_mb": _max_rss_mb() - rss_before,
+        "python_peak_mb": py_peak / (1024 * 1024),
+    })
+
+
+def benchmark(paths: List[str], engines: List[str], repeat: int) -> List[Dict]:
+    """Run each engine over the corpus in an isolated process"""
+    ctx = multiprocessing.get_context("spawn")
+    results = []
+    for engine_name in engines:
+        queue = ctx.Queue()
+        proc = ctx.Process(target=_run_engine, args=(engine_name, paths, repeat, queue))
+        proc.start()
+        results.append(queue.get())
+        proc.join()
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--pages", type=int, nargs="+", default=[1, 2, 5, 10, 20])
+    parser.add_argument("--copies", type=int, default=3)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--engines", nargs="+", default=["pymupdf", "pypdf2"])
+    parser.add_argument("--corpus-dir", default=os.path.join(tempfile.gettempdir(), "resumefit_bench_pdf"))
+    args = parser.parse_args(argv)
+
+    paths = build_pdf_corpus(args.corpus_dir, args.pages, args.copies)
+    print(f"Corpus: {len(paths)} PDFs, {sum(args.pages) * args.copies} pages, repeat x{args.repeat}")
+    print(f"{'engine':<10}{'pages/s':>10}{'MB/s':>9}{'peak RSS MB':>13}{'RSS +MB':>9}{'py peak MB':>12}")
+    for r in benchmark(paths, args.engines, args.repeat):
+        if "error" in r:
+            print(f"{r['engine']:<10}{r['error']}")
+            continue
+        print(f"{r['engine']:<10}{r['pages_per_sec']:>10.1f}{r['mb_per_sec']:>9.2f}"
+              f"{r['peak_rss_mb']:>13.1f}{r['rss_growth_mb']:>9.1f}{r['python_peak_mb']:>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""
+Time resume-to-role similarity scoring against large role catalogs.
+
+    python -m benchmarks.similarity --profiles 17 1000 5000 --resumes 50 --repeat 5
+
+Profiles are synthetic draws from the skills taxonomy. "one" scores a
+single resume against every profile with one matrix-vector product;
+"batch" scores all resumes with one matrix product.
+"""
+import argparse
+import os
+import random
+import sys
+import time
+from typing import Dict
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from benchmarks.skill_matching import build_texts
+
+
+def synthetic_profiles(count: int, seed: int = 0) -> Dict[str, Dict]:
+    from utils.skills_taxonomy import SKILLS_TAXONOMY
+
+    rng = random.Random(seed)
+    skills = sorted(SKILLS_TAXONOMY)
+    profiles = {}
+    for i in range(count):
+        picked = rng.sample(skills, 12)
+        profiles[f"role {i}"] = {
+            "titles": [f"{picked[0]} specialist"],
+            "required": picked[:6],
+            "preferred": picked[6:],
+            "keywords": ["delivery", "ownership"],
+            "years": rng.randint(0, 8),
+        }
+    return profiles
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--profiles", type=int, nargs="+", default=[17, 1000, 5000])
+    parser.add_argument("--resumes", type=int, default=50)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    import numpy as np
+    from utils.similarity import RoleIndex, resume_terms
+
+    texts = build_texts(4, args.resumes)
+    print(f"{'profiles':<10}{'build ms':>10}{'matrix MB':>11}{'one ms':>9}{'batch ms':>10}{'resumes/s':>11}")
+    for count in args.profiles:
+        start = time.perf_counter()
+        index = RoleIndex(synthetic_profiles(count))
+        build_ms = (time.perf_counter() - start) * 1000
+        vectors = np.stack([index.vectorize(resume_terms(text)) for text in texts])
+
+        start = time.perf_counter()
+        for _ in range(args.repeat):
+            index.score(vectors[0])
+        one_ms = (time.perf_counter() - start) * 1000 / args.repeat
+
+        start = time.perf_counter()
+        for _ in range(args.repeat):
+            index.score_batch(vectors)
+        batch_ms = (time.perf_counter() - start) * 1000 / args.repeat
+
+        print(f"{count:<10}{build_ms:>10.1f}{index.matrix.nbytes / (1024 * 1024):>11.1f}{one_ms:>9.2f}"
+              f"{batch_ms:>10.2f}{len(texts) / (batch_ms / 1000):>11.0f}")
+
+
+if __name__ == "__main__":
+    main()
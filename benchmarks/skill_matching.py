@@ -0,0 +1,135 @@
+"""
+Compare skill detection strategies on synthetic resume text.
+
+    python -m benchmarks.skill_matching --sizes 2 8 32 --copies 5 --repeat 5
+
+"per-skill regex" compiles one pattern per spelling and searches the text
+once per pattern; "alternation regex" joins every spelling into a single
+pattern; "aho-corasick" is the SkillMatcher automaton. The skills column
+compares each result with the automaton's. The per-skill loop cannot
+prefer the longest spelling, so it also reports "React" inside "React
+Native" and shows DIFF.
+"""
+import argparse
+import os
+import random
+import re
+import sys
+import time
+from typing import Callable, Dict, List
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from benchmarks.corpus import _sentence
+
+# Same boundaries as SkillMatcher: +, # and . continue a term (C++, C#, Node.js)
+_BEFORE = r"(?<![\w+#.])"
+_AFTER = r"(?![\w+#]|\.\w)"
+
+
+def _pattern(term: str, case_sensitive: set) -> str:
+    escaped = re.escape(term)
+    return escaped if term in case_sensitive else f"(?i:{escaped})"
+
+
+def build_per_skill_regex() -> Callable[[str], List[str]]:
+    from utils.skills_taxonomy import CASE_SENSITIVE_TERMS, skill_terms
+
+    patterns = [(re.compile(_BEFORE + _pattern(term, CASE_SENSITIVE_TERMS) + _AFTER), skill)
+                for term, skill in skill_terms().items()]
+
+    def find(text: str) -> List[str]:
+        first_seen = {}
+        for pattern, skill in patterns:
+            match = pattern.search(text)
+            if match and (skill not in first_seen or match.start() < first_seen[skill]):
+                first_seen[skill] = match.start()
+        return sorted(first_seen, key=first_seen.get)
+    return find
+
+
+def build_alternation_regex() -> Callable[[str], List[str]]:
+    from utils.skills_taxonomy import CASE_SENSITIVE_TERMS, skill_terms
+
+    terms = skill_terms()
+    lookup = {term.lower(): skill for term, skill in terms.items()}
+    alternatives = [_pattern(term, CASE_SENSITIVE_TERMS) for term in sorted(terms, key=len, reverse=True)]
+    pattern = re.compile(_BEFORE + "(?:" + "|".join(alternatives) + ")" + _AFTER)
+
+    def find(text: str) -> List[str]:
+        return list(dict.fromkeys(lookup[match.group(0).lower()] for match in pattern.finditer(text)))
+    return find
+
+
+def build_aho_corasick() -> Callable[[str], List[str]]:
+    from utils.skill_matcher import SkillMatcher
+    return SkillMatcher().find
+
+
+STRATEGIES = {
+    "per-skill regex": build_per_skill_regex,
+    "alternation regex": build_alternation_regex,
+    "aho-corasick": build_aho_corasick,
+}
+
+
+def build_texts(size_kb: int, copies: int) -> List[str]:
+    from utils.skills_taxonomy import skill_terms
+
+    terms = sorted(skill_terms())
+    texts = []
+    for seed in range(copies):
+        rng = random.Random(size_kb * 1000 + seed)
+        lines = []
+        while sum(len(line) + 1 for line in lines) < size_kb * 1024:
+            lines.append(_sentence(rng))
+            lines.append("Skills: " + ", ".join(rng.sample(terms, 6)))
+        texts.append("\n".join(lines))
+    return texts
+
+
+def _measure(find: Callable[[str], List[str]], texts: List[str], repeat: int) -> Dict:
+    latencies = []
+    for _ in range(repeat):
+        for text in texts:
+            start = time.perf_counter()
+            find(text)
+            latencies.append(time.perf_counter() - start)
+    latencies.sort()
+    total = sum(latencies)
+    return {
+        "texts_per_sec": len(latencies) / total if total else 0.0,
+        "p50_ms": latencies[len(latencies) // 2] * 1000,
+        "p95_ms": latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))] * 1000,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[2, 8, 32], help="Text sizes in KB")
+    parser.add_argument("--copies", type=int, default=5)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    finders = {}
+    print(f"{'strategy':<20}{'build ms':>10}")
+    for name, build in STRATEGIES.items():
+        start = time.perf_counter()
+        finders[name] = build()
+        print(f"{name:<20}{(time.perf_counter() - start) * 1000:>10.1f}")
+
+    print(f"\n{'size KB':<9}{'strategy':<20}{'texts/s':>10}{'p50 ms':>9}{'p95 ms':>9}{'skills':>8}")
+    for size_kb in args.sizes:
+        texts = build_texts(size_kb, args.copies)
+        reference = [finders["aho-corasick"](text) for text in texts]
+        for name, find in finders.items():
+            r = _measure(find, texts, args.repeat)
+            agrees = all(find(text) == expected for text, expected in zip(texts, reference))
+            print(f"{size_kb:<9}{name:<20}{r['texts_per_sec']:>10.1f}{r['p50_ms']:>9.2f}{r['p95_ms']:>9.2f}"
+                  f"{'same' if agrees else 'DIFF':>8}")
+
+
+if __name__ == "__main__":
+    main()
@@ -31,14 +31,14 @@ def import_backend_handlers():
         print("Warning: Backend utility classes not found. Using dummy classes for UI rendering.")
         
         class LLMHandler:
-            def analyze_resume_comprehensive(self, resume_text, job_role):
+            def analyze_resume_comprehensive(self, resume_text, job_role, **kwargs):
                 return {
                     'match_percentage': 88, 'overall_score': 8, 'found_skills': ['Python', 'Streamlit', 'UI/UX Design'],
                     'strengths': [{'title': 'Strong Experience', 'details': 'Great experience shown.'}],
                     'improvements': [{'title': 'Add Metrics', 'details': 'Quantify your achievements.'}],
                     'weak_sections': [], 'overview': 'This is a great resume.'
                 }
-            def chat_response(self, user_input, resume_text, job_role, history):
+            def chat_response(self, user_input, resume_text, job_role, history, **kwargs):
                 return f"This is a dummy AI response to: '{user_input}'"
         
         class ResumeProcessor:
@@ -0,0 +1,161 @@
+"""
+Headless batch analysis: many resumes against many job roles.
+
+Every (resume, role) pair is analysed with LLMHandler on a bounded thread
+pool. LLM calls already go through the shared per-provider rate limiter,
+so workers simply wait for capacity. Pairs with the same resume text and
+role are analysed once. Results stream out as they finish, in the same
+schema the UI shows.
+
+    python -m utils.bulk_ingest resumes/ -o resumes.jsonl
+    python -m utils.batch_analysis resumes.jsonl --roles "Data Scientist" "Backend Developer" -o analyses.jsonl
+"""
+import argparse
+import json
+import os
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Dict, Iterable, Iterator, List, Mapping, Optional, Tuple, Union
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from utils.extraction_cache import content_hash
+from utils.llm_handler import LLMHandler
+from utils.metrics import get_metrics
+from utils.resume_document import ResumeDocument
+
+DEFAULT_WORKERS = 4
+
+
+def _role_key(job_role: str) -> str:
+    return " ".join(job_role.lower().split())
+
+
+def _analyze(handler: LLMHandler, document: ResumeDocument, job_role: str, submitted: float,
+             parallel: bool) -> Tuple[Dict, float, float, Optional[str]]:
+    started = time.perf_counter()
+    try:
+        analysis, error = handler.analyze_resume_comprehensive(
+            document.text, job_role, resume_document=document, parallel=parallel), None
+    except Exception as e:
+        analysis, error = None, f"{type(e).__name__}: {e}"
+    finished = time.perf_counter()
+    return analysis, (started - submitted) * 1000, (finished - started) * 1000, error
+
+
+def analyze_batch(resumes: Mapping[str, Union[str, ResumeDocument]], roles: Iterable[str],
+                  workers: Optional[int] = None, handler: Optional[LLMHandler] = None,
+                  parallel: bool = False) -> Iterator[Dict]:
+    """Analyse every resume against every role, yielding records as they complete.
+
+    `resumes` maps a caller-chosen id to resume text or a ResumeDocument.
+    Each record has resume_id, job_role, analysis, queue_ms, analysis_ms,
+    error, degraded (True when the LLM failed and `analysis` is the local
+    fallback) and shared (True when the result was reused from an
+    identical pair). Records arrive in completion order, not input order.
+    """
+    workers = workers or int(os.environ.get("RESUMEFIT_BATCH_WORKERS", DEFAULT_WORKERS))
+    handler = handler or LLMHandler(interactive=False)
+    metrics = get_metrics()
+    roles = list(dict.fromkeys(role.strip() for role in roles if role.strip()))
+
+    # Identical resume text under different ids is analysed once per role
+    documents: Dict[str, ResumeDocument] = {}
+    requesters: Dict[Tuple[str, str], List[Tuple[str, str]]] = {}
+    for resume_id, resume in resumes.items():
+        document = resume if isinstance(resume, ResumeDocument) else ResumeDocument.from_text(resume)
+        text_hash = content_hash(document.text.encode("utf-8"))
+        documents.setdefault(text_hash, document)
+        for role in roles:
+            requesters.setdefault((text_hash, _role_key(role)), []).append((resume_id, role))
+    metrics.increment("llm.batch.pairs", sum(len(ids) for ids in requesters.values()))
+    metrics.increment("llm.batch.deduplicated", sum(len(ids) - 1 for ids in requesters.values()))
+
+    # Submit lazily so a large batch does not queue every analysis up front
+    max_in_flight = workers * 2
+    jobs = iter(requesters.items())
+    pending = {}
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="batch-analysis") as pool:
+        while True:
+            while len(pending) < max_in_flight:
+                job = next(jobs, None)
+                if job is None:
+                    break
+                (text_hash, _), ids = job
+                future = pool.submit(_analyze, handler, documents[text_hash], ids[0][1],
+                                     time.perf_counter(), parallel)
+                pending[future] = ids
+            if not pending:
+                break
+
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                ids = pending.pop(future)
+                analysis, queue_ms, analysis_ms, error = future.result()
+                # The handler falls back to the local analysis instead of raising
+                degraded = error is None and (analysis or {}).get("analysis_source") == "local"
+                metrics.observe("llm.batch.item_ms", analysis_ms)
+                metrics.increment("llm.batch.failed" if error or degraded else "llm.batch.completed")
+                for index, (resume_id, role) in enumerate(ids):
+                    yield {
+                        "resume_id": resume_id,
+                        "job_role": role,
+                        "analysis": analysis,
+                        "queue_ms": round(queue_ms, 2),
+                        "analysis_ms": round(analysis_ms, 2),
+                        "error": error,
+                        "degraded": degraded,
+                        "shared": index > 0,
+                    }
+
+
+def load_resumes(path: str) -> Dict[str, str]:
+    """Resume texts keyed by source from a bulk_ingest JSONL file, skipping failed records"""
+    resumes = {}
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except ValueError:
+                continue
+            if not record.get("error") and record.get("text"):
+                resumes[record["source"]] = record["text"]
+    return resumes
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("resumes", help="JSONL written by utils.bulk_ingest")
+    parser.add_argument("--roles", nargs="+", required=True, help="Target job roles")
+    parser.add_argument("-o", "--output", required=True, help="JSONL file to append analyses to")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--parallel", action="store_true", help="Split each analysis into concurrent sub-prompts")
+    args = parser.parse_args(argv)
+
+    resumes = load_resumes(args.resumes)
+    start = time.perf_counter()
+    completed = failed = degraded = 0
+    with open(args.output, "a", encoding="utf-8") as out:
+        for record in analyze_batch(resumes, args.roles, args.workers, parallel=args.parallel):
+            out.write(json.dumps(record, ensure_ascii=False) + "\n")
+            out.flush()
+            if record["error"]:
+                failed += 1
+            elif record["degraded"]:
+                degraded += 1
+            else:
+                completed += 1
+    seconds = time.perf_counter() - start
+    timing = get_metrics().timing("llm.batch.item_ms") or {}
+    print(f"Analysed {completed} pairs ({failed} failed, {degraded} local-only) from {len(resumes)} resumes"
+          f" in {seconds:.2f}s"
+          f" | p50 {timing.get('p50', 0):.0f} ms, p95 {timing.get('p95', 0):.0f} ms per analysis",
+          file=sys.stderr)
+    return 1 if failed or degraded else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,206 @@
+"""
+Headless bulk resume ingestion.
+
+Walks directories and .zip/.tar archives, extracts PDF/DOCX/TXT resumes
+concurrently with ResumeProcessor and appends one JSON record per file to
+a JSONL output. Files larger than the upload limit are skipped without
+being read. Re-running against the same output skips files whose content
+hash already has a record; pass --retry-failed to process failed ones again.
+
+    python -m utils.bulk_ingest resumes/ batch.zip -o resumes.jsonl --workers 8
+"""
+import argparse
+import json
+import multiprocessing
+import os
+import sys
+import tarfile
+import time
+import zipfile
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from typing import Dict, Iterator, Optional, Set, Tuple
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from utils.extraction_cache import content_hash
+from utils.preflight import DocumentRejected
+from utils.resume_processor import MIME_TYPES, ResumeProcessor
+
+ARCHIVE_SUFFIXES = (".zip", ".tar", ".tar.gz", ".tgz")
+
+
+def _mime_type(name: str) -> Optional[str]:
+    return MIME_TYPES.get(os.path.splitext(name)[1].lower())
+
+
+def iter_sources(paths, max_bytes: Optional[int] = None) -> Iterator[Tuple[str, Optional[bytes]]]:
+    """Yield (source name, file bytes) for every supported resume under `paths`.
+
+    Files and archive members larger than `max_bytes` are yielded with None
+    instead of their bytes, judged by their recorded size before reading.
+    """
+    def too_large(size: int) -> bool:
+        return max_bytes is not None and size > max_bytes
+
+    for path in paths:
+        if os.path.isdir(path):
+            for root, dirs, files in os.walk(path):
+                dirs.sort()
+                for name in sorted(files):
+                    yield from iter_sources([os.path.join(root, name)], max_bytes)
+        elif path.lower().endswith(".zip"):
+            with zipfile.ZipFile(path) as archive:
+                for info in archive.infolist():
+                    if not info.is_dir() and _mime_type(info.filename):
+                        source = f"{path}!{info.filename}"
+                        yield source, None if too_large(info.file_size) else archive.read(info)
+        elif path.lower().endswith(ARCHIVE_SUFFIXES):
+            with tarfile.open(path) as archive:
+                for member in archive:
+                    if member.isfile() and _mime_type(member.name):
+                        source = f"{path}!{member.name}"
+                        yield source, None if too_large(member.size) else archive.extractfile(member).read()
+        elif _mime_type(path):
+            if too_large(os.path.getsize(path)):
+                yield path, None
+                continue
+            with open(path, "rb") as f:
+                yield path, f.read()
+
+
+def load_processed_hashes(output_path: str, include_failed: bool = True) -> Set[str]:
+    """Collect hashes that already have a record from a previous run, optionally only successful ones"""
+    processed = set()
+    if not os.path.exists(output_path):
+        return processed
+    with open(output_path, "r", encoding="utf-8") as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except ValueError:
+                # A run killed mid-write can leave a partial last line
+                continue
+            if include_failed or not record.get("error"):
+                processed.add(record.get("sha256"))
+    return processed
+
+
+def process_file(source: str, data: bytes, file_hash: str, pdf_engine: Optional[str],
+                 max_chars: Optional[int]) -> Dict:
+    """Worker entry point: extract one file and build its JSONL record"""
+    record = {
+        "source": source,
+        "sha256": file_hash,
+        "file_type": _mime_type(source),
+        "size_bytes": len(data),
+        "text": "",
+        "page_count": None,
+        "pages_read": 0,
+        "truncated": False,
+        "error": None,
+        "rejection": None,
+    }
+    # Nested process pools inside workers would oversubscribe the machine
+    processor = ResumeProcessor(pdf_engine=pdf_engine, parallel_min_pages=0)
+    start = time.perf_counter()
+    try:
+        result = processor.extract(data, record["file_type"], max_chars=max_chars)
+        record.update(result)
+        if not record["text"]:
+            record["error"] = "no extractable text"
+    except DocumentRejected as e:
+        record["error"] = e.reason
+        record["rejection"] = e.code
+    except Exception as e:
+        record["error"] = f"{type(e).__name__}: {e}"
+    record["extract_ms"] = round((time.perf_counter() - start) * 1000, 2)
+    return record
+
+
+def ingest(paths, output_path: str, workers: int, pdf_engine: Optional[str] = None,
+           max_chars: Optional[int] = None, retry_failed: bool = False) -> Dict:
+    """Run the ingestion and return throughput statistics"""
+    processed = load_processed_hashes(output_path, include_failed=not retry_failed)
+    max_bytes = ResumeProcessor(pdf_engine=pdf_engine, parallel_min_pages=0).max_bytes
+    stats = {"processed": 0, "failed": 0, "skipped": 0, "too_large": 0, "pages": 0, "bytes": 0}
+    start = time.perf_counter()
+
+    # Keep a bounded number of files in flight so memory stays flat on huge trees
+    max_in_flight = workers * 4
+    pending = {}
+    ctx = multiprocessing.get_context("spawn")
+
+    with ProcessPoolExecutor(max_workers=workers, mp_context=ctx) as pool, \
+            open(output_path, "a", encoding="utf-8") as out:
+
+        def drain():
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                read_ms = pending.pop(future)
+                record = future.result()
+                record["read_ms"] = read_ms
+                out.write(json.dumps(record, ensure_ascii=False) + "\n")
+                out.flush()
+                if record["error"]:
+                    stats["failed"] += 1
+                else:
+                    stats["processed"] += 1
+                    stats["pages"] += record["page_count"] or record["pages_read"]
+                    stats["bytes"] += record["size_bytes"]
+
+        read_start = time.perf_counter()
+        for source, data in iter_sources(paths, max_bytes):
+            read_ms = round((time.perf_counter() - read_start) * 1000, 2)
+            if data is None:
+                stats["too_large"] += 1
+                print(f"Skipping {source}: larger than {max_bytes} bytes", file=sys.stderr)
+                read_start = time.perf_counter()
+                continue
+            file_hash = content_hash(data)
+            if file_hash in processed:
+                stats["skipped"] += 1
+            else:
+                processed.add(file_hash)
+                while len(pending) >= max_in_flight:
+                    drain()
+                future = pool.submit(process_file, source, data, file_hash, pdf_engine, max_chars)
+                pending[future] = read_ms
+            read_start = time.perf_counter()
+
+        while pending:
+            drain()
+
+    stats["seconds"] = time.perf_counter() - start
+    return stats
+
+
+def format_summary(stats: Dict) -> str:
+    seconds = stats["seconds"] or 1e-9
+    return (
+        f"Processed {stats['processed']} files ({stats['failed']} failed, {stats['skipped']} skipped, "
+        f"{stats['too_large']} too large) "
+        f"in {stats['seconds']:.2f}s | {stats['processed'] / seconds:.1f} files/s, "
+        f"{stats['pages'] / seconds:.1f} pages/s, {stats['bytes'] / (1024 * 1024) / seconds:.2f} MB/s"
+    )
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("paths", nargs="+", help="Resume files, directories or .zip/.tar archives")
+    parser.add_argument("-o", "--output", required=True, help="JSONL file to append records to")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--pdf-engine", choices=["pymupdf", "pypdf2"], default=None)
+    parser.add_argument("--max-chars", type=int, default=None, help="Stop extracting once this many characters are read")
+    parser.add_argument("--retry-failed", action="store_true", help="Process files whose earlier record is an error")
+    args = parser.parse_args(argv)
+
+    stats = ingest(args.paths, args.output, max(1, args.workers), args.pdf_engine, args.max_chars,
+                   args.retry_failed)
+    print(format_summary(stats), file=sys.stderr)
+    return 1 if stats["failed"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
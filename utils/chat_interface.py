@@ -31,15 +31,39 @@ def create_chat_interface():
     if send_button and user_input.strip():
         st.session_state.chat_history.append({"role": "user", "content": user_input.strip()})
         
-        with st.spinner("🤖 ResumeFit is thinking..."):
-            from utils.llm_handler import LLMHandler
-            llm_handler = LLMHandler()
-            response = llm_handler.chat_response(
-                user_input.strip(),
-                st.session_state.resume_text,
-                st.session_state.job_role,
-                st.session_state.chat_history[:-1]
-            )
-            st.session_state.chat_history.append({"role": "assistant", "content": response})
+        from utils.conversation_memory import ConversationMemory
+        from utils.llm_handler import LLMHandler
+        if st.session_state.get("conversation_memory") is None:
+            st.session_state.conversation_memory = ConversationMemory()
+        llm_handler = LLMHandler()
+        tokens = llm_handler.chat_response_stream(
+            user_input.strip(),
+            st.session_state.resume_text,
+            st.session_state.job_role,
+            st.session_state.chat_history[:-1],
+            resume_document=st.session_state.get("resume_document"),
+            memory=st.session_state.conversation_memory
+        )
+        
+        # Render the reply in place as tokens arrive instead of behind a spinner
+        status = "🤖 ResumeFit is thinking..."
+        queue = llm_handler.queue_status()
+        if queue["wait_seconds"] >= 1:
+            status = f"⏳ High demand: replying in about {queue['wait_seconds']:.0f}s..."
+        placeholder = st.empty()
+        placeholder.markdown(f"""
+        <div class="chat-message-assistant">
+            <strong>🤖 ResumeFit AI:</strong><br>{status}
+        </div>
+        """, unsafe_allow_html=True)
+        response = ""
+        for token in tokens:
+            response += token
+            placeholder.markdown(f"""
+            <div class="chat-message-assistant">
+                <strong>🤖 ResumeFit AI:</strong><br>{response}▌
+            </div>
+            """, unsafe_allow_html=True)
+        st.session_state.chat_history.append({"role": "assistant", "content": response.strip()})
         
         st.rerun()
@@ -0,0 +1,134 @@
+import re
+import threading
+from typing import Callable, Dict, List, Optional, Tuple
+
+from utils.tokens import estimate_tokens
+
+# Latest entries always sent verbatim (two user/assistant turns)
+RECENT_ENTRIES = 4
+# Older entries are folded into the summary this many at a time
+FOLD_BATCH = 4
+# Per-entry cap for the recent turns
+RECENT_ENTRY_CHARS = 400
+# Running summary cap
+SUMMARY_TOKENS = 200
+# Earlier turns brought back because they share words with the question
+RELEVANT_TURNS = 2
+RELEVANT_ENTRY_CHARS = 240
+
+_WORD_RE = re.compile(r"[a-z0-9+#]{3,}")
+_SENTENCE_END_RE = re.compile(r"(?<=[.!?])\s")
+_STOPWORDS = {"the", "and", "for", "you", "your", "with", "that", "this", "are", "what", "how", "can", "should",
+              "about", "have", "would", "could", "does", "from", "into", "more", "any", "was", "will", "which"}
+
+# Takes (previous summary, entries to fold in) and returns the new summary
+Summarizer = Callable[[str, List[Dict]], str]
+
+
+def _clip(text: str, limit: int) -> str:
+    text = " ".join(text.split())
+    return text if len(text) <= limit else text[:limit].rsplit(" ", 1)[0] + "…"
+
+
+def _format_entries(entries: List[Dict], limit: int) -> str:
+    return "\n".join(f"{entry.get('role', 'user')}: {_clip(entry.get('content', ''), limit)}" for entry in entries)
+
+
+def _keywords(text: str) -> set:
+    return {word for word in _WORD_RE.findall(text.lower()) if word not in _STOPWORDS}
+
+
+def extractive_summary(summary: str, entries: List[Dict]) -> str:
+    """Summarizer without the LLM: the opening sentence of each entry, oldest dropped first"""
+    lines = [line for line in summary.splitlines() if line]
+    for entry in entries:
+        first_sentence = _SENTENCE_END_RE.split(" ".join(entry.get("content", "").split()), 1)[0]
+        lines.append(f"{entry.get('role', 'user')}: {_clip(first_sentence, 160)}")
+    while len(lines) > 1 and estimate_tokens("\n".join(lines)) > SUMMARY_TOKENS:
+        lines.pop(0)
+    return "\n".join(lines)
+
+
+class ConversationMemory:
+    """Bounded chat context for one session.
+
+    Entries older than the recent window are folded, a batch at a time,
+    into a rolling summary capped at SUMMARY_TOKENS. The prompt then
+    carries the summary, up to RELEVANT_TURNS earlier turns that share
+    words with the new question, and the unsummarized recent entries. Its
+    size therefore stays flat however long the conversation runs.
+    """
+
+    def __init__(self):
+        self.summary = ""
+        # Number of leading history entries already folded into the summary
+        self.summarized = 0
+        # An LLM summary may be written back from a worker thread
+        self._lock = threading.Lock()
+
+    def _sync(self, history: List[Dict]):
+        if self.summarized > len(history):
+            # The history was cleared or replaced
+            self.summary, self.summarized = "", 0
+
+    def needs_update(self, history: List[Dict]) -> bool:
+        self._sync(history)
+        return len(history) - self.summarized >= RECENT_ENTRIES + FOLD_BATCH
+
+    def fold(self, history: List[Dict]) -> Optional[Tuple[str, List[Dict], int]]:
+        """Fold entries that have left the recent window into the summary, extractively.
+
+        Instant, so it can run right before a prompt is built. Returns the
+        arguments for `refine` (previous summary, folded entries, fold
+        point), or None when nothing was folded.
+        """
+        with self._lock:
+            if not self.needs_update(history):
+                return None
+            fold_until = len(history) - RECENT_ENTRIES
+            entries = history[self.summarized:fold_until]
+            previous = self.summary
+            self.summary = extractive_summary(previous, entries)
+            self.summarized = fold_until
+        return previous, entries, fold_until
+
+    def refine(self, previous: str, entries: List[Dict], fold_until: int, summarize: Summarizer):
+        """Replace a fold's extractive summary with `summarize`'s, unless the memory has moved on since"""
+        try:
+            summary = summarize(previous, entries)
+        except Exception:
+            return
+        if not summary or estimate_tokens(summary) > SUMMARY_TOKENS * 2:
+            return
+        with self._lock:
+            if self.summarized == fold_until:
+                self.summary = summary.strip()
+
+    def _relevant_turns(self, history: List[Dict], question: str) -> List[Dict]:
+        query = _keywords(question)
+        if not query:
+            return []
+        scored = []
+        older = history[:self.summarized]
+        for start in range(0, len(older), 2):
+            turn = older[start:start + 2]
+            overlap = len(query & _keywords(" ".join(entry.get("content", "") for entry in turn)))
+            if overlap:
+                scored.append((overlap, start, turn))
+        best = sorted(scored, key=lambda item: (-item[0], -item[1]))[:RELEVANT_TURNS]
+        return [entry for _, _, turn in sorted(best, key=lambda item: item[1]) for entry in turn]
+
+    def context(self, history: List[Dict], question: str) -> str:
+        """Conversation context for the next prompt"""
+        self._sync(history)
+        # Anything the summary has not caught up with yet stays verbatim
+        recent = history[self.summarized:][-(RECENT_ENTRIES + FOLD_BATCH):]
+        blocks = []
+        if self.summary:
+            blocks.append(f"Summary of earlier conversation:\n{self.summary}")
+        relevant = self._relevant_turns(history, question)
+        if relevant:
+            blocks.append(f"Earlier turns related to this question:\n{_format_entries(relevant, RELEVANT_ENTRY_CHARS)}")
+        if recent:
+            blocks.append(f"Latest turns:\n{_format_entries(recent, RECENT_ENTRY_CHARS)}")
+        return "\n\n".join(blocks) if blocks else "No previous messages"
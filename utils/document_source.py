@@ -0,0 +1,155 @@
+import io
+import logging
+import mmap
+import os
+import shutil
+import tempfile
+from contextlib import contextmanager
+from typing import Iterator, Optional
+
+logger = logging.getLogger(__name__)
+
+# Uploads larger than this are spooled to a temp file and memory-mapped
+DEFAULT_SPOOL_THRESHOLD = 2 * 1024 * 1024
+COPY_CHUNK_SIZE = 1024 * 1024
+
+
+class DocumentSource:
+    """Read-only view over a document's bytes shared by all extraction engines.
+
+    `view` is a memoryview over either the upload's own buffer or a
+    memory-mapped temp file, so engines that accept buffers read it without
+    copying. `open_stream()` returns a seekable file object over the same
+    bytes for engines that need one, and `path` is set when the bytes live
+    on disk.
+    """
+
+    def __init__(self, view: memoryview, stream, path: Optional[str] = None):
+        self.view = view
+        self.path = path
+        self._stream = stream
+
+    @property
+    def size(self) -> int:
+        return self.view.nbytes
+
+    def open_stream(self):
+        self._stream.seek(0)
+        return self._stream
+
+    def to_bytes(self) -> bytes:
+        """Copy the bytes out; only for consumers that cannot take a buffer"""
+        return self.view.tobytes()
+
+
+def _release(view: memoryview):
+    try:
+        view.release()
+    except BufferError:
+        # An engine still holds an export of the buffer; it is freed with that engine's document
+        logger.debug("Buffer still exported at release time")
+
+
+def _upload_size(upload) -> int:
+    if hasattr(upload, "getbuffer"):
+        with upload.getbuffer() as view:
+            return view.nbytes
+    upload.seek(0, os.SEEK_END)
+    size = upload.tell()
+    upload.seek(0)
+    return size
+
+
+@contextmanager
+def open_document_source(upload, spool_threshold: Optional[int] = None) -> Iterator[DocumentSource]:
+    """Wrap raw bytes or a binary upload in a DocumentSource.
+
+    Bytes and small uploads are exposed zero-copy through a memoryview of
+    their existing buffer. Uploads above `spool_threshold` are streamed to a
+    temp file in chunks and memory-mapped, so the engines page the data in
+    from the OS cache instead of holding further copies on the heap.
+    """
+    if spool_threshold is None:
+        spool_threshold = int(os.environ.get("RESUMEFIT_SPOOL_THRESHOLD_BYTES", DEFAULT_SPOOL_THRESHOLD))
+
+    if isinstance(upload, (bytes, bytearray, memoryview)):
+        view = memoryview(upload)
+        # BytesIO shares an immutable bytes object instead of copying it
+        stream = io.BytesIO(upload if isinstance(upload, bytes) else view)
+        try:
+            yield DocumentSource(view, stream)
+        finally:
+            _release(view)
+        return
+
+    if _upload_size(upload) <= spool_threshold:
+        if hasattr(upload, "getbuffer"):
+            view = upload.getbuffer()
+            stream = upload
+        else:
+            upload.seek(0)
+            data = upload.read()
+            view, stream = memoryview(data), io.BytesIO(data)
+        try:
+            yield DocumentSource(view, stream)
+        finally:
+            _release(view)
+            upload.seek(0)
+        return
+
+    spool = tempfile.NamedTemporaryFile(prefix="resumefit_", suffix=".upload", delete=False)
+    try:
+        upload.seek(0)
+        shutil.copyfileobj(upload, spool, COPY_CHUNK_SIZE)
+        spool.flush()
+        upload.seek(0)
+        with map_file(spool.name) as source:
+            yield source
+    finally:
+        spool.close()
+        try:
+            os.remove(spool.name)
+        except OSError as e:
+            logger.warning(f"Could not remove spooled upload {spool.name}: {e}")
+
+
+@contextmanager
+def map_file(path: str) -> Iterator[DocumentSource]:
+    """Memory-map a file on disk as a DocumentSource"""
+    with open(path, "rb") as f:
+        mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        view = memoryview(mapped)
+        try:
+            # Stream consumers (zipfile, PyPDF2) read through the file handle; buffer consumers use the map
+            yield DocumentSource(view, f, path=path)
+        finally:
+            _release(view)
+            try:
+                mapped.close()
+            except BufferError:
+                # An engine still holds a buffer export; the map is freed with it
+                logger.warning(f"Memory map of {path} still referenced; leaving it to the garbage collector")
+
+
+@contextmanager
+def source_path(source: DocumentSource) -> Iterator[str]:
+    """A file path holding the source's bytes, for handing the document to worker processes.
+
+    Spooled sources already live on disk; in-memory ones are written to a
+    temp file once, so every worker maps the same file instead of
+    receiving its own pickled copy of the bytes.
+    """
+    if source.path:
+        yield source.path
+        return
+    spool = tempfile.NamedTemporaryFile(prefix="resumefit_", suffix=".upload", delete=False)
+    try:
+        spool.write(source.view)
+        spool.close()
+        yield spool.name
+    finally:
+        spool.close()
+        try:
+            os.remove(spool.name)
+        except OSError as e:
+            logger.warning(f"Could not remove spooled upload {spool.name}: {e}")
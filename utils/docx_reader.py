@@ -0,0 +1,96 @@
+import zipfile
+from typing import Iterator, List
+from xml.etree import ElementTree as ET
+
+W_NS = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+MC_NS = "{http://schemas.openxmlformats.org/markup-compatibility/2006}"
+
+_P = W_NS + "p"
+_T = W_NS + "t"
+_TAB = W_NS + "tab"
+_BREAKS = (W_NS + "br", W_NS + "cr")
+_TR = W_NS + "tr"
+_TC = W_NS + "tc"
+_BODY = W_NS + "body"
+_FALLBACK = MC_NS + "Fallback"
+
+
+def iter_docx_blocks(stream) -> Iterator[str]:
+    """Stream paragraphs and table rows from a DOCX file in document order.
+
+    Reads word/document.xml incrementally and discards each top-level block
+    once emitted, so memory stays bounded by the largest paragraph or table
+    rather than the whole document. Table rows are emitted as cells joined
+    with " | ".
+    """
+    with zipfile.ZipFile(stream) as archive:
+        with archive.open("word/document.xml") as xml:
+            yield from _iter_blocks(xml)
+
+
+def _iter_blocks(xml) -> Iterator[str]:
+    body = None
+    depth = 0
+    body_depth = None
+    # Stacks handle text boxes inside paragraphs and tables nested in cells
+    paragraph_parts: List[List[str]] = []
+    row_cells: List[List[str]] = []
+    cell_blocks: List[List[str]] = []
+    # mc:Fallback repeats the content of mc:Choice for old readers
+    fallback_depth = 0
+
+    for event, elem in ET.iterparse(xml, events=("start", "end")):
+        tag = elem.tag
+        if event == "start":
+            depth += 1
+            if tag == _BODY:
+                body, body_depth = elem, depth
+            elif tag == _FALLBACK:
+                fallback_depth += 1
+            elif fallback_depth:
+                continue
+            elif tag == _P:
+                paragraph_parts.append([])
+            elif tag == _TR:
+                row_cells.append([])
+            elif tag == _TC:
+                cell_blocks.append([])
+            continue
+
+        depth -= 1
+        if tag == _FALLBACK:
+            fallback_depth -= 1
+        elif fallback_depth:
+            pass
+        elif tag == _T and paragraph_parts:
+            paragraph_parts[-1].append(elem.text or "")
+        elif tag == _TAB and paragraph_parts:
+            paragraph_parts[-1].append("\t")
+        elif tag in _BREAKS and paragraph_parts:
+            paragraph_parts[-1].append("\n")
+        elif tag == _P and paragraph_parts:
+            text = "".join(paragraph_parts.pop())
+            if cell_blocks:
+                cell_blocks[-1].append(text)
+            else:
+                # Text box paragraphs are emitted just before their host paragraph
+                yield text
+        elif tag == _TC and cell_blocks:
+            cell_text = " ".join(block for block in cell_blocks.pop() if block.strip())
+            if row_cells:
+                row_cells[-1].append(cell_text)
+        elif tag == _TR and row_cells:
+            row_text = " | ".join(cell for cell in row_cells.pop() if cell)
+            if cell_blocks:
+                cell_blocks[-1].append(row_text)
+            elif row_text:
+                yield row_text
+
+        # Drop finished top-level blocks so the parsed tree never grows
+        if body is not None and depth == body_depth:
+            body.clear()
+
+
+def extract_docx_text(stream) -> str:
+    """Return the text of a DOCX file, including table cells"""
+    return "\n".join(iter_docx_blocks(stream)).strip()
@@ -0,0 +1,79 @@
+import logging
+import os
+import threading
+from typing import Iterable, Optional, Set
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+logger = logging.getLogger(__name__)
+
+# Distinct hosts kept in the pool, and open connections kept per host. Every
+# Streamlit session runs in its own thread, so the per-host size bounds how
+# many LLM calls can be in flight before a caller waits for a free connection.
+DEFAULT_POOL_HOSTS = 4
+DEFAULT_POOL_SIZE = 16
+
+# (connect, read) seconds
+DEFAULT_TIMEOUT = (5, 30)
+PRECONNECT_TIMEOUT = 5
+
+_session: Optional[requests.Session] = None
+_session_lock = threading.Lock()
+_preconnected: Set[str] = set()
+
+
+def _origin(url: str) -> str:
+    parts = urlsplit(url)
+    return f"{parts.scheme}://{parts.netloc}"
+
+
+def get_http_session() -> requests.Session:
+    """Return the keep-alive session shared by every handler and Streamlit session.
+
+    Reusing it means DNS resolution, the TCP connection and the TLS
+    handshake are paid once per host instead of once per request.
+    """
+    global _session
+    with _session_lock:
+        if _session is None:
+            pool_size = int(os.environ.get("RESUMEFIT_HTTP_POOL_SIZE", DEFAULT_POOL_SIZE))
+            # Only retry failures to connect: a POST that reached the server is not replayed
+            retries = Retry(total=2, connect=2, read=0, redirect=0, status=0)
+            adapter = HTTPAdapter(
+                pool_connections=DEFAULT_POOL_HOSTS,
+                pool_maxsize=max(1, pool_size),
+                max_retries=retries,
+                pool_block=False,
+            )
+            session = requests.Session()
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            _session = session
+        return _session
+
+
+def preconnect(urls: Iterable[str]):
+    """Open a pooled connection to each host in the background.
+
+    Runs once per host per process, so the first real request finds a warm
+    TLS connection. Failures are ignored; the request path connects itself.
+    """
+    with _session_lock:
+        origins = [origin for origin in dict.fromkeys(_origin(url) for url in urls if url)
+                   if origin not in _preconnected]
+        _preconnected.update(origins)
+    if not origins:
+        return
+
+    def warm():
+        session = get_http_session()
+        for origin in origins:
+            try:
+                session.head(origin, timeout=PRECONNECT_TIMEOUT)
+            except requests.RequestException as e:
+                logger.debug(f"Pre-connect to {origin} failed: {e}")
+
+    threading.Thread(target=warm, name="resumefit-preconnect", daemon=True).start()
@@ -1,9 +1,61 @@
 import json
+import logging
+import os
+import threading
 import time
 import streamlit as st
-import requests
-from typing import Dict, List, Tuple
+from typing import Dict, Iterator, List, Optional, Tuple
 import re
+from concurrent.futures import ThreadPoolExecutor
+
+from utils.conversation_memory import ConversationMemory
+from utils.http_client import DEFAULT_TIMEOUT, get_http_session, preconnect
+from utils.local_analyzer import analyze_resume_locally, merge_analyses
+from utils.metrics import get_metrics
+from utils.prompt_packer import CHAT_PRIORITY, pack_resume
+from utils.provider_router import get_provider_router
+from utils.rate_limiter import call_with_retries, get_rate_limiter
+from utils.response_cache import ResponseCache, get_response_cache
+from utils.resume_document import ResumeDocument
+from utils.resume_index import get_resume_index
+from utils.role_store import format_profile, get_role_store
+from utils.single_flight import get_single_flight
+from utils.tokens import estimate_tokens
+
+logger = logging.getLogger(__name__)
+
+# Streamlit message kinds and the log level they map to when running headless
+_NOTIFY_LEVELS = {"info": logging.INFO, "success": logging.INFO, "warning": logging.WARNING, "error": logging.ERROR}
+
+
+_summary_pool: Optional[ThreadPoolExecutor] = None
+_summary_pool_lock = threading.Lock()
+
+
+def _get_summary_pool() -> ThreadPoolExecutor:
+    """Threads that rewrite chat summaries with the LLM, shared by every session"""
+    global _summary_pool
+    with _summary_pool_lock:
+        if _summary_pool is None:
+            _summary_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="chat-summary")
+        return _summary_pool
+
+
+def _usage_tokens(body: Dict) -> Optional[int]:
+    """Total tokens a provider reports for a response or final stream chunk (Groq nests it under x_groq)"""
+    usage = body.get("usage") or (body.get("x_groq") or {}).get("usage") or {}
+    total = usage.get("total_tokens")
+    return total if isinstance(total, int) else None
+
+
+def _get_secret(name: str) -> Optional[str]:
+    """Read an API key from Streamlit secrets, falling back to the environment"""
+    try:
+        value = st.secrets.get(name)
+    except Exception:
+        # No secrets.toml, e.g. when run headless
+        value = None
+    return value or os.environ.get(name)
 
 
 class LLMHandler:
@@ -11,26 +63,106 @@ class LLMHandler:
     Real-time AI-powered resume analysis with dynamic responses
     """
     
-    def __init__(self):
+    # Independent slices of the analysis schema for parallel mode: each is
+    # requested concurrently with its own output budget and merged back
+    ANALYSIS_PARTS = {
+        "overview": {
+            "max_tokens": 400,
+            "fields": ["match_percentage", "overall_score", "summary"],
+            "schema": '''    "match_percentage": [calculate based on role alignment, skills match, experience relevance],
+    "overall_score": [1-100 rating based on resume quality and role fit],
+    "summary": "[3-4 sentence personalized summary highlighting key strengths and areas for improvement specific to this resume and role]"''',
+        },
+        "assessment": {
+            "max_tokens": 700,
+            "fields": ["strengths", "weaknesses", "weak_sections", "suggestions"],
+            "schema": '''    "strengths": ["[Specific strength based on actual resume content]", "[3-4 strengths in total]"],
+    "weaknesses": ["[Specific weakness or gap identified in the resume]", "[2-3 weaknesses in total]"],
+    "weak_sections": ["[Specific resume sections that need improvement]"],
+    "suggestions": ["[Actionable improvement suggestion based on analysis]", "[3 suggestions in total]"]''',
+        },
+        "skills": {
+            "max_tokens": 500,
+            "fields": ["found_skills", "missing_skills", "suggested_keywords"],
+            "schema": '''    "found_skills": ["[List actual skills mentioned in the resume]"],
+    "missing_skills": ["[Skills needed for {job_role} but not found in resume]"],
+    "suggested_keywords": ["[Industry-specific keywords for {job_role}]"]''',
+        },
+        "ats": {
+            "max_tokens": 400,
+            "fields": ["ats_compatibility"],
+            "schema": '''    "ats_compatibility": {
+        "score": [1-100 ATS friendliness score],
+        "issues": ["[Specific ATS issues found]"],
+        "recommendations": ["[Specific ATS improvements needed]"]
+    }''',
+        },
+    }
+    
+    # Overall time allowed for one completion, including failover and hedging
+    REQUEST_DEADLINE = 45
+    
+    # Approximate resume tokens packed into each prompt
+    ANALYSIS_RESUME_TOKENS = 1500
+    CHAT_RESUME_TOKENS = 300
+    # Resume chunks retrieved for each chat question
+    CHAT_RESUME_CHUNKS = 4
+    
+    def __init__(self, response_cache: Optional[ResponseCache] = None, interactive: bool = True):
         # Use multiple AI providers for reliability
         self.ai_providers = {
             'groq': {
                 'url': 'https://api.groq.com/openai/v1/chat/completions',
                 'model': 'llama3-8b-8192',
-                'key': st.secrets["GROQ_API_KEY"]
+                'key': _get_secret("GROQ_API_KEY")
             },
             'together': {
                 'url': 'https://api.together.xyz/v1/chat/completions',
                 'model': 'meta-llama/Llama-3-8b-chat-hf',
-                'key': None  # Add your Together AI key if available
+                'key': _get_secret("TOGETHER_API_KEY")
             }
         }
+        # Preferred provider until the router has latency data
         self.current_provider = 'groq'
+        self.temperature = 0.7
+        self.response_cache = response_cache if response_cache is not None else get_response_cache()
+        self.router = get_provider_router()
+        self.rate_limiter = get_rate_limiter()
+        self.single_flight = get_single_flight()
+        self.role_store = get_role_store()
+        self.hedge = os.environ.get("RESUMEFIT_LLM_HEDGE", "").lower() in ("1", "true", "yes")
+        # Batch and CLI callers have no Streamlit page; their messages go to the log instead
+        self.interactive = interactive
+        # Handlers are rebuilt on every rerun; only the first one per process actually connects
+        preconnect(provider['url'] for provider in self.ai_providers.values() if provider['key'])
     
-    def _make_ai_request(self, prompt: str, max_tokens: int = 1500) -> str:
-        """Make real-time AI request for dynamic analysis"""
-        provider = self.ai_providers[self.current_provider]
-        
+    def _notify(self, kind: str, message: str):
+        """Show a status message in the page, or log it when not interactive"""
+        if self.interactive:
+            getattr(st, kind)(message)
+        else:
+            logger.log(_NOTIFY_LEVELS[kind], message)
+    
+    def _provider_names(self) -> List[str]:
+        """Providers with an API key, preferred one first"""
+        names = [name for name, provider in self.ai_providers.items() if provider['key']]
+        return sorted(names, key=lambda name: name != self.current_provider)
+    
+    def _cache_key(self, provider_name: str, prompt: str, max_tokens: int) -> str:
+        return self.response_cache.make_key(
+            provider_name, self.ai_providers[provider_name]['model'], prompt, self.temperature, max_tokens
+        )
+    
+    def _cached_response(self, names: List[str], prompt: str, max_tokens: int) -> Optional[str]:
+        """A cached answer from any of the providers"""
+        for name in names:
+            cached = self.response_cache.get(self._cache_key(name, prompt, max_tokens))
+            if cached is not None:
+                return cached
+        return None
+    
+    def _request_body(self, provider_name: str, prompt: str, max_tokens: int, stream: bool = False) -> Tuple[Dict, Dict]:
+        provider = self.ai_providers[provider_name]
         headers = {
             "Authorization": f"Bearer {provider['key']}",
             "Content-Type": "application/json"
@@ -41,24 +173,175 @@ class LLMHandler:
             "messages": [
                 {"role": "user", "content": prompt}
             ],
-            "temperature": 0.7,
+            "temperature": self.temperature,
             "max_tokens": max_tokens
         }
-        
+        if stream:
+            headers["Accept"] = "text/event-stream"
+            payload["stream"] = True
+        return headers, payload
+    
+    def queue_status(self) -> Dict[str, float]:
+        """Local rate-limit queue of the provider a new request would go to, for wait estimates"""
+        names = self.router.ranked(self._provider_names())
+        if not names:
+            return {"queue_depth": 0, "wait_seconds": 0.0}
+        return self.rate_limiter.limiter_for(names[0]).status()
+    
+    def _make_ai_request(self, prompt: str, max_tokens: int = 1500, use_cache: bool = True) -> str:
+        """Make real-time AI request for dynamic analysis, reporting failures in the UI"""
         try:
-            response = requests.post(provider['url'], headers=headers, json=payload, timeout=30)
-            response.raise_for_status()
-            result = response.json()
-            
-            if "choices" in result and len(result["choices"]) > 0:
-                return result["choices"][0]["message"]["content"]
-            else:
-                raise Exception("Invalid API response structure")
-                
+            return self._request_completion(prompt, max_tokens, use_cache)
         except Exception as e:
-            st.error(f"AI request failed: {str(e)}")
+            self._notify("error", f"AI request failed: {str(e)}")
             raise e
     
+    def _request_completion(self, prompt: str, max_tokens: int = 1500, use_cache: bool = True) -> str:
+        """Completion request without any Streamlit calls, safe from worker threads.
+
+        Repeats are answered from the response cache. Otherwise the provider
+        router picks the provider, failing over (and hedging when enabled)
+        within REQUEST_DEADLINE; raises when every provider fails.
+        Identical requests already in flight from any session are joined
+        instead of being sent again.
+        """
+        names = self._provider_names()
+        if use_cache:
+            cached = self._cached_response(names, prompt, max_tokens)
+            if cached is not None:
+                return cached
+        
+        def attempt(provider_name: str, timeout: float) -> str:
+            content = self._post_completion(provider_name, prompt, max_tokens, timeout)
+            self.response_cache.put(self._cache_key(provider_name, prompt, max_tokens), content)
+            return content
+        
+        fingerprint = self.response_cache.make_key(",".join(names), "", prompt, self.temperature, max_tokens)
+        return self.single_flight.do(
+            fingerprint, lambda: self.router.call(attempt, names, self.REQUEST_DEADLINE, hedge=self.hedge)
+        )
+    
+    def _post_completion(self, provider_name: str, prompt: str, max_tokens: int, timeout: float) -> str:
+        """One completion from one provider, paced by its rate limiter and retried on 429/5xx"""
+        limiter = self.rate_limiter.limiter_for(provider_name)
+        reserved = estimate_tokens(prompt) + max_tokens
+        content, used = call_with_retries(
+            limiter,
+            reserved,
+            lambda remaining: self._send_completion(provider_name, prompt, max_tokens, remaining),
+            timeout,
+        )
+        limiter.reconcile(reserved, used or estimate_tokens(prompt) + estimate_tokens(content))
+        return content
+    
+    def _send_completion(self, provider_name: str, prompt: str, max_tokens: int,
+                         timeout: float) -> Tuple[str, Optional[int]]:
+        """A single HTTP completion request; returns the content and the total tokens the provider reports"""
+        headers, payload = self._request_body(provider_name, prompt, max_tokens)
+        read_timeout = max(1.0, min(DEFAULT_TIMEOUT[1], timeout))
+        response = get_http_session().post(self.ai_providers[provider_name]['url'], headers=headers, json=payload,
+                                           timeout=(DEFAULT_TIMEOUT[0], read_timeout))
+        response.raise_for_status()
+        result = response.json()
+        
+        if "choices" in result and len(result["choices"]) > 0:
+            return result["choices"][0]["message"]["content"], _usage_tokens(result)
+        else:
+            raise Exception("Invalid API response structure")
+    
+    def _stream_ai_request(self, prompt: str, max_tokens: int = 1500) -> Iterator[str]:
+        """Yield completion text as the provider streams it over server-sent events.
+
+        A cached response is yielded whole. Providers are tried in router
+        order until one produces a first token; a stream that breaks after
+        that is not retried, since its tokens are already on screen.
+        """
+        names = self._provider_names()
+        cached = self._cached_response(names, prompt, max_tokens)
+        if cached is not None:
+            yield cached
+            return
+        
+        last_error = RuntimeError("No LLM provider is configured")
+        for provider_name in self.router.ranked(names):
+            started = False
+            start = time.perf_counter()
+            try:
+                for token in self._stream_from_provider(provider_name, prompt, max_tokens):
+                    started = True
+                    yield token
+                self.router.record_success(provider_name, (time.perf_counter() - start) * 1000)
+                return
+            except Exception as e:
+                self.router.record_failure(provider_name, e)
+                last_error = e
+                if started:
+                    break
+                get_metrics().increment(f"llm.router.failover.{provider_name}")
+        self._notify("error", f"AI request failed: {str(last_error)}")
+        raise last_error
+    
+    def _stream_from_provider(self, provider_name: str, prompt: str, max_tokens: int) -> Iterator[str]:
+        """Stream one provider's completion, recording time to first token.
+
+        Opening the stream is paced and retried on 429/5xx like any other
+        completion; nothing is retried once the body starts arriving.
+        """
+        limiter = self.rate_limiter.limiter_for(provider_name)
+        metrics = get_metrics()
+        start = time.perf_counter()
+        parts = []
+        completed = False
+        reserved = estimate_tokens(prompt) + max_tokens
+        response = None
+        used = None
+        try:
+            response = call_with_retries(
+                limiter,
+                reserved,
+                lambda remaining: self._open_stream(provider_name, prompt, max_tokens, remaining),
+                self.REQUEST_DEADLINE,
+            )
+            with response:
+                for line in response.iter_lines():
+                    if not line.startswith(b"data:"):
+                        continue
+                    data = line[5:].strip()
+                    if data == b"[DONE]":
+                        completed = True
+                        break
+                    chunk = json.loads(data)
+                    used = _usage_tokens(chunk) or used
+                    choices = chunk.get("choices") or [{}]
+                    token = (choices[0].get("delta") or {}).get("content")
+                    if not token:
+                        continue
+                    if not parts:
+                        metrics.observe(f"llm.{provider_name}.ttft_ms", (time.perf_counter() - start) * 1000)
+                    parts.append(token)
+                    yield token
+        finally:
+            metrics.observe(f"llm.{provider_name}.stream_ms", (time.perf_counter() - start) * 1000)
+            if response is not None:
+                limiter.reconcile(reserved, used or estimate_tokens(prompt) + estimate_tokens("".join(parts)))
+        
+        # A stream cut off before [DONE] is not cached
+        if completed and parts:
+            self.response_cache.put(self._cache_key(provider_name, prompt, max_tokens), "".join(parts))
+    
+    def _open_stream(self, provider_name: str, prompt: str, max_tokens: int, timeout: float):
+        """Start a streaming completion request, returning the response once its status is OK"""
+        headers, payload = self._request_body(provider_name, prompt, max_tokens, stream=True)
+        read_timeout = max(1.0, min(DEFAULT_TIMEOUT[1], timeout))
+        response = get_http_session().post(self.ai_providers[provider_name]['url'], headers=headers, json=payload,
+                                           timeout=(DEFAULT_TIMEOUT[0], read_timeout), stream=True)
+        try:
+            response.raise_for_status()
+        except Exception:
+            response.close()
+            raise
+        return response
+    
     def analyze_resume_comprehensive(self, resume_text: str, job_role: str, **kwargs) -> Dict:
         """
         Real-time AI analysis - completely dynamic based on actual resume content
@@ -67,15 +350,27 @@ class LLMHandler:
         if not resume_text or not job_role:
             return self._get_emergency_fallback()
         
+        document = self._get_document(resume_text, kwargs.get("resume_document"))
+        profile = self.get_role_profile(job_role)
+        
+        parallel = kwargs.get("parallel")
+        if parallel is None:
+            parallel = os.environ.get("RESUMEFIT_PARALLEL_ANALYSIS", "").lower() in ("1", "true", "yes")
+        if parallel:
+            return self._analyze_in_parts(resume_text, job_role, document, profile)
+        
         # Create comprehensive analysis prompt
         analysis_prompt = f"""
 As an expert career advisor and ATS specialist, perform a comprehensive analysis of this resume for the "{job_role}" position.
 
 RESUME CONTENT:
-{resume_text[:6000]}
+{pack_resume(document, self.ANALYSIS_RESUME_TOKENS)}
 
 TARGET ROLE: {job_role}
 
+ROLE REQUIREMENTS:
+{format_profile(profile)}
+
 Provide a detailed JSON analysis with the following structure:
 {{
     "match_percentage": [calculate based on role alignment, skills match, experience relevance],
@@ -128,7 +423,7 @@ Respond with ONLY the JSON object, no additional text.
 """
 
         try:
-            st.info("🤖 AI is performing real-time analysis of your resume...")
+            self._notify("info", "🤖 AI is performing real-time analysis of your resume...")
             
             # Get AI analysis
             ai_response = self._make_ai_request(analysis_prompt, max_tokens=2000)
@@ -138,17 +433,115 @@ Respond with ONLY the JSON object, no additional text.
             analysis_data = json.loads(cleaned_response)
             
             # Validate and enhance the response
-            analysis_data = self._validate_and_enhance_analysis(analysis_data, resume_text, job_role)
+            analysis_data = self._validate_and_enhance_analysis(analysis_data, resume_text, job_role, document, profile)
             
-            st.success("✅ Real-time AI analysis completed!")
+            self._notify("success", "✅ Real-time AI analysis completed!")
             return analysis_data
             
         except json.JSONDecodeError as e:
-            st.warning("⚠️ AI response parsing issue, generating enhanced analysis...")
-            return self._generate_enhanced_fallback(resume_text, job_role, ai_response if 'ai_response' in locals() else "")
+            self._notify("warning", "⚠️ AI response parsing issue, generating enhanced analysis...")
+            return self._generate_enhanced_fallback(resume_text, job_role, ai_response if 'ai_response' in locals() else "",
+                                                    document, profile)
         except Exception as e:
-            st.error(f"❌ Real-time analysis failed: {str(e)}")
-            return self._generate_enhanced_fallback(resume_text, job_role)
+            self._notify("error", f"❌ Real-time analysis failed: {str(e)}")
+            return self._generate_enhanced_fallback(resume_text, job_role, document=document, profile=profile)
+    
+    def _analyze_in_parts(self, resume_text: str, job_role: str, document: ResumeDocument, profile: Dict) -> Dict:
+        """Run the ANALYSIS_PARTS prompts concurrently and merge them into the full schema.
+
+        A part that fails or returns unparseable JSON is filled from the
+        local analysis without affecting the others.
+        """
+        self._notify("info", "🤖 AI is performing real-time analysis of your resume...")
+        
+        # Worker threads have no Streamlit context, so they only use _request_completion
+        with ThreadPoolExecutor(max_workers=len(self.ANALYSIS_PARTS)) as pool:
+            futures = {
+                name: pool.submit(self._request_analysis_part, name, document, job_role, profile)
+                for name in self.ANALYSIS_PARTS
+            }
+        
+        analysis_data = {}
+        failed_parts = []
+        for name, future in futures.items():
+            fields = self.ANALYSIS_PARTS[name]["fields"]
+            try:
+                part = future.result()
+                analysis_data.update({field: part[field] for field in fields if field in part})
+            except Exception:
+                failed_parts.append(name)
+                get_metrics().increment(f"llm.analysis.{name}.failed")
+        
+        # Fields of failed parts are filled from the local analysis
+        analysis_data = self._validate_and_enhance_analysis(analysis_data, resume_text, job_role, document, profile)
+        if len(failed_parts) == len(self.ANALYSIS_PARTS):
+            self._notify("error", "❌ Real-time analysis failed, showing an offline analysis instead")
+        elif failed_parts:
+            self._notify("warning", f"⚠️ Some analysis parts used offline results: {', '.join(failed_parts)}")
+        else:
+            self._notify("success", "✅ Real-time AI analysis completed!")
+        return analysis_data
+    
+    def _request_analysis_part(self, name: str, document: ResumeDocument, job_role: str, profile: Dict) -> Dict:
+        """Request and parse one slice of the analysis; raises on any failure"""
+        part = self.ANALYSIS_PARTS[name]
+        schema = part["schema"].replace("{job_role}", job_role)
+        prompt = f"""
+As an expert career advisor and ATS specialist, analyze this resume for the "{job_role}" position.
+
+RESUME CONTENT:
+{pack_resume(document, self.ANALYSIS_RESUME_TOKENS)}
+
+TARGET ROLE: {job_role}
+
+ROLE REQUIREMENTS:
+{format_profile(profile)}
+
+Provide ONLY the following part of the analysis as a JSON object:
+{{
+{schema}
+}}
+
+IMPORTANT:
+- Base ALL analysis on the actual resume content provided
+- Make recommendations specific to the {job_role} position
+
+Respond with ONLY the JSON object, no additional text.
+"""
+        start = time.perf_counter()
+        try:
+            response = self._request_completion(prompt, max_tokens=part["max_tokens"])
+            return json.loads(self._clean_json_response(response))
+        finally:
+            get_metrics().observe(f"llm.analysis.{name}_ms", (time.perf_counter() - start) * 1000)
+    
+    def get_role_profile(self, job_role: str) -> Dict:
+        """Requirement profile for the role from the shared store, generated once if the catalog lacks it"""
+        generate = self._generate_role_profile if self._provider_names() else None
+        return self.role_store.get(job_role, generate)
+    
+    def _generate_role_profile(self, role: str) -> Dict:
+        """Ask the LLM for a role's requirements in the catalog's shape"""
+        prompt = f"""
+List the requirements recruiters screen for in a typical "{role}" job posting.
+
+Respond with ONLY this JSON object, no additional text:
+{{
+    "titles": ["[Common alternative job titles for this role]"],
+    "required": ["[5-8 skills or tools almost every posting requires]"],
+    "preferred": ["[4-7 skills or tools that are a plus]"],
+    "keywords": ["[5-8 short phrases recruiters scan for]"],
+    "years": [typical years of experience for a mid-level hire, as a number]
+}}
+"""
+        response = self._request_completion(prompt, max_tokens=400)
+        return json.loads(self._clean_json_response(response))
+    
+    def _get_document(self, resume_text: str, resume_document: Optional[ResumeDocument]) -> ResumeDocument:
+        """Reuse the structure computed at extraction time, building it only if missing or stale"""
+        if resume_document is not None and resume_document.text == resume_text:
+            return resume_document
+        return ResumeDocument.from_text(resume_text)
     
     def _clean_json_response(self, response: str) -> str:
         """Clean AI response to extract valid JSON"""
@@ -165,86 +558,78 @@ Respond with ONLY the JSON object, no additional text.
         
         raise ValueError("No valid JSON found in AI response")
     
-    def _validate_and_enhance_analysis(self, analysis_data: Dict, resume_text: str, job_role: str) -> Dict:
-        """Validate and enhance AI analysis with additional insights"""
-        
-        # Ensure all required fields exist
-        required_fields = {
-            "match_percentage": 75,
-            "overall_score": 7,
-            "summary": f"Professional analysis for {job_role} position",
-            "strengths": [],
-            "weaknesses": [],
-            "found_skills": [],
-            "missing_skills": [],
-            "suggested_keywords": [],
-            "weak_sections": [],
-            "suggestions": [],
-            "ats_compatibility": {"score": 7, "issues": [], "recommendations": []}
-        }
-        
-        for field, default in required_fields.items():
-            if field not in analysis_data or not analysis_data[field]:
-                analysis_data[field] = default
-        
-        # Enhance with additional analysis
-        analysis_data = self._add_content_insights(analysis_data, resume_text, job_role)
-        
-        return analysis_data
+    def _validate_and_enhance_analysis(self, analysis_data: Dict, resume_text: str, job_role: str,
+                                       document: Optional[ResumeDocument] = None,
+                                       profile: Optional[Dict] = None) -> Dict:
+        """Fill gaps in the AI analysis from the local engine and attach content insights"""
+        document = self._get_document(resume_text, document)
+        return merge_analyses(analyze_resume_locally(resume_text, job_role, document, profile), analysis_data)
     
-    def _add_content_insights(self, analysis_data: Dict, resume_text: str, job_role: str) -> Dict:
-        """Add additional insights based on resume content analysis"""
-        
-        text_lower = resume_text.lower()
-        
-        # Extract experience years
-        experience_patterns = [
-            r'(\d+)\+?\s*years?\s*(?:of\s*)?(?:experience|exp)',
-            r'(\d+)\+?\s*yrs?\s*(?:of\s*)?(?:experience|exp)'
-        ]
-        
-        max_years = 0
-        for pattern in experience_patterns:
-            matches = re.findall(pattern, text_lower)
-            for match in matches:
-                try:
-                    years = int(match)
-                    max_years = max(max_years, years)
-                except:
-                    continue
+    def chat_response(self, user_message: str, resume_text: str, job_role: str, chat_history: List[Dict], **kwargs) -> str:
+        """
+        Real-time AI chat responses based on actual resume analysis - FIXED to avoid job role mentions
+        """
         
-        # Find quantified achievements
-        achievements = []
-        percentage_matches = re.findall(r'[^.\n]*\d+%[^.\n]*', resume_text)
-        achievements.extend([match.strip() for match in percentage_matches[:2]])
+        if not user_message.strip():
+            return "Please ask a specific question about your resume or career."
         
-        # Add content insights to analysis
-        analysis_data['content_insights'] = {
-            'years_experience': max_years,
-            'quantified_achievements': achievements,
-            'word_count': len(resume_text.split()),
-            'has_contact_info': bool(re.search(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b', resume_text))
-        }
+        memory = kwargs.get("memory")
+        chat_prompt = self._build_chat_prompt(user_message, resume_text, chat_history, kwargs.get("resume_document"),
+                                              memory)
         
-        return analysis_data
+        try:
+            response = self._make_ai_request(chat_prompt, max_tokens=400)
+        except Exception as e:
+            return self._generate_contextual_fallback_response(user_message)
+        return response.strip()
     
-    def chat_response(self, user_message: str, resume_text: str, job_role: str, chat_history: List[Dict], **kwargs) -> str:
+    def chat_response_stream(self, user_message: str, resume_text: str, job_role: str,
+                             chat_history: List[Dict], **kwargs) -> Iterator[str]:
         """
-        Real-time AI chat responses based on actual resume analysis - FIXED to avoid job role mentions
+        Streaming variant of chat_response: yields the reply as tokens arrive
         """
         
         if not user_message.strip():
-            return "Please ask a specific question about your resume or career."
+            yield "Please ask a specific question about your resume or career."
+            return
+        
+        memory = kwargs.get("memory")
+        chat_prompt = self._build_chat_prompt(user_message, resume_text, chat_history, kwargs.get("resume_document"),
+                                              memory)
+        
+        streamed = False
+        try:
+            for token in self._stream_ai_request(chat_prompt, max_tokens=400):
+                streamed = True
+                yield token
+        except Exception:
+            # Once tokens are on screen a partial answer beats swapping in the fallback
+            if not streamed:
+                yield self._generate_contextual_fallback_response(user_message)
+    
+    def _build_chat_prompt(self, user_message: str, resume_text: str, chat_history: List[Dict],
+                           resume_document: Optional[ResumeDocument],
+                           memory: Optional[ConversationMemory] = None) -> str:
+        """Chat prompt with the resume chunks relevant to the question and bounded conversation context"""
+        if resume_text:
+            document = self._get_document(resume_text, resume_document)
+            resume_context = get_resume_index(document).retrieve(
+                user_message, self.CHAT_RESUME_TOKENS, self.CHAT_RESUME_CHUNKS)
+            # Questions that match nothing specific ("any tips?") get the key sections instead
+            resume_context = resume_context or pack_resume(document, self.CHAT_RESUME_TOKENS, CHAT_PRIORITY)
+        else:
+            resume_context = "No resume uploaded"
+        self.update_conversation_memory(memory, chat_history)
         
         # Create context-aware chat prompt - REMOVED job role mentions from responses
         chat_prompt = f"""
 You are ResumeFit AI, an expert career advisor. The user has uploaded their resume and wants career advice.
 
-RESUME SUMMARY (first 1000 chars):
-{resume_text[:1000] if resume_text else "No resume uploaded"}
+RESUME EXCERPTS:
+{resume_context}
 
-RECENT CONVERSATION:
-{self._format_chat_history(chat_history[-4:])}
+CONVERSATION SO FAR:
+{(memory or ConversationMemory()).context(chat_history, user_message)}
 
 USER QUESTION: {user_message}
 
@@ -262,22 +647,37 @@ Just reply what the user asks, dont reply about t he user's summary always. repl
 
 Respond naturally as a career advisor would.
 """
+        return chat_prompt
+    
+    def update_conversation_memory(self, memory: Optional[ConversationMemory], chat_history: List[Dict]):
+        """Fold older turns into the session's rolling summary once enough have accumulated.
 
-        try:
-            response = self._make_ai_request(chat_prompt, max_tokens=400)
-            return response.strip()
-            
-        except Exception as e:
-            return self._generate_contextual_fallback_response(user_message)
+        The fold is extractive and instant; when a provider is configured the
+        LLM rewrites it on a background thread, so neither the prompt nor
+        the streamed reply waits for a summary call.
+        """
+        if memory is None:
+            return
+        folded = memory.fold(chat_history)
+        if folded is not None and self._provider_names():
+            _get_summary_pool().submit(memory.refine, *folded, self._summarize_conversation)
     
-    def _format_chat_history(self, history: List[Dict]) -> str:
-        """Format chat history for context"""
-        formatted = ""
-        for entry in history:
-            role = entry.get("role", "user")
-            content = entry.get("content", "")[:150]
-            formatted += f"{role}: {content}\n"
-        return formatted
+    def _summarize_conversation(self, summary: str, entries: List[Dict]) -> str:
+        """Ask the LLM to extend the rolling conversation summary with new turns"""
+        new_turns = "\n".join(f"{entry.get('role', 'user')}: {entry.get('content', '')}" for entry in entries)
+        prompt = f"""
+Update the running summary of a career-advice chat about the user's resume.
+
+CURRENT SUMMARY:
+{summary or "(empty)"}
+
+NEW TURNS:
+{new_turns}
+
+Keep the user's goals, resume details discussed, advice already given and open questions.
+Use at most 120 words. Respond with ONLY the updated summary.
+"""
+        return self._request_completion(prompt, max_tokens=250)
     
     def _generate_contextual_fallback_response(self, user_message: str) -> str:
         """Generate contextual fallback when AI is unavailable - FIXED to remove job role mentions"""
@@ -334,46 +734,17 @@ Would you like help identifying specific keywords for your industry?"""
 
 What specific aspect of your resume would you like to focus on?"""
     
-    def _generate_enhanced_fallback(self, resume_text: str, job_role: str, ai_response: str = "") -> Dict:
-        """Generate enhanced fallback analysis when AI parsing fails"""
+    def _generate_enhanced_fallback(self, resume_text: str, job_role: str, ai_response: str = "",
+                                    document: Optional[ResumeDocument] = None,
+                                    profile: Optional[Dict] = None) -> Dict:
+        """Generate the local analysis when the AI is unavailable or its output cannot be parsed"""
         
-        # Try to extract insights from the raw AI response
-        insights = self._extract_insights_from_text(ai_response, resume_text, job_role)
+        analysis_data = analyze_resume_locally(resume_text, job_role, self._get_document(resume_text, document),
+                                               profile)
         
-        return {
-            "match_percentage": insights.get('match_percentage', 75),
-            "overall_score": insights.get('overall_score', 7),
-            "summary": insights.get('summary', f"Resume shows potential for {job_role} position with opportunities for optimization based on role requirements and industry standards."),
-            "strengths": insights.get('strengths', [
-                "Professional experience in relevant field",
-                "Clear resume structure and presentation",
-                "Educational background supports career goals"
-            ]),
-            "weaknesses": insights.get('weaknesses', [
-                "Could benefit from more quantified achievements",
-                "Consider adding more role-specific keywords",
-                "Professional summary could be more targeted"
-            ]),
-            "found_skills": insights.get('found_skills', []),
-            "missing_skills": insights.get('missing_skills', []),
-            "suggested_keywords": insights.get('suggested_keywords', [
-                "results-driven", "collaborative", "innovative", "problem-solving"
-            ]),
-            "weak_sections": insights.get('weak_sections', [
-                "Experience descriptions need more metrics",
-                "Skills section could be more comprehensive"
-            ]),
-            "suggestions": insights.get('suggestions', [
-                f"Add specific metrics to achievements relevant to {job_role}",
-                f"Include more {job_role}-specific keywords throughout",
-                "Strengthen professional summary with role-targeted language"
-            ]),
-            "ats_compatibility": {
-                "score": 7,
-                "issues": ["Standard formatting recommended"],
-                "recommendations": ["Use clear section headers", "Include relevant keywords naturally"]
-            }
-        }
+        # Keep whatever scores could still be read from the raw AI response
+        analysis_data.update(self._extract_insights_from_text(ai_response, resume_text, job_role))
+        return analysis_data
     
     def _extract_insights_from_text(self, ai_response: str, resume_text: str, job_role: str) -> Dict:
         """Extract insights from AI response text when JSON parsing fails"""
@@ -419,7 +790,7 @@ What specific aspect of your resume would you like to focus on?"""
         """Test real-time AI connection"""
         try:
             test_prompt = "Respond with 'Real-time AI analysis ready' if you can process resume analysis requests."
-            response = self._make_ai_request(test_prompt, max_tokens=20)
+            response = self._make_ai_request(test_prompt, max_tokens=20, use_cache=False)
             
             if "ready" in response.lower() or "analysis" in response.lower():
                 return {"status": "success", "message": "✅ Real-time AI analysis engine connected and ready!"}
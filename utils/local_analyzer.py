@@ -0,0 +1,236 @@
+import re
+from typing import Dict, List, Optional
+
+from utils.resume_document import ResumeDocument
+from utils.role_store import get_role_store
+from utils.similarity import get_role_index, resume_terms
+from utils.skill_matcher import get_skill_matcher
+
+# Sections an ATS expects to find, by canonical name
+CORE_SECTIONS = ("experience", "education", "skills")
+# Word counts outside this range read as too thin or too long
+IDEAL_WORD_RANGE = (300, 900)
+# Sections with fewer words than this are flagged as thin
+THIN_SECTION_WORDS = 25
+
+_TABLE_ROW_RE = re.compile(r"^.+ \| .+$", re.MULTILINE)
+# Squares, arrows and symbol-font glyphs that ATS parsers mangle
+_DECORATIVE_BULLET_RE = re.compile("[\u25a0-\u25c6\u2700-\u27bf\uf0a7\uf0b7\uf0d8]")
+
+
+def _coverage(found: List[str], wanted: List[str]) -> float:
+    return len([skill for skill in wanted if skill in found]) / len(wanted) if wanted else 1.0
+
+
+def _format_list(items: List[str], limit: int = 4) -> str:
+    return ", ".join(items[:limit]) + ("…" if len(items) > limit else "")
+
+
+def _ats_check(document: ResumeDocument, found_skills: List[str]) -> Dict:
+    """Score ATS friendliness out of 10 from structure, contact details and parse hazards"""
+    score = 10
+    issues, recommendations = [], []
+    sections = document.section_names()
+
+    missing = [name for name in CORE_SECTIONS if name not in sections]
+    if missing:
+        score -= len(missing)
+        issues.append(f"No clearly labelled {', '.join(missing)} section")
+        recommendations.append("Use standard headings such as Experience, Education and Skills")
+    if not document.contact.email:
+        score -= 2
+        issues.append("No email address found")
+        recommendations.append("Put your email and phone number in the header as plain text")
+    elif not document.contact.phone:
+        score -= 1
+        issues.append("No phone number found")
+        recommendations.append("Add a phone number next to your email")
+    if len(_TABLE_ROW_RE.findall(document.text)) >= 3:
+        score -= 1
+        issues.append("Content laid out in tables or columns")
+        recommendations.append("Avoid tables and multi-column layouts; many ATS read them out of order")
+    if _DECORATIVE_BULLET_RE.search(document.text):
+        score -= 1
+        issues.append("Decorative bullet symbols")
+        recommendations.append("Use simple round bullets or hyphens")
+    if len(found_skills) < 5:
+        score -= 1
+        issues.append("Few recognisable skill keywords")
+        recommendations.append("List tools and technologies by their standard names")
+
+    if not issues:
+        recommendations.append("Keep the simple layout and tailor keywords for each application")
+    return {"score": max(1, score), "issues": issues, "recommendations": recommendations}
+
+
+def analyze_resume_locally(resume_text: str, job_role: str, document: Optional[ResumeDocument] = None,
+                           profile: Optional[Dict] = None) -> Dict:
+    """Deterministic analysis from the skills taxonomy and role profiles.
+
+    Fills the same schema as the LLM analysis in a few milliseconds, so it
+    can be shown immediately and used wherever the LLM is unavailable.
+    `profile` defaults to the shared store's profile for `job_role`.
+    """
+    if document is None or document.text != resume_text:
+        document = ResumeDocument.from_text(resume_text)
+    profile = profile or get_role_store().get(job_role)
+    role_name = profile["name"]
+    found_skills = get_skill_matcher().find(document.text)
+    sections = document.section_names()
+    word_count = document.word_count
+    years = document.years_experience
+
+    required_hits = [skill for skill in profile["required"] if skill in found_skills]
+    missing_required = [skill for skill in profile["required"] if skill not in found_skills]
+    missing_preferred = [skill for skill in profile["preferred"] if skill not in found_skills]
+    experience_fit = min(1.0, years / profile["years"]) if profile["years"] else 1.0
+    if not years and "experience" in sections:
+        # Experience is listed but not stated in years; give partial credit
+        experience_fit = max(experience_fit, 0.5)
+    match_percentage = round(100 * (
+        0.6 * _coverage(found_skills, profile["required"])
+        + 0.25 * _coverage(found_skills, profile["preferred"])
+        + 0.15 * experience_fit
+    ))
+    match_percentage = max(5, min(98, match_percentage))
+
+    lower_text = document.normalized_text.lower()
+    suggested_keywords = [kw for kw in profile["keywords"] if kw not in lower_text][:8]
+    achievements = document.quantified_achievements
+    thin_sections = [name for name in sections
+                     if name in CORE_SECTIONS and len(document.section_text(name).split()) < THIN_SECTION_WORDS]
+    missing_sections = [name for name in CORE_SECTIONS if name not in sections]
+    ats = _ats_check(document, found_skills)
+    role_index = get_role_index()
+    resume_vector = role_index.vectorize(resume_terms(document.text, found_skills))
+
+    quality = 10
+    quality -= len(missing_sections)
+    quality -= 0 if achievements else 2
+    quality -= 0 if IDEAL_WORD_RANGE[0] <= word_count <= IDEAL_WORD_RANGE[1] else 1
+    quality -= 0 if document.has_contact_info else 1
+    quality -= 0 if len(found_skills) >= 8 else 1
+    overall_score = max(1, min(10, quality))
+
+    role_label = job_role.strip() or "the target role"
+    strengths = []
+    if required_hits:
+        strengths.append(f"Covers {len(required_hits)} of {len(profile['required'])} core skills for "
+                         f"{role_label}: {_format_list(required_hits)}")
+    if achievements:
+        strengths.append(f"Quantifies impact, e.g. \"{achievements[0][:120]}\"")
+    if years:
+        strengths.append(f"States {years}+ years of experience")
+    if not missing_sections:
+        strengths.append("Clear structure with standard Experience, Education and Skills sections")
+    if len(found_skills) >= 8:
+        strengths.append(f"Broad toolkit of {len(found_skills)} recognisable skills")
+    if not strengths:
+        strengths.append("Resume text is machine-readable and ready for tailoring")
+
+    weaknesses = []
+    if missing_required:
+        weaknesses.append(f"Missing core {role_label} skills: {_format_list(missing_required)}")
+    if not achievements:
+        weaknesses.append("No quantified achievements (numbers, percentages, scale)")
+    if missing_sections:
+        weaknesses.append(f"No {', '.join(missing_sections)} section detected")
+    if profile["years"] and years and years < profile["years"]:
+        weaknesses.append(f"Stated experience ({years} years) is below the ~{profile['years']} years "
+                          f"typical for this role")
+    if word_count < IDEAL_WORD_RANGE[0]:
+        weaknesses.append(f"Short resume ({word_count} words); details of projects and impact are thin")
+    elif word_count > IDEAL_WORD_RANGE[1]:
+        weaknesses.append(f"Long resume ({word_count} words); trim older or less relevant content")
+
+    suggestions = []
+    if missing_required:
+        suggestions.append(f"Add evidence of {_format_list(missing_required, 3)} through projects or "
+                           f"experience bullets, if you have used them")
+    if not achievements:
+        suggestions.append("Rewrite experience bullets as action + result with a number "
+                           "(e.g. \"cut load time by 40%\")")
+    if suggested_keywords:
+        suggestions.append(f"Work in role keywords such as {_format_list(suggested_keywords, 3)}")
+    if missing_sections or thin_sections:
+        suggestions.append(f"Expand the {', '.join(missing_sections + thin_sections)} section(s)")
+    suggestions.extend(ats["recommendations"][:1])
+
+    summary = (
+        f"Estimated {match_percentage}% match for {role_label}"
+        f"{f' (matched to the {role_name} profile)' if role_name and role_name != role_label.lower() else ''}. "
+        f"Found {len(found_skills)} recognisable skills, {len(required_hits)} of them core to the role"
+        f"{f', and {years}+ years of stated experience' if years else ''}. "
+        + (f"The biggest gaps are {_format_list(missing_required, 3)}." if missing_required
+           else "All core skills for the role are present; focus on showing impact.")
+    )
+
+    return {
+        "match_percentage": match_percentage,
+        "overall_score": overall_score,
+        "summary": summary,
+        "strengths": strengths,
+        "weaknesses": weaknesses,
+        "found_skills": found_skills,
+        "missing_skills": (missing_required + missing_preferred)[:10],
+        "suggested_keywords": suggested_keywords,
+        "weak_sections": [f"{name.title()} section is missing" for name in missing_sections]
+                         + [f"{name.title()} section is thin" for name in thin_sections],
+        "suggestions": suggestions,
+        "ats_compatibility": ats,
+        "content_insights": {
+            "years_experience": years,
+            "quantified_achievements": achievements,
+            "word_count": word_count,
+            "has_contact_info": document.has_contact_info,
+            "sections_found": sections,
+        },
+        "local_similarity": round(role_index.similarity(resume_vector, profile), 3),
+        "closest_roles": [{"role": name, "similarity": score} for name, score in role_index.top(resume_vector)],
+        "analysis_source": "local",
+    }
+
+
+def _skill_names(value) -> List[str]:
+    """Skill names from an LLM field that should be a list of strings.
+
+    A comma-separated string is split; non-string items are skipped.
+    """
+    if isinstance(value, str):
+        value = value.split(",")
+    if not isinstance(value, list):
+        return []
+    return [item.strip() for item in value if isinstance(item, str) and item.strip()]
+
+
+def merge_analyses(local: Dict, ai: Dict) -> Dict:
+    """Enrich the local result with an LLM analysis.
+
+    LLM values win where present; skill names are canonicalized, skills
+    found locally are kept alongside the LLM's and never reported missing,
+    and content insights always come from the local pass. The result is
+    only marked as an AI analysis when the LLM contributed at least one field.
+    """
+    merged = dict(local)
+    ai_fields = 0
+    for field, value in ai.items():
+        if field not in ("analysis_source", "content_insights") and value not in (None, "", [], {}):
+            merged[field] = value
+            ai_fields += 1
+    matcher = get_skill_matcher()
+    skills = {}
+    for skill in _skill_names(ai.get("found_skills")) + local["found_skills"]:
+        skill = matcher.canonical(skill) or skill
+        skills.setdefault(skill.lower(), skill)
+    merged["found_skills"] = list(skills.values())
+    # A skill the scan found in the text is not missing, whatever the LLM says
+    missing = {}
+    for skill in _skill_names(ai.get("missing_skills")) or local["missing_skills"]:
+        skill = matcher.canonical(skill) or skill
+        if skill.lower() not in skills:
+            missing.setdefault(skill.lower(), skill)
+    merged["missing_skills"] = list(missing.values())
+    merged["content_insights"] = local["content_insights"]
+    # An empty or unusable LLM answer leaves the result local
+    merged["analysis_source"] = "ai" if ai_fields else local["analysis_source"]
+    return merged
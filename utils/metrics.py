@@ -0,0 +1,78 @@
+import threading
+from collections import defaultdict, deque
+from typing import Dict, Optional
+
+# Samples kept per timing metric for percentiles
+DEFAULT_WINDOW = 500
+
+
+def _percentile(ordered, pct: float) -> float:
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+class MetricsRegistry:
+    """Process-wide counters, gauges and rolling timing samples.
+
+    Timings keep the last `window` observations so percentiles reflect
+    recent behaviour rather than the whole process lifetime.
+    """
+
+    def __init__(self, window: int = DEFAULT_WINDOW):
+        self.window = window
+        self._lock = threading.Lock()
+        self._samples: Dict[str, deque] = defaultdict(lambda: deque(maxlen=self.window))
+        self._counters: Dict[str, int] = defaultdict(int)
+        self._gauges: Dict[str, float] = {}
+
+    def observe(self, name: str, value: float):
+        """Record one timing sample, in milliseconds by convention"""
+        with self._lock:
+            self._samples[name].append(value)
+
+    def increment(self, name: str, amount: int = 1):
+        with self._lock:
+            self._counters[name] += amount
+
+    def set_gauge(self, name: str, value: float):
+        with self._lock:
+            self._gauges[name] = value
+
+    def timing(self, name: str) -> Optional[Dict[str, float]]:
+        """count, last, p50 and p95 of a timing metric, or None before the first sample"""
+        with self._lock:
+            samples = list(self._samples.get(name, ()))
+        if not samples:
+            return None
+        ordered = sorted(samples)
+        return {
+            "count": len(samples),
+            "last": samples[-1],
+            "p50": _percentile(ordered, 50),
+            "p95": _percentile(ordered, 95),
+        }
+
+    def snapshot(self) -> Dict[str, Dict]:
+        """All metrics in a JSON-safe form"""
+        with self._lock:
+            names = list(self._samples)
+            counters = dict(self._counters)
+            gauges = dict(self._gauges)
+        return {
+            "timings": {name: self.timing(name) for name in names},
+            "counters": counters,
+            "gauges": gauges,
+        }
+
+
+_metrics: Optional[MetricsRegistry] = None
+_metrics_lock = threading.Lock()
+
+
+def get_metrics() -> MetricsRegistry:
+    """Return the metrics registry shared by every session in this process"""
+    global _metrics
+    with _metrics_lock:
+        if _metrics is None:
+            _metrics = MetricsRegistry()
+        return _metrics
@@ -0,0 +1,138 @@
+import logging
+import threading
+import time
+from collections import deque
+from typing import Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Limits advertised next to the upload widget
+MAX_UPLOAD_BYTES = 10 * 1024 * 1024
+DEFAULT_MAX_PAGES = 100
+
+# Text-layer probe: pages sampled, minimum characters that count as text, wall-clock budget
+SAMPLE_PAGES = 3
+MIN_TEXT_CHARS = 16
+TIME_BUDGET_SECONDS = 2.0
+# Oversized uploads are identified by a hash of this many leading bytes
+SIZE_CHECK_HASH_WINDOW = 64 * 1024
+
+PDF_HEADER_WINDOW = 1024
+PDF_TRAILER_WINDOW = 2048
+
+# Rejection code -> message shown to the user
+REJECTION_REASONS = {
+    "empty": "The file is empty.",
+    "too_large": "The file is larger than the {limit} limit.",
+    "too_many_pages": "The document has {pages} pages; the limit is {limit}.",
+    "not_pdf": "The file does not look like a PDF (no %PDF header).",
+    "corrupt": "The file is damaged and could not be opened.",
+    "encrypted": "The file is password-protected. Please upload an unprotected copy.",
+    "no_pages": "The PDF contains no pages.",
+    "image_only": "The PDF is a scanned image with no selectable text. "
+                  "Please upload a text-based PDF, DOCX or TXT export of your resume.",
+    "no_text": "No text was found in the file.",
+    "timeout": "The file took too long to read and looks malformed.",
+    "not_utf8": "The text file is not UTF-8 encoded.",
+}
+
+MAX_RECORDED_REJECTIONS = 200
+
+_rejections = deque(maxlen=MAX_RECORDED_REJECTIONS)
+_rejections_lock = threading.Lock()
+
+
+class DocumentRejected(ValueError):
+    """Raised when preflight finds a file that extraction cannot use"""
+
+    def __init__(self, code: str, reason: str):
+        super().__init__(reason)
+        self.code = code
+        self.reason = reason
+
+
+class PreflightTimer:
+    """Wall-clock budget shared by the checks of a single preflight run"""
+
+    def __init__(self, budget: float = TIME_BUDGET_SECONDS):
+        self.budget = budget
+        self.start = time.perf_counter()
+
+    @property
+    def elapsed_ms(self) -> float:
+        return round((time.perf_counter() - self.start) * 1000, 2)
+
+    def remaining(self) -> float:
+        return self.budget - (time.perf_counter() - self.start)
+
+    def expired(self) -> bool:
+        return time.perf_counter() - self.start > self.budget
+
+
+def new_report(file_type: str, size_bytes: int) -> Dict:
+    """Preflight result; `ok` is False when `code` names a rejection"""
+    return {
+        "ok": True,
+        "code": None,
+        "reason": None,
+        "file_type": file_type,
+        "size_bytes": size_bytes,
+        "page_count": None,
+        "has_text_layer": None,
+        "warnings": [],
+        "elapsed_ms": 0.0,
+    }
+
+
+def reject(report: Dict, code: str, **details) -> Dict:
+    report["ok"] = False
+    report["code"] = code
+    report["reason"] = REJECTION_REASONS[code].format(**details)
+    return report
+
+
+def format_size(size_bytes: int) -> str:
+    return f"{size_bytes / (1024 * 1024):.0f}MB"
+
+
+def check_pdf_structure(view: memoryview) -> Optional[str]:
+    """Look for the %PDF header and %%EOF trailer without parsing the file.
+
+    Returns a rejection code, "missing_eof" for a file that is probably
+    truncated but may still be repairable, or None.
+    """
+    if bytes(view[:PDF_HEADER_WINDOW]).find(b"%PDF-") < 0:
+        return "not_pdf"
+    if bytes(view[-PDF_TRAILER_WINDOW:]).find(b"%%EOF") < 0:
+        return "missing_eof"
+    return None
+
+
+def sample_page_indices(page_count: int, samples: int = SAMPLE_PAGES) -> List[int]:
+    """First, middle and last pages; resumes with a text layer have it on every page"""
+    if page_count <= samples:
+        return list(range(page_count))
+    step = (page_count - 1) / (samples - 1)
+    return sorted({round(i * step) for i in range(samples)})
+
+
+def record_rejection(report: Dict, file_hash: Optional[str] = None):
+    """Keep a bounded log of rejected files for the UI and operators"""
+    entry = {
+        "time": time.time(),
+        "sha256": file_hash,
+        "file_type": report["file_type"],
+        "size_bytes": report["size_bytes"],
+        "code": report["code"],
+        "reason": report["reason"],
+    }
+    with _rejections_lock:
+        _rejections.append(entry)
+    logger.info(f"Rejected {report['file_type']} upload ({report['size_bytes']} bytes): {report['code']}")
+
+
+def recent_rejections(limit: Optional[int] = None) -> List[Dict]:
+    """Most recent rejections first"""
+    with _rejections_lock:
+        entries = list(reversed(_rejections))
+    return entries[:limit] if limit else entries
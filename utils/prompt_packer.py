@@ -0,0 +1,109 @@
+import re
+from collections import Counter
+from typing import List, Optional, Sequence, Set
+
+from utils.resume_document import ResumeDocument, normalize_text, split_pages
+from utils.tokens import estimate_tokens
+
+# Sections in the order they earn a place in the prompt
+ANALYSIS_PRIORITY = ("experience", "skills", "summary", "projects", "education", "certifications",
+                     "achievements", "publications", "interests")
+CHAT_PRIORITY = ("summary", "skills", "experience", "projects", "education", "certifications",
+                 "achievements")
+
+# The name and contact block is short and anchors the rest
+HEADER_TOKEN_CAP = 80
+
+_PAGE_NUMBER_RE = re.compile(r"^(?:page\s*)?\d{1,3}(?:\s*(?:/|of)\s*\d{1,3})?$", re.IGNORECASE)
+
+
+def running_lines(text: str) -> Set[str]:
+    """Running headers and footers: lines that open or close most pages of a PDF.
+
+    Only the page edges are considered, so a line repeated in the body
+    (the same job title at three employers) is never treated as one.
+    """
+    edges = Counter()
+    pages = 0
+    for page in split_pages(text):
+        lines = [line for line in normalize_text(page).splitlines() if line and not _PAGE_NUMBER_RE.match(line)]
+        if lines:
+            pages += 1
+            edges.update({lines[0], lines[-1]})
+    if pages < 2:
+        return set()
+    return {line for line, count in edges.items() if count * 2 > pages}
+
+
+def clean_lines(text: str, seen: Set[str], running: Set[str]) -> List[str]:
+    """Normalized lines without page numbers, running headers/footers or lines already used"""
+    lines = []
+    for line in normalize_text(text).splitlines():
+        if not line:
+            if lines and lines[-1]:
+                lines.append("")
+            continue
+        if line in running or _PAGE_NUMBER_RE.match(line):
+            continue
+        key = line.lower()
+        if key in seen:
+            continue
+        seen.add(key)
+        lines.append(line)
+    while lines and not lines[-1]:
+        lines.pop()
+    return lines
+
+
+def _fit(lines: List[str], budget: int) -> List[str]:
+    """Whole lines from the top until the token budget is spent"""
+    kept = []
+    for line in lines:
+        cost = estimate_tokens(line) + 1
+        if cost > budget:
+            break
+        kept.append(line)
+        budget -= cost
+    return kept
+
+
+def pack_resume(document: ResumeDocument, token_budget: int,
+                priority: Optional[Sequence[str]] = None) -> str:
+    """Fit the resume into `token_budget` approximate tokens, best sections first.
+
+    Sections are admitted in `priority` order (unlisted ones last); the
+    first section that does not fit is cut at a line boundary and lower
+    ones are dropped. Admitted sections are emitted in document order.
+    """
+    priority = list(priority or ANALYSIS_PRIORITY)
+    running = running_lines(document.text)
+    seen: Set[str] = set()
+
+    # The header is where a running header line first appears, so it is kept there
+    header = _fit(clean_lines(document.header_text(), seen, set()), min(HEADER_TOKEN_CAP, token_budget))
+    budget = token_budget - sum(estimate_tokens(line) + 1 for line in header)
+
+    names = document.section_names()
+    if not names:
+        body = _fit(clean_lines(document.text, seen, running), budget)
+        return "\n".join(header + body).strip()
+
+    ranked = sorted(names, key=lambda name: priority.index(name) if name in priority else len(priority))
+    packed = {}
+    for name in ranked:
+        heading = name.upper()
+        lines = clean_lines(document.section_text(name), seen, running)
+        cost = estimate_tokens(heading) + 1
+        if not lines or budget <= cost:
+            continue
+        kept = _fit(lines, budget - cost)
+        if not kept:
+            continue
+        packed[name] = [heading] + kept
+        budget -= cost + sum(estimate_tokens(line) + 1 for line in kept)
+        if len(kept) < len(lines):
+            break
+
+    blocks = ["\n".join(header)] if header else []
+    blocks += ["\n".join(packed[name]) for name in names if name in packed]
+    return "\n\n".join(blocks).strip()
@@ -0,0 +1,212 @@
+import logging
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Callable, Dict, List, Optional
+
+from utils.metrics import MetricsRegistry, get_metrics
+
+logger = logging.getLogger(__name__)
+
+# Outcomes and latencies remembered per provider
+DEFAULT_WINDOW = 50
+# A provider above this error rate is only tried after the healthy ones
+MAX_ERROR_RATE = 0.5
+# Latency samples needed before p95 is trusted for hedging
+MIN_HEDGE_SAMPLES = 5
+# How long a provider is skipped after a 429 or 5xx response
+DEFAULT_COOLDOWN_SECONDS = 30.0
+MAX_CONCURRENT_ATTEMPTS = 16
+
+
+class ProviderStats:
+    """Rolling latency and outcome window for one provider"""
+
+    def __init__(self, window: int = DEFAULT_WINDOW):
+        self.latencies = deque(maxlen=window)
+        self.outcomes = deque(maxlen=window)
+        self.cooldown_until = 0.0
+
+    @property
+    def error_rate(self) -> float:
+        return self.outcomes.count(False) / len(self.outcomes) if self.outcomes else 0.0
+
+    def percentile(self, pct: float) -> Optional[float]:
+        if not self.latencies:
+            return None
+        ordered = sorted(self.latencies)
+        return ordered[min(len(ordered) - 1, round(pct / 100 * (len(ordered) - 1)))]
+
+
+def _status_code(error: Exception) -> Optional[int]:
+    response = getattr(error, "response", None)
+    return getattr(response, "status_code", None)
+
+
+class ProviderRouter:
+    """Chooses between LLM providers from their recent latency and error rates.
+
+    Healthy providers are tried fastest first; on failure the next one is
+    tried while the request deadline allows. With hedging, a second
+    provider is started when the first has not answered within its p95
+    latency, and whichever answers first wins.
+    """
+
+    def __init__(self, window: int = DEFAULT_WINDOW, cooldown_seconds: float = DEFAULT_COOLDOWN_SECONDS,
+                 metrics: Optional[MetricsRegistry] = None):
+        self.window = window
+        self.cooldown_seconds = cooldown_seconds
+        self.metrics = metrics or get_metrics()
+        self._stats: Dict[str, ProviderStats] = {}
+        self._lock = threading.Lock()
+        # Attempts run here so the caller can enforce the deadline and hedge
+        self._pool = ThreadPoolExecutor(max_workers=MAX_CONCURRENT_ATTEMPTS, thread_name_prefix="resumefit-llm")
+
+    def _stats_for(self, name: str) -> ProviderStats:
+        stats = self._stats.get(name)
+        if stats is None:
+            stats = self._stats[name] = ProviderStats(self.window)
+        return stats
+
+    def record_success(self, name: str, latency_ms: float):
+        with self._lock:
+            stats = self._stats_for(name)
+            stats.latencies.append(latency_ms)
+            stats.outcomes.append(True)
+            error_rate = stats.error_rate
+        self.metrics.observe(f"llm.{name}.latency_ms", latency_ms)
+        self.metrics.set_gauge(f"llm.{name}.error_rate", error_rate)
+
+    def record_failure(self, name: str, error: Exception, cooldown: Optional[float] = None):
+        """Count a failed attempt; rate limits and server errors also bench the provider for a while"""
+        status = _status_code(error)
+        if cooldown is None and status is not None and (status == 429 or status >= 500):
+            cooldown = self.cooldown_seconds
+        with self._lock:
+            stats = self._stats_for(name)
+            stats.outcomes.append(False)
+            if cooldown:
+                stats.cooldown_until = max(stats.cooldown_until, time.monotonic() + cooldown)
+            error_rate = stats.error_rate
+        self.metrics.increment(f"llm.{name}.errors")
+        self.metrics.set_gauge(f"llm.{name}.error_rate", error_rate)
+
+    def is_healthy(self, name: str) -> bool:
+        with self._lock:
+            stats = self._stats_for(name)
+            return stats.cooldown_until <= time.monotonic() and stats.error_rate <= MAX_ERROR_RATE
+
+    def ranked(self, names: List[str]) -> List[str]:
+        """Healthy providers by median latency, then unhealthy ones as a last resort.
+
+        Providers without samples keep their configured order ahead of
+        measured ones so each gets tried at least once.
+        """
+        def latency(name):
+            with self._lock:
+                p50 = self._stats_for(name).percentile(50)
+            return (p50 is not None, p50 or 0.0)
+
+        healthy = [name for name in names if self.is_healthy(name)]
+        unhealthy = [name for name in names if name not in healthy]
+        return sorted(healthy, key=latency) + unhealthy
+
+    def hedge_delay(self, name: str) -> Optional[float]:
+        """Seconds to wait for `name` before hedging, or None without enough history"""
+        with self._lock:
+            stats = self._stats_for(name)
+            if len(stats.latencies) < MIN_HEDGE_SAMPLES:
+                return None
+            return stats.percentile(95) / 1000
+
+    def snapshot(self) -> Dict[str, Dict]:
+        """Per-provider health for display"""
+        now = time.monotonic()
+        with self._lock:
+            return {
+                name: {
+                    "p50_ms": stats.percentile(50),
+                    "p95_ms": stats.percentile(95),
+                    "error_rate": stats.error_rate,
+                    "cooling_down": stats.cooldown_until > now,
+                }
+                for name, stats in self._stats.items()
+            }
+
+    def _attempt(self, attempt: Callable[[str, float], str], name: str, timeout: float) -> str:
+        start = time.perf_counter()
+        try:
+            result = attempt(name, timeout)
+        except Exception as e:
+            self.record_failure(name, e)
+            raise
+        self.record_success(name, (time.perf_counter() - start) * 1000)
+        return result
+
+    def call(self, attempt: Callable[[str, float], str], names: List[str], deadline_seconds: float,
+             hedge: bool = False) -> str:
+        """Run `attempt(provider, timeout_seconds)` against the best provider, failing over
+        (and optionally hedging) until one succeeds or the deadline passes.
+        """
+        queue = self.ranked(names)
+        if not queue:
+            raise RuntimeError("No LLM provider is configured")
+        deadline = time.monotonic() + deadline_seconds
+        pending = {}
+        last_error: Optional[Exception] = None
+
+        def launch(name: str, decision: str):
+            self.metrics.increment(f"llm.router.{decision}.{name}")
+            pending[self._pool.submit(self._attempt, attempt, name, deadline - time.monotonic())] = name
+
+        primary = queue.pop(0)
+        launch(primary, "selected")
+        hedge_delay = self.hedge_delay(primary) if hedge else None
+
+        while pending:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            timeout = remaining
+            if hedge_delay is not None and queue:
+                timeout = min(remaining, hedge_delay)
+            done, _ = wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+
+            if not done:
+                if hedge_delay is not None and queue:
+                    # The primary is slower than its p95: race a second provider
+                    launch(queue.pop(0), "hedged")
+                    hedge_delay = None
+                continue
+
+            for future in done:
+                name = pending.pop(future)
+                try:
+                    result = future.result()
+                except Exception as e:
+                    logger.warning(f"LLM provider {name} failed: {e}")
+                    last_error = e
+                    if queue and not pending and deadline > time.monotonic():
+                        launch(queue.pop(0), "failover")
+                    continue
+                self.metrics.increment(f"llm.router.answered.{name}")
+                return result
+
+        self.metrics.increment("llm.router.exhausted")
+        if last_error is not None:
+            raise last_error
+        raise TimeoutError(f"No LLM provider answered within {deadline_seconds:.0f}s")
+
+
+_router: Optional[ProviderRouter] = None
+_router_lock = threading.Lock()
+
+
+def get_provider_router() -> ProviderRouter:
+    """Return the router shared by every handler, so health data is process-wide"""
+    global _router
+    with _router_lock:
+        if _router is None:
+            _router = ProviderRouter()
+        return _router
@@ -0,0 +1,219 @@
+import logging
+import os
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Callable, Dict, Optional, TypeVar
+
+from utils.metrics import MetricsRegistry, get_metrics
+
+logger = logging.getLogger(__name__)
+
+# Documented free-tier limits: requests per minute, tokens per minute
+PROVIDER_LIMITS = {
+    "groq": {"rpm": 30, "tpm": 6000},
+    "together": {"rpm": 60, "tpm": 60000},
+}
+DEFAULT_LIMITS = {"rpm": 30, "tpm": 10000}
+
+# Longest a request waits in the local queue before giving up on a provider
+MAX_QUEUE_WAIT_SECONDS = 20.0
+MAX_RETRIES = 3
+BACKOFF_BASE_SECONDS = 0.5
+BACKOFF_CAP_SECONDS = 8.0
+RETRYABLE_STATUS = (429, 500, 502, 503, 504)
+
+T = TypeVar("T")
+
+
+class RateLimitExceeded(RuntimeError):
+    """Raised when a request cannot get a rate-limit slot in time"""
+
+
+class ProviderLimiter:
+    """Request and token buckets for one provider, shared by every session.
+
+    Both buckets refill continuously at the per-minute rate and hold at
+    most one minute of budget, matching how providers count usage.
+    """
+
+    def __init__(self, name: str, rpm: int, tpm: int, metrics: Optional[MetricsRegistry] = None):
+        self.name = name
+        self.rpm = max(1, rpm)
+        self.tpm = max(1, tpm)
+        self.metrics = metrics or get_metrics()
+        self._requests = float(self.rpm)
+        self._tokens = float(self.tpm)
+        self._updated = time.monotonic()
+        self._blocked_until = 0.0
+        self._waiting = 0
+        self._avg_tokens = 1000.0
+        self._cond = threading.Condition()
+
+    def _refill(self, now: float):
+        elapsed = now - self._updated
+        self._updated = now
+        self._requests = min(self.rpm, self._requests + elapsed * self.rpm / 60)
+        self._tokens = min(self.tpm, self._tokens + elapsed * self.tpm / 60)
+
+    def _delay(self, tokens: float, now: float) -> float:
+        """Seconds until one request of `tokens` fits in both buckets"""
+        request_wait = max(0.0, 1 - self._requests) * 60 / self.rpm
+        token_wait = max(0.0, tokens - self._tokens) * 60 / self.tpm
+        return max(request_wait, token_wait, self._blocked_until - now)
+
+    def acquire(self, tokens: int, timeout: float = MAX_QUEUE_WAIT_SECONDS) -> float:
+        """Block until the request fits the limits; returns seconds waited.
+
+        Raises RateLimitExceeded when that would take longer than `timeout`.
+        """
+        # A single request larger than a minute of budget would never fit
+        tokens = min(float(tokens), float(self.tpm))
+        start = time.monotonic()
+        with self._cond:
+            self._waiting += 1
+            self.metrics.set_gauge(f"llm.{self.name}.queue_depth", self._waiting)
+            try:
+                while True:
+                    now = time.monotonic()
+                    self._refill(now)
+                    delay = self._delay(tokens, now)
+                    if delay <= 0:
+                        self._requests -= 1
+                        self._tokens -= tokens
+                        self._avg_tokens = 0.8 * self._avg_tokens + 0.2 * tokens
+                        waited = now - start
+                        self.metrics.observe(f"llm.{self.name}.queue_wait_ms", waited * 1000)
+                        return waited
+                    if now + delay - start > timeout:
+                        raise RateLimitExceeded(
+                            f"{self.name} rate limit: next slot in {delay:.0f}s, {self._waiting - 1} requests ahead"
+                        )
+                    self._cond.wait(delay)
+            finally:
+                self._waiting -= 1
+                self.metrics.set_gauge(f"llm.{self.name}.queue_depth", self._waiting)
+                self._cond.notify_all()
+
+    def reconcile(self, reserved: int, used: int):
+        """Settle a reservation against actual usage: unused tokens go back, overruns are charged"""
+        with self._cond:
+            self._refill(time.monotonic())
+            self._tokens = min(float(self.tpm), self._tokens + min(float(reserved), float(self.tpm)) - used)
+            self._cond.notify_all()
+
+    def penalize(self, seconds: float):
+        """Stop issuing requests for `seconds`, e.g. after a 429 with Retry-After"""
+        with self._cond:
+            self._blocked_until = max(self._blocked_until, time.monotonic() + seconds)
+            self._requests = min(self._requests, 0.0)
+
+    def status(self) -> Dict[str, float]:
+        """Queue depth and an estimate of how long a new request would wait"""
+        with self._cond:
+            now = time.monotonic()
+            self._refill(now)
+            per_request = max(60 / self.rpm, self._avg_tokens * 60 / self.tpm)
+            wait = self._delay(self._avg_tokens, now) + self._waiting * per_request
+            return {"queue_depth": self._waiting, "wait_seconds": round(wait, 1)}
+
+
+class RateLimiter:
+    """Per-provider limiters, created on first use"""
+
+    def __init__(self, limits: Optional[Dict[str, Dict[str, int]]] = None):
+        self.limits = limits if limits is not None else PROVIDER_LIMITS
+        self._limiters: Dict[str, ProviderLimiter] = {}
+        self._lock = threading.Lock()
+
+    def limiter_for(self, provider: str) -> ProviderLimiter:
+        with self._lock:
+            limiter = self._limiters.get(provider)
+            if limiter is None:
+                limits = self.limits.get(provider, DEFAULT_LIMITS)
+                prefix = f"RESUMEFIT_{provider.upper()}"
+                limiter = self._limiters[provider] = ProviderLimiter(
+                    provider,
+                    int(os.environ.get(f"{prefix}_RPM", limits["rpm"])),
+                    int(os.environ.get(f"{prefix}_TPM", limits["tpm"])),
+                )
+            return limiter
+
+
+def retry_after_seconds(response) -> Optional[float]:
+    """Parse a Retry-After header given in seconds or as an HTTP date"""
+    value = response.headers.get("Retry-After") if response is not None else None
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+def backoff_delay(attempt: int) -> float:
+    """Exponential backoff with full jitter"""
+    return random.uniform(0, min(BACKOFF_CAP_SECONDS, BACKOFF_BASE_SECONDS * 2 ** attempt))
+
+
+def call_with_retries(limiter: ProviderLimiter, tokens: int, send: Callable[[float], T], timeout: float) -> T:
+    """Run `send(remaining_seconds)` under the limiter, retrying rate limits and server errors.
+
+    `tokens` are reserved once for the logical request; retries only take
+    a request slot, and a request the provider rejected with an HTTP error
+    gets its reservation back. Callers settle a successful call against
+    the reported usage with `limiter.reconcile`. 429 responses pause the
+    whole provider for their Retry-After; every retry waits at least a
+    jittered exponential backoff. Gives up, raising the last error, when
+    the next attempt would not fit in `timeout`.
+    """
+    deadline = time.monotonic() + timeout
+    attempt = 0
+    reserved = False
+    while True:
+        try:
+            limiter.acquire(0 if reserved else tokens,
+                            timeout=min(MAX_QUEUE_WAIT_SECONDS, max(0.0, deadline - time.monotonic())))
+        except RateLimitExceeded:
+            if reserved:
+                limiter.reconcile(tokens, 0)
+            raise
+        reserved = True
+        try:
+            return send(deadline - time.monotonic())
+        except Exception as e:
+            response = getattr(e, "response", None)
+            status = getattr(response, "status_code", None)
+            delay = backoff_delay(attempt)
+            retry_after = retry_after_seconds(response)
+            if status in RETRYABLE_STATUS and attempt < MAX_RETRIES:
+                if status == 429:
+                    limiter.penalize(retry_after if retry_after is not None else delay)
+                delay = max(delay, retry_after or 0.0)
+            if status not in RETRYABLE_STATUS or attempt >= MAX_RETRIES or time.monotonic() + delay >= deadline:
+                # An HTTP error response means the provider did not process the request
+                if status is not None:
+                    limiter.reconcile(tokens, 0)
+                raise
+            limiter.metrics.increment(f"llm.{limiter.name}.retries")
+            logger.info(f"Retrying {limiter.name} after HTTP {status} in {delay:.1f}s")
+            time.sleep(delay)
+            attempt += 1
+
+
+_rate_limiter: Optional[RateLimiter] = None
+_rate_limiter_lock = threading.Lock()
+
+
+def get_rate_limiter() -> RateLimiter:
+    """Return the limiter shared by every session in this process"""
+    global _rate_limiter
+    with _rate_limiter_lock:
+        if _rate_limiter is None:
+            _rate_limiter = RateLimiter()
+        return _rate_limiter
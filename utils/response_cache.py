@@ -0,0 +1,168 @@
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_ENTRIES = 256
+DEFAULT_MAX_DISK_ENTRIES = 5000
+DEFAULT_TTL_SECONDS = 7 * 24 * 3600
+
+
+class ResponseCache:
+    """Two-tier cache of LLM completions: an in-memory LRU in front of an optional SQLite file.
+
+    Entries expire `ttl_seconds` after they were written; both tiers are
+    bounded by entry count and evict the least recently used entries first.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES, db_path: Optional[str] = None,
+                 ttl_seconds: float = DEFAULT_TTL_SECONDS, max_disk_entries: int = DEFAULT_MAX_DISK_ENTRIES):
+        self.max_entries = max(1, max_entries)
+        self.max_disk_entries = max(1, max_disk_entries)
+        self.ttl_seconds = ttl_seconds
+        self.db_path = db_path
+        # key -> (created timestamp, response text)
+        self._entries: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._db_lock = threading.Lock()
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+        if self.db_path:
+            try:
+                os.makedirs(os.path.dirname(self.db_path) or ".", exist_ok=True)
+                with self._connect() as db:
+                    db.execute(
+                        "CREATE TABLE IF NOT EXISTS responses ("
+                        "key TEXT PRIMARY KEY, response TEXT NOT NULL, created REAL NOT NULL, accessed REAL NOT NULL)"
+                    )
+                    db.execute("CREATE INDEX IF NOT EXISTS responses_accessed ON responses (accessed)")
+            except (OSError, sqlite3.Error) as e:
+                logger.warning(f"Disabling LLM response disk cache: {e}")
+                self.db_path = None
+
+    @staticmethod
+    def make_key(provider: str, model: str, prompt: str, temperature: float, max_tokens: int) -> str:
+        """Hash every request parameter that changes the completion"""
+        material = json.dumps([provider, model, prompt, temperature, max_tokens], ensure_ascii=False)
+        return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        """Return a fresh cached response, checking memory first and then disk"""
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if now - entry[0] <= self.ttl_seconds:
+                    self._entries.move_to_end(key)
+                    self.memory_hits += 1
+                    return entry[1]
+                del self._entries[key]
+
+        entry = self._read_disk(key, now)
+
+        with self._lock:
+            if entry is None:
+                self.misses += 1
+                return None
+            self.disk_hits += 1
+            self._store(key, entry)
+        return entry[1]
+
+    def put(self, key: str, response: str):
+        """Store a response in memory and, when enabled, on disk"""
+        entry = (time.time(), response)
+        with self._lock:
+            self._store(key, entry)
+        self._write_disk(key, entry)
+
+    def clear(self):
+        """Drop all in-memory entries"""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, int]:
+        """Return cache counters"""
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "hits": self.memory_hits + self.disk_hits,
+                "memory_hits": self.memory_hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+            }
+
+    def _store(self, key: str, entry: Tuple[float, str]):
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def _connect(self) -> sqlite3.Connection:
+        # Short-lived connections keep the cache usable from any Streamlit thread
+        return sqlite3.connect(self.db_path, timeout=5)
+
+    def _read_disk(self, key: str, now: float) -> Optional[Tuple[float, str]]:
+        if not self.db_path:
+            return None
+        try:
+            with self._db_lock, self._connect() as db:
+                row = db.execute("SELECT created, response FROM responses WHERE key = ?", (key,)).fetchone()
+                if row is None:
+                    return None
+                if now - row[0] > self.ttl_seconds:
+                    db.execute("DELETE FROM responses WHERE key = ?", (key,))
+                    return None
+                db.execute("UPDATE responses SET accessed = ? WHERE key = ?", (now, key))
+                return row[0], row[1]
+        except sqlite3.Error as e:
+            logger.warning(f"Ignoring LLM response cache read error: {e}")
+            return None
+
+    def _write_disk(self, key: str, entry: Tuple[float, str]):
+        if not self.db_path:
+            return
+        created, response = entry
+        try:
+            with self._db_lock, self._connect() as db:
+                db.execute(
+                    "INSERT OR REPLACE INTO responses (key, response, created, accessed) VALUES (?, ?, ?, ?)",
+                    (key, response, created, created),
+                )
+                self._prune_disk(db, created)
+        except sqlite3.Error as e:
+            logger.warning(f"Could not persist LLM response: {e}")
+
+    def _prune_disk(self, db: sqlite3.Connection, now: float):
+        db.execute("DELETE FROM responses WHERE created < ?", (now - self.ttl_seconds,))
+        db.execute(
+            "DELETE FROM responses WHERE key IN ("
+            "SELECT key FROM responses ORDER BY accessed DESC LIMIT -1 OFFSET ?)",
+            (self.max_disk_entries,),
+        )
+
+
+_shared_cache: Optional[ResponseCache] = None
+_shared_cache_lock = threading.Lock()
+
+
+def get_response_cache() -> ResponseCache:
+    """Return the response cache shared by every session in this process"""
+    global _shared_cache
+    with _shared_cache_lock:
+        if _shared_cache is None:
+            cache_dir = os.environ.get("RESUMEFIT_CACHE_DIR")
+            _shared_cache = ResponseCache(
+                max_entries=int(os.environ.get("RESUMEFIT_LLM_CACHE_SIZE", DEFAULT_MAX_ENTRIES)),
+                db_path=os.path.join(cache_dir, "llm_responses.sqlite3") if cache_dir else None,
+                ttl_seconds=float(os.environ.get("RESUMEFIT_LLM_CACHE_TTL", DEFAULT_TTL_SECONDS)),
+            )
+        return _shared_cache
@@ -0,0 +1,166 @@
+import re
+from typing import Dict, List
+
+# Canonical section name -> headings that introduce it (matched case-insensitively on their own line)
+SECTION_HEADINGS = {
+    "summary": ["summary", "professional summary", "career summary", "profile", "professional profile",
+                "objective", "career objective", "about me"],
+    "experience": ["experience", "work experience", "professional experience", "employment history",
+                   "work history", "employment", "internships", "internship experience"],
+    "education": ["education", "academic background", "academics", "educational qualifications",
+                  "qualifications"],
+    "skills": ["skills", "technical skills", "key skills", "core competencies", "skills & tools",
+               "skills and tools", "technologies", "tools & technologies"],
+    "projects": ["projects", "personal projects", "academic projects", "key projects"],
+    "certifications": ["certifications", "certificates", "licenses & certifications", "courses"],
+    "achievements": ["achievements", "awards", "honors", "honors & awards", "accomplishments"],
+    "publications": ["publications", "research", "papers"],
+    "interests": ["interests", "hobbies", "hobbies & interests", "activities", "extracurricular activities"],
+}
+
+_HEADING_LOOKUP = {heading: name for name, headings in SECTION_HEADINGS.items() for heading in headings}
+_HEADING_RE = re.compile(
+    r"^[ \t]*(?P<heading>" + "|".join(
+        re.escape(h) for h in sorted(_HEADING_LOOKUP, key=len, reverse=True)
+    ) + r")[ \t]*:?[ \t]*$",
+    re.IGNORECASE | re.MULTILINE,
+)
+_EMAIL_RE = re.compile(r"\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b")
+_PHONE_RE = re.compile(r"(?<!\w)\+?\d[\d ()-]{8,}\d(?!\w)")
+_LINKEDIN_RE = re.compile(r"(?:https?://)?(?:www\.)?linkedin\.com/[^\s|,]+", re.IGNORECASE)
+_GITHUB_RE = re.compile(r"(?:https?://)?(?:www\.)?github\.com/[^\s|,]+", re.IGNORECASE)
+_EXPERIENCE_RE = re.compile(r"(\d+)\+?\s*(?:years?|yrs?)\s*(?:of\s*)?(?:experience|exp)", re.IGNORECASE)
+_ACHIEVEMENT_RE = re.compile(r"[^.\n]*\d+%[^.\n]*")
+# PDF pages are joined with a form feed on its own line, as pdftotext marks them
+PAGE_BREAK = "\f"
+_SPACES_RE = re.compile(r"[ \t\u00a0]+")
+_BLANK_LINES_RE = re.compile(r"\n\s*\n+")
+
+
+class ResumeSection:
+    """A detected resume section; `start` (heading line) and `end` are offsets into the raw text"""
+
+    __slots__ = ("name", "heading", "start", "end")
+
+    def __init__(self, name: str, heading: str, start: int, end: int):
+        self.name = name
+        self.heading = heading
+        self.start = start
+        self.end = end
+
+    def __repr__(self):
+        return f"ResumeSection({self.name!r}, {self.start}, {self.end})"
+
+
+class ContactInfo:
+    """Contact details found in the resume"""
+
+    __slots__ = ("email", "phone", "linkedin", "github")
+
+    def __init__(self, email: str = "", phone: str = "", linkedin: str = "", github: str = ""):
+        self.email = email
+        self.phone = phone
+        self.linkedin = linkedin
+        self.github = github
+
+    def to_dict(self) -> Dict[str, str]:
+        return {slot: getattr(self, slot) for slot in self.__slots__}
+
+
+class ResumeDocument:
+    """Structured view of an extracted resume, built once at extraction time.
+
+    Downstream code reads sections, contact details and content metrics from
+    here instead of re-scanning the flat text.
+    """
+
+    __slots__ = ("text", "normalized_text", "sections", "contact", "word_count",
+                 "years_experience", "quantified_achievements")
+
+    def __init__(self, text: str, sections: List[ResumeSection], contact: ContactInfo,
+                 word_count: int, years_experience: int, quantified_achievements: List[str]):
+        self.text = text
+        self.normalized_text = normalize_text(text)
+        self.sections = sections
+        self.contact = contact
+        self.word_count = word_count
+        self.years_experience = years_experience
+        self.quantified_achievements = quantified_achievements
+
+    @classmethod
+    def from_text(cls, text: str) -> "ResumeDocument":
+        """Segment and profile the resume text"""
+        sections = []
+        headings = list(_HEADING_RE.finditer(text))
+        for i, match in enumerate(headings):
+            end = headings[i + 1].start() if i + 1 < len(headings) else len(text)
+            heading = match.group("heading")
+            sections.append(ResumeSection(_HEADING_LOOKUP[heading.lower()], heading, match.start(), end))
+
+        def first(pattern):
+            match = pattern.search(text)
+            return match.group(0).strip() if match else ""
+
+        # Date ranges like "2019 - 2023" look like phone numbers; require ten digits
+        phone = next((m.group(0).strip() for m in _PHONE_RE.finditer(text)
+                      if sum(c.isdigit() for c in m.group(0)) >= 10), "")
+        contact = ContactInfo(first(_EMAIL_RE), phone, first(_LINKEDIN_RE), first(_GITHUB_RE))
+        years = [int(y) for y in _EXPERIENCE_RE.findall(text)]
+        achievements = [m.strip() for m in _ACHIEVEMENT_RE.findall(text)[:2]]
+        return cls(text, sections, contact, len(text.split()), max(years, default=0), achievements)
+
+    @classmethod
+    def from_dict(cls, data: Dict, text: str) -> "ResumeDocument":
+        """Rebuild a document cached with `to_dict` without re-running detection"""
+        return cls(
+            text,
+            [ResumeSection(s["name"], s["heading"], s["start"], s["end"]) for s in data["sections"]],
+            ContactInfo(**data["contact"]),
+            data["word_count"],
+            data["years_experience"],
+            data["quantified_achievements"],
+        )
+
+    def to_dict(self) -> Dict:
+        """JSON-safe form without the text itself, which is stored alongside it"""
+        return {
+            "sections": [{"name": s.name, "heading": s.heading, "start": s.start, "end": s.end}
+                         for s in self.sections],
+            "contact": self.contact.to_dict(),
+            "word_count": self.word_count,
+            "years_experience": self.years_experience,
+            "quantified_achievements": self.quantified_achievements,
+        }
+
+    @property
+    def has_contact_info(self) -> bool:
+        return bool(self.contact.email)
+
+    def section_names(self) -> List[str]:
+        """Distinct section names in document order"""
+        return list(dict.fromkeys(section.name for section in self.sections))
+
+    def section_text(self, name: str) -> str:
+        """Body text of every section with this canonical name, headings removed"""
+        bodies = []
+        for section in self.sections:
+            if section.name == name:
+                _, _, body = self.text[section.start:section.end].partition("\n")
+                bodies.append(body.strip())
+        return "\n".join(bodies).strip()
+
+    def header_text(self) -> str:
+        """Text before the first detected heading (name, contact line)"""
+        end = self.sections[0].start if self.sections else len(self.text)
+        return self.text[:end].strip()
+
+
+def split_pages(text: str) -> List[str]:
+    """Page texts of an extracted PDF; other documents are a single page"""
+    return text.split(PAGE_BREAK)
+
+
+def normalize_text(text: str) -> str:
+    """Collapse runs of spaces and blank lines left behind by PDF extraction"""
+    lines = (_SPACES_RE.sub(" ", line).strip() for line in text.splitlines())
+    return _BLANK_LINES_RE.sub("\n\n", "\n".join(lines)).strip()
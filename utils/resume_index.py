@@ -0,0 +1,153 @@
+import math
+import re
+import threading
+from collections import Counter, OrderedDict
+from typing import List, Tuple
+
+from utils.extraction_cache import content_hash
+from utils.prompt_packer import clean_lines, running_lines
+from utils.resume_document import SECTION_HEADINGS, ResumeDocument
+from utils.tokens import estimate_tokens
+
+# Chunks are runs of whole lines up to about this many words
+CHUNK_WORDS = 60
+# BM25 parameters; the usual defaults suit short, uneven chunks
+BM25_K1 = 1.5
+BM25_B = 0.75
+# Resume indexes kept in memory, one per distinct resume text
+MAX_INDEXES = 64
+
+_WORD_RE = re.compile(r"[a-z0-9][a-z0-9+#]*")
+_STOPWORDS = {"a", "about", "all", "am", "an", "and", "any", "are", "as", "at", "be", "by", "can", "could", "did",
+              "do", "does", "for", "from", "get", "give", "had", "has", "have", "how", "i", "if", "in", "is", "it",
+              "its", "me", "more", "my", "of", "on", "or", "should", "so", "tell", "that", "the", "there", "this",
+              "to", "was", "what", "when", "where", "which", "who", "why", "will", "with", "would", "you", "your"}
+# The header has no heading of its own; these words point questions at it
+HEADER_WORDS = ["header", "name", "contact", "email", "phone", "linkedin", "github"]
+
+
+def _stem(word: str) -> str:
+    # Plural folding is enough to match "costs" with "cost" in short resume lines
+    return word[:-1] if len(word) > 3 and word.endswith("s") and not word.endswith("ss") else word
+
+
+def tokenize(text: str) -> List[str]:
+    return [_stem(word) for word in _WORD_RE.findall(text.lower()) if word not in _STOPWORDS]
+
+
+class ResumeChunk:
+    """A run of lines from one section, with the tokens BM25 scores it on"""
+
+    __slots__ = ("section", "position", "lines", "tokens")
+
+    def __init__(self, section: str, position: int, lines: List[str]):
+        self.section = section
+        self.position = position
+        self.lines = lines
+        # Heading synonyms let "what papers have I written" reach the publications section
+        heading_words = " ".join(HEADER_WORDS if section == "header" else SECTION_HEADINGS.get(section, [section]))
+        self.tokens = tokenize("\n".join(lines) + " " + heading_words)
+
+    @property
+    def text(self) -> str:
+        return "\n".join(self.lines)
+
+
+def chunk_resume(document: ResumeDocument, max_words: int = CHUNK_WORDS) -> List[ResumeChunk]:
+    """Split each section into chunks of whole lines, in document order.
+
+    Page numbers, running headers and footers, and lines repeated within
+    a section are dropped first, as in the prompt packer. Each chunk is
+    retrieved on its own, so a line may recur in different sections.
+    """
+    running = running_lines(document.text)
+    sources = [("header", document.header_text())]
+    sources += [(name, document.section_text(name)) for name in document.section_names()]
+    if not document.sections:
+        sources = [("resume", document.text)]
+
+    chunks = []
+    for section, text in sources:
+        current, words = [], 0
+        # A running header line is the page-one original inside the header
+        for line in clean_lines(text, set(), set() if section == "header" else running):
+            if not line:
+                continue
+            line_words = len(line.split())
+            if current and words + line_words > max_words:
+                chunks.append(ResumeChunk(section, len(chunks), current))
+                current, words = [], 0
+            current.append(line)
+            words += line_words
+        if current:
+            chunks.append(ResumeChunk(section, len(chunks), current))
+    return chunks
+
+
+class ResumeIndex:
+    """In-memory BM25 index over one resume's chunks"""
+
+    def __init__(self, document: ResumeDocument):
+        self.chunks = chunk_resume(document)
+        self._term_counts = [Counter(chunk.tokens) for chunk in self.chunks]
+        self._lengths = [len(chunk.tokens) for chunk in self.chunks]
+        self._average_length = sum(self._lengths) / len(self._lengths) if self._lengths else 0.0
+        document_frequency = Counter(term for counts in self._term_counts for term in counts)
+        n = len(self.chunks)
+        self._idf = {term: math.log(1 + (n - df + 0.5) / (df + 0.5)) for term, df in document_frequency.items()}
+
+    def search(self, query: str, k: int = 4) -> List[Tuple[float, ResumeChunk]]:
+        """Top `k` chunks by BM25 score; chunks sharing no term with the query are left out"""
+        terms = [term for term in dict.fromkeys(tokenize(query)) if term in self._idf]
+        scored = []
+        for counts, length, chunk in zip(self._term_counts, self._lengths, self.chunks):
+            score = 0.0
+            norm = BM25_K1 * (1 - BM25_B + BM25_B * length / (self._average_length or 1))
+            for term in terms:
+                frequency = counts.get(term)
+                if frequency:
+                    score += self._idf[term] * frequency * (BM25_K1 + 1) / (frequency + norm)
+            if score > 0:
+                scored.append((score, chunk))
+        scored.sort(key=lambda item: (-item[0], item[1].position))
+        return scored[:k]
+
+    def retrieve(self, query: str, token_budget: int, k: int = 4) -> str:
+        """Best chunks that fit the token budget, grouped under their section and in document order.
+
+        Returns "" when nothing matches, so callers can fall back to a
+        general excerpt.
+        """
+        picked = []
+        for _, chunk in self.search(query, k):
+            cost = estimate_tokens(chunk.text) + 1
+            if cost <= token_budget:
+                picked.append(chunk)
+                token_budget -= cost
+        blocks = []
+        last_section = None
+        for chunk in sorted(picked, key=lambda chunk: chunk.position):
+            heading = "" if chunk.section == last_section else f"{chunk.section.upper()}\n"
+            blocks.append(heading + chunk.text)
+            last_section = chunk.section
+        return "\n\n".join(blocks)
+
+
+_indexes: "OrderedDict[str, ResumeIndex]" = OrderedDict()
+_indexes_lock = threading.Lock()
+
+
+def get_resume_index(document: ResumeDocument) -> ResumeIndex:
+    """Index for this resume, built on first use and reused by every later question"""
+    key = content_hash(document.text.encode("utf-8"))
+    with _indexes_lock:
+        index = _indexes.get(key)
+        if index is not None:
+            _indexes.move_to_end(key)
+            return index
+    index = ResumeIndex(document)
+    with _indexes_lock:
+        _indexes[key] = index
+        while len(_indexes) > MAX_INDEXES:
+            _indexes.popitem(last=False)
+    return index
@@ -1,62 +1,670 @@
 import streamlit as st
-from typing import Optional
-import io
+from typing import Dict, Iterator, List, Optional, Tuple
+import logging
+import multiprocessing
+import os
+import threading
+import zipfile
+from concurrent.futures import ProcessPoolExecutor, wait
+from xml.etree import ElementTree as ET
+
+from utils.document_source import DocumentSource, map_file, open_document_source, source_path
+from utils.docx_reader import extract_docx_text
+from utils.extraction_cache import ExtractionCache, content_hash, get_extraction_cache
+from utils import preflight as pf
+from utils.preflight import DocumentRejected
+from utils.resume_document import PAGE_BREAK, ResumeDocument
+from utils.tokens import CHARS_PER_TOKEN, estimate_tokens
+
+logger = logging.getLogger(__name__)
+
+
+def _import_pymupdf():
+    """Import PyMuPDF under its current name, falling back to the legacy `fitz` alias"""
+    try:
+        import pymupdf
+    except ImportError:
+        import fitz as pymupdf
+    return pymupdf
+
+
+class PDFEngine:
+    """Base class for pluggable PDF text extraction backends"""
+
+    name = "base"
+
+    def available(self) -> bool:
+        """Return True when the backing library can be imported"""
+        raise NotImplementedError
+
+    def open(self, source: DocumentSource):
+        """Open a PDF from a DocumentSource and return an engine-specific document"""
+        raise NotImplementedError
+
+    def page_count(self, document) -> int:
+        raise NotImplementedError
+
+    def page_text(self, document, index: int) -> str:
+        raise NotImplementedError
+
+    def close(self, document):
+        pass
+
+    def needs_password(self, document) -> bool:
+        return False
+
+    def page_has_images(self, document, index: int) -> bool:
+        return False
+
+    def iter_pages(self, source: DocumentSource) -> Iterator[str]:
+        """Yield page text lazily so callers can stop early; the document is closed on exit"""
+        document = self.open(source)
+        try:
+            for i in range(self.page_count(document)):
+                yield self.page_text(document, i)
+        finally:
+            self.close(document)
+
+    def extract_pages(self, source: DocumentSource) -> List[str]:
+        """Return the text of every page in order"""
+        return list(self.iter_pages(source))
+
+    def count_pages(self, source: DocumentSource) -> int:
+        """Open the document just long enough to read its page count"""
+        document = self.open(source)
+        try:
+            return self.page_count(document)
+        finally:
+            self.close(document)
+
+
+class PyMuPDFEngine(PDFEngine):
+    """Fast MuPDF-based extraction (default)"""
+
+    name = "pymupdf"
+
+    def available(self) -> bool:
+        try:
+            _import_pymupdf()
+            return True
+        except ImportError:
+            return False
+
+    def open(self, source: DocumentSource):
+        pymupdf = _import_pymupdf()
+        try:
+            # MuPDF reads straight from the buffer; no copy of the upload is made
+            return pymupdf.open(stream=source.view, filetype="pdf")
+        except TypeError:
+            # Older PyMuPDF releases only accept bytes
+            return pymupdf.open(stream=source.to_bytes(), filetype="pdf")
+
+    def page_count(self, document) -> int:
+        return document.page_count
+
+    def page_text(self, document, index: int) -> str:
+        return document.load_page(index).get_text()
+
+    def needs_password(self, document) -> bool:
+        return bool(document.needs_pass)
+
+    def page_has_images(self, document, index: int) -> bool:
+        return bool(document.load_page(index).get_images())
+
+    def close(self, document):
+        document.close()
+
+
+class PyPDF2Engine(PDFEngine):
+    """Pure-Python PyPDF2 extraction (fallback)"""
+
+    name = "pypdf2"
+
+    def available(self) -> bool:
+        try:
+            import PyPDF2  # noqa: F401
+            return True
+        except ImportError:
+            return False
+
+    def open(self, source: DocumentSource):
+        import PyPDF2
+        return PyPDF2.PdfReader(source.open_stream())
+
+    def page_count(self, document) -> int:
+        return len(document.pages)
+
+    def page_text(self, document, index: int) -> str:
+        return document.pages[index].extract_text() or ""
+
+    def needs_password(self, document) -> bool:
+        return bool(document.is_encrypted)
+
+    def page_has_images(self, document, index: int) -> bool:
+        page = document.pages[index]
+        return "/Resources" in page and "/XObject" in page["/Resources"]
+
+
+PDF_ENGINES = {
+    PyMuPDFEngine.name: PyMuPDFEngine(),
+    PyPDF2Engine.name: PyPDF2Engine(),
+}
+DEFAULT_PDF_ENGINE = PyMuPDFEngine.name
+FALLBACK_PDF_ENGINE = PyPDF2Engine.name
+
+PDF_MIME = "application/pdf"
+DOCX_MIME = "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
+TXT_MIME = "text/plain"
+MIME_TYPES = {".pdf": PDF_MIME, ".docx": DOCX_MIME, ".txt": TXT_MIME}
+
+# Documents with fewer pages than this stay on the in-process path
+DEFAULT_PARALLEL_MIN_PAGES = 16
+PAGES_PER_CHUNK = 8
+
+_extraction_pool: Optional[ProcessPoolExecutor] = None
+_extraction_pool_workers = 0
+_extraction_pool_lock = threading.Lock()
+
+
+def get_extraction_pool() -> ProcessPoolExecutor:
+    """Return the bounded process pool shared by every session in this process"""
+    global _extraction_pool, _extraction_pool_workers
+    with _extraction_pool_lock:
+        # A worker that crashed (e.g. on a malformed PDF) breaks the whole pool; start a new one
+        if _extraction_pool is None or getattr(_extraction_pool, "_broken", False):
+            workers = int(os.environ.get("RESUMEFIT_EXTRACTION_WORKERS", min(4, os.cpu_count() or 1)))
+            _extraction_pool_workers = max(1, workers)
+            # spawn avoids forking the threaded Streamlit server
+            _extraction_pool = ProcessPoolExecutor(
+                max_workers=_extraction_pool_workers, mp_context=multiprocessing.get_context("spawn")
+            )
+        return _extraction_pool
+
+
+def _pdf_probe(engine: PDFEngine, source: DocumentSource) -> Tuple[bool, int]:
+    """(needs password, page count) of a PDF"""
+    document = engine.open(source)
+    try:
+        if engine.needs_password(document):
+            return True, 0
+        return False, engine.page_count(document)
+    finally:
+        engine.close(document)
+
+
+def _probe_pdf_process(engine_name: str, path: str, conn):
+    """Single-use process entry point: send the probe of the PDF at `path`, or the error, back over `conn`"""
+    try:
+        with map_file(path) as source:
+            conn.send(("ok", _pdf_probe(PDF_ENGINES[engine_name], source)))
+    except Exception as e:
+        conn.send(("error", f"{type(e).__name__}: {e}"))
+    finally:
+        conn.close()
+
+
+def _extract_page_range(engine_name: str, path: str, start: int, end: int) -> List[str]:
+    """Worker entry point: extract pages [start, end) of the PDF at `path`"""
+    engine = PDF_ENGINES[engine_name]
+    with map_file(path) as source:
+        document = engine.open(source)
+        try:
+            return [engine.page_text(document, i) for i in range(start, end)]
+        finally:
+            engine.close(document)
+
 
 class ResumeProcessor:
     """Process and extract text from various resume formats"""
-    
-    def extract_text(self, uploaded_file) -> Optional[str]:
-        """Extract text from uploaded file"""
-        try:
-            if uploaded_file.type == "application/pdf":
-                return self._extract_from_pdf(uploaded_file)
-            elif uploaded_file.type == "application/vnd.openxmlformats-officedocument.wordprocessingml.document":
-                return self._extract_from_docx(uploaded_file)
-            elif uploaded_file.type == "text/plain":
-                return self._extract_from_txt(uploaded_file)
-            else:
-                st.error(f"Unsupported file type: {uploaded_file.type}")
-                return None
+
+    # Bump whenever extraction output changes so stale cache entries are ignored
+    EXTRACTOR_VERSION = "5"
+
+    # Character budget for interactive uploads: well above what the analysis and
+    # chat prompts consume, but stops a 40-page CV from being decoded in full
+    UI_CHAR_BUDGET = 20000
+
+    def __init__(self, cache: Optional[ExtractionCache] = None, pdf_engine: Optional[str] = None,
+                 parallel_min_pages: Optional[int] = None, spool_threshold: Optional[int] = None,
+                 max_bytes: Optional[int] = None, max_pages: Optional[int] = None):
+        self.cache = cache if cache is not None else get_extraction_cache()
+        self.max_bytes = max_bytes or int(os.environ.get("RESUMEFIT_MAX_UPLOAD_BYTES", pf.MAX_UPLOAD_BYTES))
+        self.max_pages = max_pages or int(os.environ.get("RESUMEFIT_MAX_PAGES", pf.DEFAULT_MAX_PAGES))
+        # None defers to RESUMEFIT_SPOOL_THRESHOLD_BYTES
+        self.spool_threshold = spool_threshold
+        # Zero or a negative value disables the process pool
+        if parallel_min_pages is None:
+            parallel_min_pages = int(os.environ.get("RESUMEFIT_PARALLEL_MIN_PAGES", DEFAULT_PARALLEL_MIN_PAGES))
+        self.parallel_min_pages = parallel_min_pages
+        self.pdf_engine = (pdf_engine or os.environ.get("RESUMEFIT_PDF_ENGINE", DEFAULT_PDF_ENGINE)).lower()
+        if self.pdf_engine not in PDF_ENGINES:
+            logger.warning(f"Unknown PDF engine '{self.pdf_engine}', using {DEFAULT_PDF_ENGINE}")
+            self.pdf_engine = DEFAULT_PDF_ENGINE
+
+    def extract_text(self, uploaded_file, max_chars: Optional[int] = None,
+                     max_tokens: Optional[int] = None) -> Optional[str]:
+        """Extract text from uploaded file, reusing cached results for identical content.
+
+        With a character or token budget, pages are decoded only until the
+        budget is met and the result is cut to it.
+        """
+        result = self._extract_upload(uploaded_file, max_chars, max_tokens)
+        return result["text"] if result else None
+
+    def extract_document(self, uploaded_file, max_chars: Optional[int] = None,
+                         max_tokens: Optional[int] = None) -> Optional[ResumeDocument]:
+        """Extract text plus its section structure, both computed once and cached"""
+        result = self._extract_upload(uploaded_file, max_chars, max_tokens)
+        if not result or not result["text"]:
+            return None
+        return ResumeDocument.from_dict(result["document"], result["text"])
+
+    def _extract_upload(self, uploaded_file, max_chars: Optional[int], max_tokens: Optional[int]) -> Optional[Dict]:
+        """Run `extract` on a Streamlit upload, reporting failures in the UI"""
+        try:
+            return self.extract(uploaded_file, uploaded_file.type, max_chars, max_tokens)
+        except DocumentRejected as e:
+            st.error(e.reason)
+            return None
+        except ImportError as e:
+            st.error(str(e))
+            return None
         except Exception as e:
             st.error(f"Error extracting text: {str(e)}")
             return None
-    
-    def _extract_from_pdf(self, uploaded_file) -> str:
-        """Extract text from PDF file"""
-        try:
-            import PyPDF2
-            pdf_reader = PyPDF2.PdfReader(uploaded_file)
-            text = ""
-            for page in pdf_reader.pages:
-                text += page.extract_text() + "\n"
-            return text.strip()
-        except ImportError:
-            st.error("PyPDF2 not installed. Please install it: pip install PyPDF2")
-            return ""
+
+    def extract(self, upload, file_type: str, max_chars: Optional[int] = None,
+                max_tokens: Optional[int] = None) -> Dict:
+        """Extract text from raw bytes or a binary file without any Streamlit output.
+
+        Returns a dict with `text`, `page_count`, `pages_read`, `truncated`
+        and `document` (the ResumeDocument structure in `to_dict` form);
+        raises DocumentRejected for files that fail preflight and other
+        exceptions on unsupported or unreadable files.
+        """
+        budget = self._char_budget(max_chars, max_tokens)
+        with open_document_source(upload, self.spool_threshold) as source:
+            report = self._check_size(source, file_type)
+            if report is not None:
+                raise DocumentRejected(report["code"], report["reason"])
+            file_hash = content_hash(source.view)
+            cache_key = self.cache.make_key(
+                file_hash, f"{self.EXTRACTOR_VERSION}:{self.pdf_engine}:{file_type}:{budget}"
+            )
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                return cached
+
+            report = self._preflight_source(source, file_type, file_hash)
+            if not report["ok"]:
+                raise DocumentRejected(report["code"], report["reason"])
+
+            if file_type == PDF_MIME:
+                text, pages_read = self._collect_pages(self._iter_pdf_pages(source), budget)
+                page_count = pages_read
+                if budget and pages_read:
+                    page_count = self._count_pdf_pages(source) or pages_read
+            elif file_type == DOCX_MIME:
+                text, pages_read, page_count = self._extract_from_docx(source), 1, None
+            elif file_type == TXT_MIME:
+                text, pages_read, page_count = self._extract_from_txt(source), 1, 1
+            else:
+                raise ValueError(f"Unsupported file type: {file_type}")
+
+        full_length = len(text)
+        text = self._apply_budget(text, budget)
+        result = {
+            "text": text,
+            "page_count": page_count,
+            "pages_read": pages_read,
+            "truncated": full_length > len(text) or (page_count or 0) > pages_read,
+            "document": ResumeDocument.from_text(text).to_dict() if text else None,
+        }
+        # Empty results are not cached so a retry can use a different engine
+        if text:
+            self.cache.put(cache_key, result)
+        return result
+
+    def preflight(self, upload, file_type: str) -> Dict:
+        """Check size, structure, page count and text-layer presence in bounded time.
+
+        Returns a report dict whose `ok` is False, with a `code` and a
+        user-facing `reason`, for files that extraction cannot use; `warnings`
+        lists problems that do not block extraction. Reports are cached by
+        content hash and every rejection is recorded in the preflight log.
+        """
+        with open_document_source(upload, self.spool_threshold) as source:
+            report = self._check_size(source, file_type)
+            if report is not None:
+                return report
+            return self._preflight_source(source, file_type, content_hash(source.view))
+
+    def _check_size(self, source: DocumentSource, file_type: str) -> Optional[Dict]:
+        """Reject oversized or empty files before hashing or parsing them"""
+        if 0 < source.size <= self.max_bytes:
+            return None
+        # Streamlit reruns preflight on every interaction, so the rejection is
+        # cached and logged once; the key hashes only the head of the file
+        head_hash = content_hash(source.view[:pf.SIZE_CHECK_HASH_WINDOW])
+        cache_key = self.cache.make_key(head_hash, f"preflight-size:{source.size}:{self.max_bytes}:{file_type}")
+        cached = self.cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        report = pf.new_report(file_type, source.size)
+        pf.reject(report, "too_large" if source.size else "empty", limit=pf.format_size(self.max_bytes))
+        pf.record_rejection(report, head_hash)
+        self.cache.put(cache_key, report)
+        return report
+
+    def _preflight_source(self, source: DocumentSource, file_type: str, file_hash: str) -> Dict:
+        cache_key = self.cache.make_key(
+            file_hash, f"preflight:{self.EXTRACTOR_VERSION}:{self.pdf_engine}:{file_type}:{self.max_pages}"
+        )
+        cached = self.cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        report = pf.new_report(file_type, source.size)
+        timer = pf.PreflightTimer()
+        if file_type == PDF_MIME:
+            self._preflight_pdf(source, report, timer)
+        elif file_type == DOCX_MIME:
+            self._preflight_docx(source, report)
+        elif file_type == TXT_MIME:
+            self._preflight_txt(source, report)
+        else:
+            raise ValueError(f"Unsupported file type: {file_type}")
+        report["elapsed_ms"] = timer.elapsed_ms
+
+        if not report["ok"]:
+            pf.record_rejection(report, file_hash)
+        # A timeout can come from a busy machine rather than the file, so it is retried next time
+        if report["code"] != "timeout":
+            self.cache.put(cache_key, report)
+        return report
+
+    def _preflight_pdf(self, source: DocumentSource, report: Dict, timer: pf.PreflightTimer):
+        """Open with the primary engine only: corrupt files are rejected instead of
+        being retried through the slower fallback"""
+        structure = pf.check_pdf_structure(source.view)
+        if structure == "not_pdf":
+            pf.reject(report, structure)
+            return
+        if structure:
+            report["warnings"].append(structure)
+
+        engines = self._pdf_engine_chain()
+        if not engines:
+            raise ImportError("No PDF engine installed. Please install it: pip install PyMuPDF")
+        engine = engines[0]
+        try:
+            probe = self._probe_pdf(engine, source, timer)
+            if probe is None:
+                pf.reject(report, "timeout")
+                return
+            encrypted, count = probe
         except Exception as e:
-            st.error(f"Error reading PDF: {str(e)}")
-            return ""
-    
-    def _extract_from_docx(self, uploaded_file) -> str:
-        """Extract text from DOCX file"""
+            logger.warning(f"Preflight could not open PDF with {engine.name}: {e}")
+            pf.reject(report, "corrupt")
+            return
+
+        if encrypted:
+            pf.reject(report, "encrypted")
+            return
+        report["page_count"] = count
+        if not count:
+            pf.reject(report, "no_pages")
+            return
+        if count > self.max_pages:
+            pf.reject(report, "too_many_pages", pages=count, limit=self.max_pages)
+            return
+
         try:
-            import docx
-            doc = docx.Document(uploaded_file)
-            text = ""
-            for paragraph in doc.paragraphs:
-                text += paragraph.text + "\n"
-            return text.strip()
-        except ImportError:
-            st.error("python-docx not installed. Please install it: pip install python-docx")
-            return ""
+            document = engine.open(source)
         except Exception as e:
-            st.error(f"Error reading DOCX: {str(e)}")
-            return ""
-    
-    def _extract_from_txt(self, uploaded_file) -> str:
-        """Extract text from TXT file"""
+            logger.warning(f"Preflight could not open PDF with {engine.name}: {e}")
+            pf.reject(report, "corrupt")
+            return
+
         try:
-            return str(uploaded_file.read(), "utf-8")
+            has_images = False
+            text_pages = 0
+            sampled = pf.sample_page_indices(count)
+            for index in sampled:
+                if timer.expired():
+                    break
+                if len(engine.page_text(document, index).strip()) >= pf.MIN_TEXT_CHARS:
+                    text_pages += 1
+                elif engine.page_has_images(document, index):
+                    has_images = True
         except Exception as e:
-            st.error(f"Error reading TXT: {str(e)}")
-            return ""
+            logger.warning(f"Preflight failed reading PDF with {engine.name}: {e}")
+            pf.reject(report, "corrupt")
+            return
+        finally:
+            engine.close(document)
+
+        report["has_text_layer"] = text_pages > 0
+        if not text_pages:
+            if timer.expired():
+                pf.reject(report, "timeout")
+            else:
+                pf.reject(report, "image_only" if has_images else "no_text")
+        elif text_pages < len(sampled):
+            report["warnings"].append("partial_text_layer")
+
+    def _probe_pdf(self, engine: PDFEngine, source: DocumentSource,
+                   timer: pf.PreflightTimer) -> Optional[Tuple[bool, int]]:
+        """(needs password, page count), or None when the time budget ran out.
+
+        Opening parses the xref and page tree, which a hostile file can make
+        arbitrarily slow. Spooled (large) uploads are therefore opened in a
+        single-use process that is killed when the budget runs out; small
+        in-memory uploads, and callers that turned worker processes off,
+        open in-process.
+        """
+        if self.parallel_min_pages <= 0 or not source.path:
+            return _pdf_probe(engine, source)
+
+        context = multiprocessing.get_context("spawn")
+        receiver, sender = context.Pipe(duplex=False)
+        process = context.Process(target=_probe_pdf_process, args=(engine.name, source.path, sender), daemon=True)
+        process.start()
+        sender.close()
+        try:
+            if not receiver.poll(max(0.0, timer.remaining())):
+                return None
+            # EOFError here means the probe process crashed on the file
+            status, value = receiver.recv()
+        finally:
+            if process.is_alive():
+                process.terminate()
+            process.join()
+            receiver.close()
+        if status != "ok":
+            raise RuntimeError(value)
+        return value
+
+    def _preflight_docx(self, source: DocumentSource, report: Dict):
+        """A DOCX must be a zip archive with a main document part"""
+        try:
+            with zipfile.ZipFile(source.open_stream()) as archive:
+                archive.getinfo("word/document.xml")
+        except (zipfile.BadZipFile, KeyError):
+            # Password-protected Word files are OLE containers, not zips
+            pf.reject(report, "corrupt")
+
+    def _preflight_txt(self, source: DocumentSource, report: Dict):
+        head = bytes(source.view[:64 * 1024])
+        try:
+            text = head.decode("utf-8")
+        except UnicodeDecodeError as e:
+            # The 64KB window may cut a multi-byte character in half
+            if e.start < len(head) - 3:
+                pf.reject(report, "not_utf8")
+                return
+            text = head[:e.start].decode("utf-8")
+        report["page_count"] = 1
+        report["has_text_layer"] = bool(text.strip())
+        if not text.strip():
+            pf.reject(report, "no_text")
+
+    def iter_pages(self, uploaded_file) -> Iterator[str]:
+        """Yield text page by page; DOCX and TXT files are yielded as a single page.
+
+        Closing the generator early stops decoding the remaining pages.
+        """
+        with open_document_source(uploaded_file, self.spool_threshold) as source:
+            if uploaded_file.type == PDF_MIME:
+                yield from self._iter_pdf_pages(source)
+            elif uploaded_file.type == DOCX_MIME:
+                yield self._extract_from_docx(source)
+            elif uploaded_file.type == TXT_MIME:
+                yield self._extract_from_txt(source)
+            else:
+                raise ValueError(f"Unsupported file type: {uploaded_file.type}")
+
+    def get_document_info(self, uploaded_file) -> Dict:
+        """Return page count and size without decoding any page text"""
+        with open_document_source(uploaded_file, self.spool_threshold) as source:
+            info = {"file_type": uploaded_file.type, "size_bytes": source.size, "page_count": None}
+            if uploaded_file.type == PDF_MIME:
+                info["page_count"] = self._count_pdf_pages(source)
+            elif uploaded_file.type == TXT_MIME:
+                info["page_count"] = 1
+        return info
+
+    def _count_pdf_pages(self, source: DocumentSource) -> Optional[int]:
+        for engine in self._pdf_engine_chain():
+            try:
+                return engine.count_pages(source)
+            except Exception as e:
+                logger.warning(f"PDF engine {engine.name} could not count pages: {e}")
+        return None
+
+    def _char_budget(self, max_chars: Optional[int], max_tokens: Optional[int]) -> Optional[int]:
+        """Combine character and token budgets into a single character limit"""
+        limits = [limit for limit in (max_chars, max_tokens and max_tokens * CHARS_PER_TOKEN) if limit]
+        return min(limits) if limits else None
+
+    def _apply_budget(self, text: str, budget: Optional[int]) -> str:
+        return text[:budget] if budget else text
+
+    def _collect_pages(self, pages: Iterator[str], budget: Optional[int]) -> Tuple[str, int]:
+        """Join pages, stopping as soon as the character budget is met.
+
+        Returns the joined text and the number of pages decoded.
+        """
+        separator = f"\n{PAGE_BREAK}\n"
+        collected = []
+        size = 0
+        try:
+            for page in pages:
+                collected.append(page)
+                size += len(page) + len(separator)
+                if budget and size >= budget:
+                    break
+        finally:
+            if hasattr(pages, "close"):
+                pages.close()
+        return separator.join(collected).strip(), len(collected)
+
+    def _pdf_engine_chain(self) -> List[PDFEngine]:
+        """Configured engine first, then the fallback"""
+        names = [self.pdf_engine]
+        if FALLBACK_PDF_ENGINE not in names:
+            names.append(FALLBACK_PDF_ENGINE)
+        return [PDF_ENGINES[name] for name in names if PDF_ENGINES[name].available()]
+
+    def _iter_pdf_pages(self, source: DocumentSource) -> Iterator[str]:
+        """Yield PDF pages from the first engine that can open the document"""
+        engines = self._pdf_engine_chain()
+        if not engines:
+            raise ImportError("No PDF engine installed. Please install it: pip install PyMuPDF")
+
+        last_error = None
+        for engine in engines:
+            yielded = False
+            try:
+                for page in self._iter_engine_pages(engine, source):
+                    yielded = True
+                    yield page
+                return
+            except Exception as e:
+                # Switching engines mid-document would duplicate pages
+                if yielded:
+                    raise
+                logger.warning(f"PDF engine {engine.name} failed: {e}")
+                last_error = e
+        raise last_error
+
+    def _iter_engine_pages(self, engine: PDFEngine, source: DocumentSource) -> Iterator[str]:
+        """Yield pages in order, fanning large documents out to the process pool"""
+        document = engine.open(source)
+        try:
+            count = engine.page_count(document)
+            if 0 < self.parallel_min_pages <= count:
+                engine.close(document)
+                document = None
+                # Workers share one file on disk instead of each receiving pickled bytes
+                with source_path(source) as path:
+                    yield from self._iter_pages_parallel(engine, path, count)
+                return
+            for i in range(count):
+                yield engine.page_text(document, i)
+        finally:
+            if document is not None:
+                engine.close(document)
+
+    def _iter_pages_parallel(self, engine: PDFEngine, path: str, count: int) -> Iterator[str]:
+        """Extract page ranges in worker processes and yield them in page order.
+
+        Only a window of chunks is in flight at once, so a caller that stops
+        early (budgeted extraction) does not pay for the whole document.
+        On exit, queued chunks are cancelled and running ones awaited, so
+        the caller can delete `path` safely.
+        """
+        pool = get_extraction_pool()
+        ranges = [(start, min(start + PAGES_PER_CHUNK, count)) for start in range(0, count, PAGES_PER_CHUNK)]
+        window = _extraction_pool_workers
+        pending = []
+        next_range = 0
+        try:
+            while next_range < len(ranges) or pending:
+                while next_range < len(ranges) and len(pending) < window:
+                    start, end = ranges[next_range]
+                    pending.append((start, end, pool.submit(_extract_page_range, engine.name, path, start, end)))
+                    next_range += 1
+                start, end, future = pending.pop(0)
+                try:
+                    pages = future.result()
+                except Exception as e:
+                    # A broken pool should not fail the upload; redo this chunk locally
+                    logger.warning(f"Parallel extraction of pages {start}-{end} failed, retrying in-process: {e}")
+                    pages = _extract_page_range(engine.name, path, start, end)
+                yield from pages
+        finally:
+            running = [future for _, _, future in pending if not future.cancel()]
+            wait(running)
+
+    def _extract_from_docx(self, source: DocumentSource) -> str:
+        """Extract text from DOCX file, including tables, by streaming the document XML"""
+        try:
+            return extract_docx_text(source.open_stream())
+        except (zipfile.BadZipFile, KeyError, ET.ParseError) as e:
+            logger.warning(f"Streaming DOCX reader failed, falling back to python-docx: {e}")
+            return self._extract_from_docx_object_model(source)
+
+    def _extract_from_docx_object_model(self, source: DocumentSource) -> str:
+        """Extract paragraph text through python-docx (no table content)"""
+        try:
+            import docx
+        except ImportError:
+            raise ImportError("python-docx not installed. Please install it: pip install python-docx")
+        doc = docx.Document(source.open_stream())
+        return "\n".join(paragraph.text for paragraph in doc.paragraphs).strip()
+
+    def _extract_from_txt(self, source: DocumentSource) -> str:
+        """Extract text from TXT file"""
+        return str(source.view, "utf-8")
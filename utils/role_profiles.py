@@ -0,0 +1,197 @@
+import re
+from typing import Dict, List, Tuple
+
+# Role -> titles that map to it, skills it requires and prefers (canonical
+# names from SKILLS_TAXONOMY), keywords recruiters scan for, and the years
+# of experience expected at mid level
+ROLE_PROFILES: Dict[str, Dict] = {
+    "software engineer": {
+        "titles": ["software engineer", "software developer", "sde", "programmer", "application developer"],
+        "required": ["Python", "Java", "SQL", "Git", "Data Structures", "REST APIs", "Unit Testing"],
+        "preferred": ["Docker", "AWS", "CI/CD", "Microservices", "System Design", "Linux", "Agile"],
+        "keywords": ["scalable", "design patterns", "code review", "algorithms", "performance", "debugging"],
+        "years": 2,
+    },
+    "backend developer": {
+        "titles": ["backend developer", "backend engineer", "back end developer", "server side developer"],
+        "required": ["Python", "Java", "SQL", "REST APIs", "PostgreSQL", "Git"],
+        "preferred": ["Docker", "Kubernetes", "Redis", "Microservices", "AWS", "Kafka", "Node.js"],
+        "keywords": ["api design", "scalability", "latency", "database design", "caching", "authentication"],
+        "years": 2,
+    },
+    "frontend developer": {
+        "titles": ["frontend developer", "frontend engineer", "front end developer", "ui developer",
+                   "web developer"],
+        "required": ["JavaScript", "HTML", "CSS", "React", "Git"],
+        "preferred": ["TypeScript", "Next.js", "Redux", "Tailwind CSS", "Unit Testing", "Figma", "GraphQL"],
+        "keywords": ["responsive design", "accessibility", "cross-browser", "performance", "components"],
+        "years": 2,
+    },
+    "full stack developer": {
+        "titles": ["full stack developer", "full stack engineer", "fullstack developer", "mern stack developer"],
+        "required": ["JavaScript", "React", "Node.js", "SQL", "REST APIs", "Git", "HTML", "CSS"],
+        "preferred": ["TypeScript", "MongoDB", "Docker", "AWS", "Express", "CI/CD"],
+        "keywords": ["end-to-end", "full stack", "deployment", "api integration", "responsive design"],
+        "years": 2,
+    },
+    "mobile developer": {
+        "titles": ["mobile developer", "android developer", "ios developer", "flutter developer",
+                   "mobile app developer"],
+        "required": ["Kotlin", "Swift", "Android", "iOS", "Git"],
+        "preferred": ["Flutter", "React Native", "REST APIs", "Unit Testing", "CI/CD"],
+        "keywords": ["app store", "play store", "mobile ui", "offline", "push notifications"],
+        "years": 2,
+    },
+    "data scientist": {
+        "titles": ["data scientist", "applied scientist", "research scientist"],
+        "required": ["Python", "SQL", "Machine Learning", "Statistics", "Pandas", "scikit-learn"],
+        "preferred": ["Deep Learning", "TensorFlow", "PyTorch", "NLP", "Spark", "A/B Testing", "Data Visualization"],
+        "keywords": ["predictive modeling", "feature engineering", "hypothesis testing", "model evaluation",
+                     "insights"],
+        "years": 2,
+    },
+    "machine learning engineer": {
+        "titles": ["machine learning engineer", "ml engineer", "ai engineer", "deep learning engineer"],
+        "required": ["Python", "Machine Learning", "Deep Learning", "PyTorch", "TensorFlow", "SQL"],
+        "preferred": ["MLOps", "Docker", "Kubernetes", "AWS", "LLMs", "NLP", "Computer Vision"],
+        "keywords": ["model deployment", "training pipelines", "inference", "feature store", "model monitoring"],
+        "years": 2,
+    },
+    "data engineer": {
+        "titles": ["data engineer", "big data engineer", "etl developer", "analytics engineer"],
+        "required": ["Python", "SQL", "ETL", "Spark", "Airflow", "Data Warehousing"],
+        "preferred": ["Kafka", "AWS", "Snowflake", "dbt", "BigQuery", "Docker", "Hadoop"],
+        "keywords": ["data pipelines", "data modeling", "batch", "streaming", "data quality", "orchestration"],
+        "years": 2,
+    },
+    "data analyst": {
+        "titles": ["data analyst", "business intelligence analyst", "bi analyst", "reporting analyst",
+                   "analytics analyst"],
+        "required": ["SQL", "Excel", "Tableau", "Power BI", "Statistics", "Data Visualization"],
+        "preferred": ["Python", "R", "A/B Testing", "Google Analytics", "Pandas"],
+        "keywords": ["dashboards", "kpis", "reporting", "insights", "trend analysis", "stakeholders"],
+        "years": 1,
+    },
+    "devops engineer": {
+        "titles": ["devops engineer", "site reliability engineer", "sre", "platform engineer",
+                   "infrastructure engineer", "cloud engineer"],
+        "required": ["Linux", "Docker", "Kubernetes", "CI/CD", "AWS", "Terraform"],
+        "preferred": ["Ansible", "Jenkins", "Monitoring", "Bash", "Python", "Azure", "GCP"],
+        "keywords": ["infrastructure as code", "uptime", "incident response", "automation", "reliability"],
+        "years": 2,
+    },
+    "cybersecurity analyst": {
+        "titles": ["cybersecurity analyst", "security analyst", "security engineer", "soc analyst",
+                   "information security analyst"],
+        "required": ["Cybersecurity", "Network Security", "Linux", "SIEM"],
+        "preferred": ["Penetration Testing", "Python", "AWS", "Bash", "Monitoring"],
+        "keywords": ["threat detection", "vulnerability assessment", "incident response", "compliance", "risk"],
+        "years": 2,
+    },
+    "qa engineer": {
+        "titles": ["qa engineer", "test engineer", "quality assurance engineer", "sdet", "automation tester"],
+        "required": ["Unit Testing", "Selenium", "SQL", "Agile", "Jira"],
+        "preferred": ["Python", "Java", "CI/CD", "REST APIs", "Git"],
+        "keywords": ["test cases", "regression testing", "bug tracking", "test plans", "automation"],
+        "years": 1,
+    },
+    "ui/ux designer": {
+        "titles": ["ui/ux designer", "ux designer", "ui designer", "product designer", "interaction designer"],
+        "required": ["Figma", "Wireframing", "User Research"],
+        "preferred": ["Adobe XD", "Photoshop", "HTML", "CSS", "A/B Testing"],
+        "keywords": ["user journeys", "personas", "design systems", "usability", "accessibility", "portfolio"],
+        "years": 2,
+    },
+    "product manager": {
+        "titles": ["product manager", "product owner", "associate product manager", "technical product manager"],
+        "required": ["Product Roadmap", "Stakeholder Management", "Agile", "Requirements Gathering"],
+        "preferred": ["SQL", "A/B Testing", "Jira", "Market Research", "Data Visualization", "Communication"],
+        "keywords": ["product strategy", "user needs", "prioritization", "go-to-market", "metrics", "launch"],
+        "years": 3,
+    },
+    "project manager": {
+        "titles": ["project manager", "program manager", "delivery manager", "scrum master"],
+        "required": ["Project Management", "Agile", "Stakeholder Management", "Jira"],
+        "preferred": ["Communication", "Leadership", "Excel", "Requirements Gathering"],
+        "keywords": ["timelines", "budget", "risk management", "deliverables", "milestones", "resource planning"],
+        "years": 3,
+    },
+    "business analyst": {
+        "titles": ["business analyst", "business systems analyst", "functional analyst"],
+        "required": ["Requirements Gathering", "SQL", "Excel", "Stakeholder Management"],
+        "preferred": ["Tableau", "Power BI", "Agile", "Jira", "Data Visualization"],
+        "keywords": ["process improvement", "business requirements", "gap analysis", "documentation", "kpis"],
+        "years": 2,
+    },
+    "digital marketer": {
+        "titles": ["digital marketer", "digital marketing specialist", "marketing manager", "seo specialist",
+                   "growth marketer", "marketing executive"],
+        "required": ["SEO", "SEM", "Google Analytics", "Content Marketing", "Social Media Marketing"],
+        "preferred": ["A/B Testing", "CRM", "Excel", "Market Research"],
+        "keywords": ["campaigns", "conversion rate", "roi", "engagement", "lead generation", "brand"],
+        "years": 2,
+    },
+}
+
+# Used when the target role is not in the catalog
+GENERIC_PROFILE: Dict = {
+    "titles": [],
+    "required": ["Communication", "Problem Solving", "Teamwork"],
+    "preferred": ["Leadership", "Excel", "Project Management"],
+    "keywords": ["results", "impact", "collaboration", "ownership", "initiative"],
+    "years": 2,
+}
+
+# Seniority words in the role title and the years they imply
+SENIORITY_YEARS = {
+    "intern": 0, "trainee": 0, "fresher": 0, "graduate": 0, "entry": 0, "junior": 1, "jr": 1, "associate": 1,
+    "senior": 5, "sr": 5, "lead": 7, "staff": 7, "principal": 9, "head": 10, "director": 10,
+}
+
+_NON_WORD_RE = re.compile(r"[^a-z0-9+#/]+")
+# Minimum title word overlap for a fuzzy match
+MIN_TITLE_SIMILARITY = 0.5
+
+
+def normalize_role(job_role: str) -> str:
+    """Lowercase, strip punctuation and seniority words: "Sr. Data-Engineer" -> "data engineer" """
+    words = _NON_WORD_RE.sub(" ", job_role.lower()).split()
+    return " ".join(word for word in words if word not in SENIORITY_YEARS)
+
+
+def seniority_years(job_role: str) -> int:
+    """Years implied by seniority words in the title, or -1 when there are none"""
+    words = _NON_WORD_RE.sub(" ", job_role.lower()).split()
+    years = [SENIORITY_YEARS[word] for word in words if word in SENIORITY_YEARS]
+    return max(years) if years else -1
+
+
+def find_role_profile(job_role: str) -> Tuple[str, Dict]:
+    """Best catalog profile for a free-text role, or ("", GENERIC_PROFILE).
+
+    The profile's expected years are adjusted for seniority words in the title.
+    """
+    normalized = normalize_role(job_role)
+    words = set(normalized.split())
+    best_name, best_score = "", 0.0
+    for name, profile in ROLE_PROFILES.items():
+        for title in [name] + profile["titles"]:
+            if title == normalized:
+                best_name, best_score = name, 1.0
+                break
+            title_words = set(title.split())
+            score = len(words & title_words) / len(words | title_words) if words else 0.0
+            if score > best_score:
+                best_name, best_score = name, score
+        if best_score == 1.0:
+            break
+
+    profile = dict(ROLE_PROFILES[best_name]) if best_score >= MIN_TITLE_SIMILARITY else dict(GENERIC_PROFILE)
+    years = seniority_years(job_role)
+    if years >= 0:
+        profile["years"] = years
+    return (best_name if best_score >= MIN_TITLE_SIMILARITY else ""), profile
+
+
+def profile_skills(profile: Dict) -> List[str]:
+    return list(dict.fromkeys(profile["required"] + profile["preferred"]))
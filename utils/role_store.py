@@ -0,0 +1,254 @@
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, List, Optional
+
+from utils.role_profiles import GENERIC_PROFILE, find_role_profile, normalize_role, seniority_years
+from utils.single_flight import SingleFlight
+from utils.skill_matcher import get_skill_matcher
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_ENTRIES = 512
+DEFAULT_MAX_DISK_ENTRIES = 2000
+# Generated skill lists are cut to these lengths
+MAX_REQUIRED_SKILLS = 10
+MAX_PREFERRED_SKILLS = 10
+MAX_KEYWORDS = 10
+# A role whose generation failed is served the generic profile this long before retrying
+FAILED_GENERATION_COOLDOWN_SECONDS = 600.0
+
+# Builds a profile for a role the catalog does not cover, or returns None
+ProfileGenerator = Callable[[str], Optional[Dict]]
+
+
+def _clean_list(values, limit: int) -> List[str]:
+    if not isinstance(values, list):
+        return []
+    cleaned = {}
+    for value in values:
+        if isinstance(value, str) and value.strip():
+            value = value.strip()
+            cleaned.setdefault(value.lower(), value)
+    return list(cleaned.values())[:limit]
+
+
+def validate_profile(data: Dict) -> Optional[Dict]:
+    """Coerce a generated profile into catalog shape, or None when it is unusable"""
+    if not isinstance(data, dict):
+        return None
+    matcher = get_skill_matcher()
+    required = [matcher.canonical(skill) or skill for skill in _clean_list(data.get("required"), MAX_REQUIRED_SKILLS)]
+    if not required:
+        return None
+    required_keys = {skill.lower() for skill in required}
+    preferred = [matcher.canonical(skill) or skill
+                 for skill in _clean_list(data.get("preferred"), MAX_PREFERRED_SKILLS)]
+    try:
+        years = max(0, min(20, int(data.get("years", GENERIC_PROFILE["years"]))))
+    except (TypeError, ValueError):
+        years = GENERIC_PROFILE["years"]
+    return {
+        "titles": _clean_list(data.get("titles"), MAX_KEYWORDS),
+        "required": required,
+        "preferred": [skill for skill in preferred if skill.lower() not in required_keys],
+        "keywords": [keyword.lower() for keyword in _clean_list(data.get("keywords"), MAX_KEYWORDS)],
+        "years": years,
+    }
+
+
+class RoleProfileStore:
+    """Role requirement profiles shared by every session, keyed by normalized role.
+
+    A role is resolved once: from the bundled catalog when it matches,
+    otherwise from the optional generator (the LLM), otherwise the generic
+    profile. Resolved profiles are kept in an in-memory LRU, and generated
+    ones also in SQLite so they survive restarts. A failed generation is
+    not retried for FAILED_GENERATION_COOLDOWN_SECONDS. Seniority words are
+    stripped from the key and applied to the expected years on every read.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES, db_path: Optional[str] = None,
+                 max_disk_entries: int = DEFAULT_MAX_DISK_ENTRIES):
+        self.max_entries = max(1, max_entries)
+        self.max_disk_entries = max(1, max_disk_entries)
+        self.db_path = db_path
+        self._entries: "OrderedDict[str, Dict]" = OrderedDict()
+        # Normalized role -> monotonic time its generation last failed
+        self._failures: "OrderedDict[str, float]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._db_lock = threading.Lock()
+        # Concurrent first requests for the same role generate it once
+        self._single_flight = SingleFlight(name="roles")
+
+        if self.db_path:
+            try:
+                os.makedirs(os.path.dirname(self.db_path) or ".", exist_ok=True)
+                with self._connect() as db:
+                    db.execute(
+                        "CREATE TABLE IF NOT EXISTS role_profiles ("
+                        "key TEXT PRIMARY KEY, profile TEXT NOT NULL, created REAL NOT NULL, accessed REAL NOT NULL)"
+                    )
+            except (OSError, sqlite3.Error) as e:
+                logger.warning(f"Disabling role profile disk cache: {e}")
+                self.db_path = None
+
+    def get(self, job_role: str, generate: Optional[ProfileGenerator] = None) -> Dict:
+        """Profile for a free-text role with its name, source and seniority-adjusted years"""
+        key = normalize_role(job_role)
+        profile = self._lookup(key)
+        if profile is None or self._should_generate(key, profile, generate):
+            profile = self._single_flight.do(key, lambda: self._resolve(key, generate))
+        return self._for_role(job_role, profile)
+
+    def peek(self, job_role: str) -> Optional[Dict]:
+        """Catalog or already-resolved profile for a role, or None; never generates or caches.
+
+        Cheap enough to call on every keystroke of a role input.
+        """
+        key = normalize_role(job_role)
+        with self._lock:
+            profile = self._entries.get(key)
+        if profile is None:
+            name, catalog_profile = find_role_profile(key)
+            if not name:
+                return None
+            profile = dict(catalog_profile, name=name, source="catalog")
+        return self._for_role(job_role, profile)
+
+    def cached_roles(self) -> List[str]:
+        with self._lock:
+            return list(self._entries)
+
+    @staticmethod
+    def _for_role(job_role: str, profile: Dict) -> Dict:
+        profile = dict(profile)
+        years = seniority_years(job_role)
+        if years >= 0:
+            profile["years"] = years
+        return profile
+
+    def _should_generate(self, key: str, profile: Dict, generate: Optional[ProfileGenerator]) -> bool:
+        """A generic profile is upgraded by the generator unless it recently failed for this role"""
+        if profile["source"] != "generic" or generate is None:
+            return False
+        with self._lock:
+            failed_at = self._failures.get(key)
+        return failed_at is None or time.monotonic() - failed_at >= FAILED_GENERATION_COOLDOWN_SECONDS
+
+    def _lookup(self, key: str) -> Optional[Dict]:
+        with self._lock:
+            profile = self._entries.get(key)
+            if profile is not None:
+                self._entries.move_to_end(key)
+                return profile
+        profile = self._read_disk(key)
+        if profile is not None:
+            with self._lock:
+                self._store(key, profile)
+        return profile
+
+    def _resolve(self, key: str, generate: Optional[ProfileGenerator]) -> Dict:
+        # Another caller may have resolved it while this one waited
+        profile = self._lookup(key)
+        if profile is not None and not self._should_generate(key, profile, generate):
+            return profile
+
+        name, catalog_profile = find_role_profile(key)
+        if name:
+            profile = dict(catalog_profile, name=name, source="catalog")
+        else:
+            generated = None
+            if generate is not None and key:
+                try:
+                    generated = validate_profile(generate(key))
+                except Exception as e:
+                    logger.warning(f"Could not generate a profile for {key!r}: {e}")
+            if generated is not None:
+                profile = dict(generated, name=key, source="llm")
+                self._write_disk(key, profile)
+            else:
+                profile = dict(GENERIC_PROFILE, name="", source="generic")
+
+        with self._lock:
+            self._store(key, profile)
+            if profile["source"] == "generic" and generate is not None and key:
+                self._failures[key] = time.monotonic()
+                self._failures.move_to_end(key)
+                while len(self._failures) > self.max_entries:
+                    self._failures.popitem(last=False)
+            else:
+                self._failures.pop(key, None)
+        return profile
+
+    def _store(self, key: str, profile: Dict):
+        self._entries[key] = profile
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.db_path, timeout=5)
+
+    def _read_disk(self, key: str) -> Optional[Dict]:
+        if not self.db_path:
+            return None
+        try:
+            with self._db_lock, self._connect() as db:
+                row = db.execute("SELECT profile FROM role_profiles WHERE key = ?", (key,)).fetchone()
+                if row is None:
+                    return None
+                db.execute("UPDATE role_profiles SET accessed = ? WHERE key = ?", (time.time(), key))
+                return json.loads(row[0])
+        except (sqlite3.Error, ValueError) as e:
+            logger.warning(f"Ignoring role profile cache read error: {e}")
+            return None
+
+    def _write_disk(self, key: str, profile: Dict):
+        if not self.db_path:
+            return
+        now = time.time()
+        try:
+            with self._db_lock, self._connect() as db:
+                db.execute(
+                    "INSERT OR REPLACE INTO role_profiles (key, profile, created, accessed) VALUES (?, ?, ?, ?)",
+                    (key, json.dumps(profile, ensure_ascii=False), now, now),
+                )
+                db.execute(
+                    "DELETE FROM role_profiles WHERE key IN ("
+                    "SELECT key FROM role_profiles ORDER BY accessed DESC LIMIT -1 OFFSET ?)",
+                    (self.max_disk_entries,),
+                )
+        except sqlite3.Error as e:
+            logger.warning(f"Could not persist role profile: {e}")
+
+
+def format_profile(profile: Dict) -> str:
+    """Role requirements as prompt lines"""
+    lines = [
+        f"Required skills: {', '.join(profile['required'])}",
+        f"Preferred skills: {', '.join(profile['preferred'])}",
+        f"Keywords recruiters look for: {', '.join(profile['keywords'])}",
+        f"Typical experience: {profile['years']}+ years",
+    ]
+    return "\n".join(line for line in lines if not line.endswith(": "))
+
+
+_role_store: Optional[RoleProfileStore] = None
+_role_store_lock = threading.Lock()
+
+
+def get_role_store() -> RoleProfileStore:
+    """Return the role profile store shared by every session in this process"""
+    global _role_store
+    with _role_store_lock:
+        if _role_store is None:
+            cache_dir = os.environ.get("RESUMEFIT_CACHE_DIR")
+            _role_store = RoleProfileStore(
+                db_path=os.path.join(cache_dir, "role_profiles.sqlite3") if cache_dir else None,
+            )
+        return _role_store
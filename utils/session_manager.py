@@ -4,10 +4,12 @@ def initialize_session_state():
     """Initialize session state with default values (Logic Unchanged)"""
     defaults = {
         'resume_text': '', 
+        'resume_document': None,
         'job_role': '', 
         'analysis_result': None, 
         'analysis_complete': False, 
-        'chat_history': []
+        'chat_history': [],
+        'conversation_memory': None
     }
     for key, value in defaults.items():
         if key not in st.session_state:
@@ -44,6 +46,7 @@ def get_chat_history():
 def clear_chat_history():
     """Clear the chat history"""
     st.session_state.chat_history = []
+    st.session_state.conversation_memory = None
 
 def is_analysis_ready():
     """Check if analysis requirements are met"""
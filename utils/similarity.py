@@ -0,0 +1,114 @@
+import re
+import threading
+import zlib
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from utils.role_profiles import ROLE_PROFILES
+from utils.skills_taxonomy import SKILLS_TAXONOMY
+
+# Hashed feature space; each profile row is 16 KB of float32
+N_FEATURES = 4096
+# Required skills count this many times in a profile's term weights
+REQUIRED_WEIGHT = 2
+
+_TOKEN_RE = re.compile(r"[a-z0-9][a-z0-9+#./-]*[a-z0-9+#]|[a-z0-9]")
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase word unigrams and bigrams"""
+    words = _TOKEN_RE.findall(text.lower())
+    return words + [f"{a} {b}" for a, b in zip(words, words[1:])]
+
+
+def _hash(term: str) -> int:
+    # crc32 is stable across processes, unlike hash()
+    return zlib.crc32(term.encode("utf-8")) % N_FEATURES
+
+
+def term_counts(terms: Iterable[str]) -> np.ndarray:
+    """Hashed term-frequency vector"""
+    indices = np.fromiter((_hash(term) for term in terms), dtype=np.int64)
+    return np.bincount(indices, minlength=N_FEATURES).astype(np.float32)
+
+
+def profile_terms(profile: Dict) -> List[str]:
+    """Terms describing a role profile: titles, skills with their aliases, and keywords"""
+    terms = []
+    for title in profile.get("titles", []):
+        terms += tokenize(title)
+    for weight, skills in ((REQUIRED_WEIGHT, profile["required"]), (1, profile["preferred"])):
+        for skill in skills:
+            aliases = SKILLS_TAXONOMY.get(skill, {}).get("aliases", [])
+            terms += tokenize(" ".join([skill] + aliases)) * weight
+    for keyword in profile["keywords"]:
+        terms += tokenize(keyword)
+    return terms
+
+
+def resume_terms(resume_text: str, found_skills: Sequence[str] = ()) -> List[str]:
+    """Resume tokens plus the canonical names of skills found under any alias"""
+    terms = tokenize(resume_text)
+    for skill in found_skills:
+        terms += tokenize(skill)
+    return terms
+
+
+class RoleIndex:
+    """TF-IDF matrix of role profiles in a hashed feature space.
+
+    Rows are L2-normalized, so scoring a resume against every profile is a
+    single matrix-vector product, and a batch of resumes a single matrix
+    product.
+    """
+
+    def __init__(self, profiles: Dict[str, Dict]):
+        self.names = list(profiles)
+        counts = np.stack([term_counts(profile_terms(profile)) for profile in profiles.values()]) \
+            if profiles else np.zeros((0, N_FEATURES), dtype=np.float32)
+        document_frequency = (counts > 0).sum(axis=0)
+        self.idf = (np.log((1 + len(self.names)) / (1 + document_frequency)) + 1).astype(np.float32)
+        self.matrix = self._normalize(self._weight(counts))
+
+    def _weight(self, counts: np.ndarray) -> np.ndarray:
+        # Sublinear term frequency so a skill repeated ten times does not dominate
+        return np.log1p(counts, dtype=np.float32) * self.idf
+
+    @staticmethod
+    def _normalize(vectors: np.ndarray) -> np.ndarray:
+        norms = np.linalg.norm(vectors, axis=-1, keepdims=True)
+        return vectors / np.where(norms == 0, 1, norms)
+
+    def vectorize(self, terms: Iterable[str]) -> np.ndarray:
+        return self._normalize(self._weight(term_counts(terms)))
+
+    def similarity(self, resume_vector: np.ndarray, profile: Dict) -> float:
+        """Cosine similarity between a resume vector and any profile, catalogued or not"""
+        return float(self.vectorize(profile_terms(profile)) @ resume_vector)
+
+    def score(self, resume_vector: np.ndarray) -> np.ndarray:
+        """Cosine similarity with every catalogued profile"""
+        return self.matrix @ resume_vector
+
+    def score_batch(self, resume_vectors: np.ndarray) -> np.ndarray:
+        """Similarity matrix of shape (resumes, profiles)"""
+        return resume_vectors @ self.matrix.T
+
+    def top(self, resume_vector: np.ndarray, k: int = 3) -> List[Tuple[str, float]]:
+        scores = self.score(resume_vector)
+        best = np.argsort(-scores)[:k]
+        return [(self.names[i], round(float(scores[i]), 3)) for i in best]
+
+
+_role_index: Optional[RoleIndex] = None
+_role_index_lock = threading.Lock()
+
+
+def get_role_index() -> RoleIndex:
+    """Return the index of the bundled role catalog, shared process-wide"""
+    global _role_index
+    with _role_index_lock:
+        if _role_index is None:
+            _role_index = RoleIndex(ROLE_PROFILES)
+        return _role_index
@@ -0,0 +1,173 @@
+import re
+import threading
+from collections import deque
+from typing import Dict, List, NamedTuple, Optional
+
+from utils.skills_taxonomy import CASE_SENSITIVE_TERMS, CONTEXT_TERMS, skill_category, skill_terms
+
+# Characters that continue a term on either side: C++, C#, Node.js
+_TERM_CHARS = "+#"
+# Labels that mark a line as a skills or languages list
+_SKILL_LABEL_RE = re.compile(r"\b(?:skills?|languages?|programming|technolog(?:y|ies)|tech stack|proficient)\b",
+                             re.IGNORECASE)
+
+
+class SkillMatch(NamedTuple):
+    skill: str
+    term: str
+    start: int
+    end: int
+
+
+def _is_word_char(char: str) -> bool:
+    return char.isalnum() or char == "_"
+
+
+def _lower_same_length(text: str) -> str:
+    """Lowercase without changing offsets (a few characters lowercase to two)"""
+    lowered = text.lower()
+    if len(lowered) == len(text):
+        return lowered
+    return "".join(char if len(char.lower()) != 1 else char.lower() for char in text)
+
+
+class SkillMatcher:
+    """Aho-Corasick automaton over every skill name and alias.
+
+    Built once from the taxonomy; `scan` finds all terms in a single pass
+    over the text, then keeps the leftmost-longest match at each position
+    that sits on a word boundary.
+    """
+
+    def __init__(self, terms: Optional[Dict[str, str]] = None,
+                 case_sensitive: Optional[set] = None, context_terms: Optional[set] = None):
+        self.terms = terms if terms is not None else skill_terms()
+        self.case_sensitive = case_sensitive if case_sensitive is not None else CASE_SENSITIVE_TERMS
+        self.context_terms = context_terms if context_terms is not None else CONTEXT_TERMS
+        self._canonical = {term.lower(): skill for term, skill in self.terms.items()}
+        # Spellings that differ only in case share one automaton key
+        self._spellings: Dict[str, List[str]] = {}
+        for term in self.terms:
+            self._spellings.setdefault(term.lower(), []).append(term)
+
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[List[str]] = [[]]
+        for key in self._spellings:
+            self._add(key)
+        self._link()
+
+    def _add(self, key: str):
+        state = 0
+        for char in key:
+            next_state = self._goto[state].get(char)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto[state][char] = next_state
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append([])
+            state = next_state
+        self._output[state].append(key)
+
+    def _link(self):
+        """Breadth-first failure links; outputs inherit those of their fallback state"""
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[next_state] = self._goto[fallback].get(char, 0)
+                if self._fail[next_state] == next_state:
+                    self._fail[next_state] = 0
+                self._output[next_state] = self._output[next_state] + self._output[self._fail[next_state]]
+
+    @property
+    def size(self) -> int:
+        return len(self._goto)
+
+    def _on_boundary(self, text: str, start: int, end: int) -> bool:
+        if start > 0:
+            before = text[start - 1]
+            if _is_word_char(before) or before in _TERM_CHARS or before == ".":
+                return False
+        if end < len(text):
+            after = text[end]
+            if _is_word_char(after) or after in _TERM_CHARS:
+                return False
+            if after == "." and end + 1 < len(text) and _is_word_char(text[end + 1]):
+                return False
+        return True
+
+    def _spelling_at(self, text: str, key: str, start: int, end: int) -> Optional[str]:
+        """The taxonomy spelling matched at text[start:end], honouring case-sensitive terms"""
+        original = text[start:end]
+        for term in self._spellings[key]:
+            if term not in self.case_sensitive or term == original:
+                return term
+        return None
+
+    def scan(self, text: str) -> List[SkillMatch]:
+        """Every skill mention in `text` with its character offsets, in order"""
+        lowered = _lower_same_length(text)
+        goto, fail, output = self._goto, self._fail, self._output
+        candidates = []
+        state = 0
+        for index, char in enumerate(lowered):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            for key in output[state]:
+                start = index + 1 - len(key)
+                candidates.append((start, index + 1, key))
+
+        matches = []
+        last_end = 0
+        for start, end, key in sorted(candidates, key=lambda c: (c[0], c[0] - c[1])):
+            if start < last_end or not self._on_boundary(text, start, end):
+                continue
+            term = self._spelling_at(text, key, start, end)
+            if term is None:
+                continue
+            matches.append(SkillMatch(self.terms[term], term, start, end))
+            last_end = end
+        if any(match.term in self.context_terms for match in matches):
+            matches = [match for match in matches
+                       if match.term not in self.context_terms or self._in_skill_context(text, match, matches)]
+        return matches
+
+    def _in_skill_context(self, text: str, match: SkillMatch, matches: List[SkillMatch]) -> bool:
+        """Whether the line holding `match` is a skills list: labelled as one (on the line or
+        the heading just above it) or naming another language"""
+        line_start = text.rfind("\n", 0, match.start) + 1
+        line_end = text.find("\n", match.end)
+        line_end = len(text) if line_end < 0 else line_end
+        label_start = text.rfind("\n", 0, max(0, line_start - 1)) + 1 if line_start else 0
+        if _SKILL_LABEL_RE.search(text, label_start, line_end):
+            return True
+        return any(line_start <= other.start and other.end <= line_end and other.term not in self.context_terms
+                   and skill_category(other.skill) == "languages" for other in matches)
+
+    def find(self, text: str) -> List[str]:
+        """Canonical skills mentioned in `text`, in order of first mention"""
+        return list(dict.fromkeys(match.skill for match in self.scan(text)))
+
+    def canonical(self, name: str) -> Optional[str]:
+        """Canonical skill for a spelling such as "k8s" or "JS", or None"""
+        return self._canonical.get(name.strip().lower())
+
+
+_skill_matcher: Optional[SkillMatcher] = None
+_skill_matcher_lock = threading.Lock()
+
+
+def get_skill_matcher() -> SkillMatcher:
+    """Return the matcher compiled from the bundled taxonomy, shared process-wide"""
+    global _skill_matcher
+    with _skill_matcher_lock:
+        if _skill_matcher is None:
+            _skill_matcher = SkillMatcher()
+        return _skill_matcher
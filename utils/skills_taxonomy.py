@@ -0,0 +1,155 @@
+from typing import Dict
+
+# Canonical skill -> category and the other spellings that count as the same skill
+SKILLS_TAXONOMY: Dict[str, Dict] = {
+    # Programming languages
+    "Python": {"category": "languages", "aliases": ["python3"]},
+    "Java": {"category": "languages", "aliases": []},
+    "JavaScript": {"category": "languages", "aliases": ["JS", "ecmascript", "es6"]},
+    "TypeScript": {"category": "languages", "aliases": ["TS"]},
+    "C": {"category": "languages", "aliases": []},
+    "C++": {"category": "languages", "aliases": ["cpp"]},
+    "C#": {"category": "languages", "aliases": ["csharp", "c sharp"]},
+    "Go": {"category": "languages", "aliases": ["golang"]},
+    "Rust": {"category": "languages", "aliases": []},
+    "Ruby": {"category": "languages", "aliases": []},
+    "PHP": {"category": "languages", "aliases": []},
+    "Kotlin": {"category": "languages", "aliases": []},
+    "Swift": {"category": "languages", "aliases": []},
+    "Scala": {"category": "languages", "aliases": []},
+    "R": {"category": "languages", "aliases": ["r programming"]},
+    "MATLAB": {"category": "languages", "aliases": []},
+    "SQL": {"category": "languages", "aliases": ["t-sql", "pl/sql"]},
+    "Bash": {"category": "languages", "aliases": ["shell scripting"]},
+    "Dart": {"category": "languages", "aliases": []},
+    # Web and mobile
+    "HTML": {"category": "web", "aliases": ["html5"]},
+    "CSS": {"category": "web", "aliases": ["css3"]},
+    "React": {"category": "web", "aliases": ["react.js", "reactjs"]},
+    "Angular": {"category": "web", "aliases": ["angularjs", "angular.js"]},
+    "Vue.js": {"category": "web", "aliases": ["vue", "vuejs"]},
+    "Next.js": {"category": "web", "aliases": ["nextjs"]},
+    "Node.js": {"category": "web", "aliases": ["Node", "nodejs"]},
+    "Express": {"category": "web", "aliases": ["express.js", "expressjs"]},
+    "Django": {"category": "web", "aliases": []},
+    "Flask": {"category": "web", "aliases": []},
+    "FastAPI": {"category": "web", "aliases": []},
+    "Spring Boot": {"category": "web", "aliases": ["Spring", "spring framework"]},
+    "ASP.NET": {"category": "web", "aliases": [".net", "dotnet", ".net core"]},
+    "REST APIs": {"category": "web", "aliases": ["REST", "restful", "rest api", "restful apis"]},
+    "GraphQL": {"category": "web", "aliases": []},
+    "Tailwind CSS": {"category": "web", "aliases": ["tailwind"]},
+    "Redux": {"category": "web", "aliases": []},
+    "Android": {"category": "mobile", "aliases": []},
+    "iOS": {"category": "mobile", "aliases": []},
+    "Flutter": {"category": "mobile", "aliases": []},
+    "React Native": {"category": "mobile", "aliases": []},
+    # Data and machine learning
+    "Pandas": {"category": "data", "aliases": []},
+    "NumPy": {"category": "data", "aliases": []},
+    "Spark": {"category": "data", "aliases": ["apache spark", "pyspark"]},
+    "Hadoop": {"category": "data", "aliases": []},
+    "Kafka": {"category": "data", "aliases": ["apache kafka"]},
+    "Airflow": {"category": "data", "aliases": ["apache airflow"]},
+    "dbt": {"category": "data", "aliases": []},
+    "ETL": {"category": "data", "aliases": ["elt", "data pipelines", "data pipeline"]},
+    "Data Warehousing": {"category": "data", "aliases": ["data warehouse"]},
+    "Snowflake": {"category": "data", "aliases": []},
+    "BigQuery": {"category": "data", "aliases": []},
+    "Tableau": {"category": "data", "aliases": []},
+    "Power BI": {"category": "data", "aliases": ["powerbi"]},
+    "Excel": {"category": "data", "aliases": ["microsoft excel", "ms excel"]},
+    "Statistics": {"category": "data", "aliases": ["statistical analysis"]},
+    "Data Visualization": {"category": "data", "aliases": ["data visualisation"]},
+    "A/B Testing": {"category": "data", "aliases": ["ab testing", "experimentation"]},
+    "Machine Learning": {"category": "ml", "aliases": ["ML"]},
+    "Deep Learning": {"category": "ml", "aliases": []},
+    "NLP": {"category": "ml", "aliases": ["natural language processing"]},
+    "Computer Vision": {"category": "ml", "aliases": ["opencv"]},
+    "LLMs": {"category": "ml", "aliases": ["llm", "large language models", "generative ai", "genai"]},
+    "TensorFlow": {"category": "ml", "aliases": []},
+    "PyTorch": {"category": "ml", "aliases": []},
+    "Keras": {"category": "ml", "aliases": []},
+    "scikit-learn": {"category": "ml", "aliases": ["sklearn", "scikit learn"]},
+    "MLOps": {"category": "ml", "aliases": ["mlflow"]},
+    # Cloud, DevOps and infrastructure
+    "AWS": {"category": "cloud", "aliases": ["amazon web services", "ec2"]},
+    "Azure": {"category": "cloud", "aliases": ["microsoft azure"]},
+    "GCP": {"category": "cloud", "aliases": ["google cloud", "google cloud platform"]},
+    "Docker": {"category": "devops", "aliases": []},
+    "Kubernetes": {"category": "devops", "aliases": ["k8s"]},
+    "Terraform": {"category": "devops", "aliases": []},
+    "Ansible": {"category": "devops", "aliases": []},
+    "Jenkins": {"category": "devops", "aliases": []},
+    "CI/CD": {"category": "devops", "aliases": ["ci cd", "continuous integration", "github actions", "gitlab ci"]},
+    "Linux": {"category": "devops", "aliases": ["unix"]},
+    "Git": {"category": "tools", "aliases": ["version control"]},
+    "Monitoring": {"category": "devops", "aliases": ["prometheus", "grafana", "observability"]},
+    "Data Structures": {"category": "architecture", "aliases": ["data structures and algorithms", "dsa",
+                                                                "algorithms"]},
+    "Microservices": {"category": "architecture", "aliases": ["microservice"]},
+    "System Design": {"category": "architecture", "aliases": ["distributed systems"]},
+    # Databases
+    "PostgreSQL": {"category": "databases", "aliases": ["postgres"]},
+    "MySQL": {"category": "databases", "aliases": []},
+    "MongoDB": {"category": "databases", "aliases": ["mongo"]},
+    "Redis": {"category": "databases", "aliases": []},
+    "NoSQL": {"category": "databases", "aliases": []},
+    "Elasticsearch": {"category": "databases", "aliases": ["elastic search"]},
+    # Quality and security
+    "Unit Testing": {"category": "quality", "aliases": ["pytest", "junit", "jest", "tdd", "test automation"]},
+    "Selenium": {"category": "quality", "aliases": []},
+    "Cybersecurity": {"category": "security", "aliases": ["information security", "infosec"]},
+    "Network Security": {"category": "security", "aliases": ["firewalls"]},
+    "Penetration Testing": {"category": "security", "aliases": ["pentesting", "ethical hacking"]},
+    "SIEM": {"category": "security", "aliases": ["splunk"]},
+    # Design
+    "Figma": {"category": "design", "aliases": []},
+    "Adobe XD": {"category": "design", "aliases": []},
+    "Photoshop": {"category": "design", "aliases": ["adobe photoshop"]},
+    "Wireframing": {"category": "design", "aliases": ["wireframes", "prototyping"]},
+    "User Research": {"category": "design", "aliases": ["usability testing"]},
+    # Product, business and marketing
+    "Agile": {"category": "process", "aliases": ["scrum", "kanban"]},
+    "Jira": {"category": "tools", "aliases": []},
+    "Product Roadmap": {"category": "product", "aliases": ["roadmapping", "roadmap"]},
+    "Stakeholder Management": {"category": "product", "aliases": ["stakeholder communication"]},
+    "Requirements Gathering": {"category": "product", "aliases": ["requirements analysis", "user stories"]},
+    "Project Management": {"category": "product", "aliases": ["pmp"]},
+    "Market Research": {"category": "business", "aliases": []},
+    "Financial Modeling": {"category": "business", "aliases": ["financial modelling"]},
+    "SEO": {"category": "marketing", "aliases": ["search engine optimization"]},
+    "SEM": {"category": "marketing", "aliases": ["google ads", "ppc"]},
+    "Google Analytics": {"category": "marketing", "aliases": []},
+    "Content Marketing": {"category": "marketing", "aliases": ["content strategy"]},
+    "Social Media Marketing": {"category": "marketing", "aliases": ["social media"]},
+    "CRM": {"category": "business", "aliases": ["salesforce", "hubspot"]},
+    # Soft skills
+    "Communication": {"category": "soft", "aliases": ["communication skills"]},
+    "Leadership": {"category": "soft", "aliases": ["team leadership", "mentoring"]},
+    "Problem Solving": {"category": "soft", "aliases": ["problem-solving"]},
+    "Teamwork": {"category": "soft", "aliases": ["collaboration", "cross-functional"]},
+}
+
+# Spellings that are also ordinary words only count when written exactly like this
+CASE_SENSITIVE_TERMS = {"C", "R", "Go", "Swift", "Rust", "Ruby", "Spark", "Express", "Excel", "Node", "Spring",
+                        "REST", "ML", "JS", "TS", "Dart", "Redux", "Agile", "Flask", "Keras", "Android"}
+# Spellings that are also initials or capitalized words (John C. Smith, "Spring 2022",
+# "Go to market") only count on a line that names another language or carries a
+# skills/languages label
+CONTEXT_TERMS = {"C", "R", "Go", "Spring"}
+
+
+def skill_terms() -> Dict[str, str]:
+    """Every spelling (canonical name and aliases) mapped to its canonical skill"""
+    terms = {}
+    for skill, info in SKILLS_TAXONOMY.items():
+        for term in [skill] + info["aliases"]:
+            terms[term] = skill
+    return terms
+
+
+def skill_category(skill: str) -> str:
+    info = SKILLS_TAXONOMY.get(skill)
+    return info["category"] if info else "other"
+
@@ -0,0 +1,7 @@
+# Rough English average used for token budgets; avoids loading a tokenizer
+CHARS_PER_TOKEN = 4
+
+
+def estimate_tokens(text: str) -> int:
+    """Cheap approximate token count for budget decisions"""
+    return (len(text) + CHARS_PER_TOKEN - 1) // CHARS_PER_TOKEN
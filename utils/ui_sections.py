@@ -90,7 +90,7 @@ def create_main_upload_section():
     uploaded_file = st.file_uploader(
         "Choose your resume file",
         type=["pdf", "txt", "docx"],
-        help="Supported formats: PDF, DOCX, TXT (Max size: 10MB)",
+        help="Supported formats: PDF, DOCX, TXT (Max size: 10MB, 100 pages)",
         label_visibility="collapsed"
     )
     
@@ -98,9 +98,21 @@ def create_main_upload_section():
         with st.spinner("🔄 Processing your resume..."):
             try:
                 resume_processor = ResumeProcessor()
-                resume_text = resume_processor.extract_text(uploaded_file)
-                if resume_text:
+                document_info = resume_processor.preflight(uploaded_file, uploaded_file.type)
+                resume_document = resume_processor.extract_document(
+                    uploaded_file, max_chars=ResumeProcessor.UI_CHAR_BUDGET
+                ) if document_info["ok"] else None
+                if not document_info["ok"]:
+                    st.markdown(f"""
+                    <div class="error-message">
+                        ❌ <strong>File Rejected</strong><br>
+                        {document_info['reason']}
+                    </div>
+                    """, unsafe_allow_html=True)
+                elif resume_document:
+                    resume_text = resume_document.text
                     st.session_state.resume_text = resume_text
+                    st.session_state.resume_document = resume_document
                     st.markdown("""
                     <div class="success-message">
                         ✅ <strong>Resume processed successfully!</strong><br>
@@ -112,7 +124,16 @@ def create_main_upload_section():
                     with st.expander("👀 Resume Preview", expanded=False):
                         preview_text = resume_text[:800] + "..." if len(resume_text) > 800 else resume_text
                         st.text_area("Resume Content", preview_text, height=200, disabled=True)
-                        st.caption(f"📊 Total characters: {len(resume_text):,}")
+                        page_count = document_info["page_count"]
+                        pages_label = f" | Pages: {page_count}" if page_count else ""
+                        st.caption(
+                            f"📊 Total characters: {len(resume_text):,}{pages_label}"
+                            f" | File size: {document_info['size_bytes'] / 1024:,.0f} KB"
+                        )
+                        if len(resume_text) >= ResumeProcessor.UI_CHAR_BUDGET:
+                            st.caption("✂️ Long document: only the opening pages were read for analysis.")
+                        if "partial_text_layer" in document_info["warnings"]:
+                            st.caption("🖼️ Some pages look like scanned images; their text could not be read.")
                 else:
                     st.markdown("""
                     <div class="error-message">
@@ -133,6 +154,8 @@ def create_main_upload_section():
 
 def create_job_role_section():
     """Create the job role input section"""
+    from utils.role_store import get_role_store
+    
     st.markdown("""
     <div class="section-divider">
         <h3>🎯 Target Job Role</h3>
@@ -150,7 +173,16 @@ def create_job_role_section():
     
     if job_role != st.session_state.job_role:
         st.session_state.job_role = job_role
-    
+
+    if job_role.strip():
+        # Read-only: partial input on each keystroke must not generate or fill the cache
+        profile = get_role_store().peek(job_role)
+        if profile is not None and profile["source"] != "generic":
+            st.caption(
+                f"📋 Matched role profile: {profile['name'].title()} · "
+                f"key skills: {', '.join(profile['required'][:5])} · ~{profile['years']}+ years"
+            )
+
     # Industry context (optional)
     col1, col2 = st.columns(2)
     with col1:
@@ -175,6 +207,7 @@ def create_job_role_section():
 def create_analysis_section():
     """Create the analysis button section"""
     from utils.llm_handler import LLMHandler
+    from utils.local_analyzer import analyze_resume_locally
     
     st.markdown("""
     <div class="section-divider">
@@ -207,7 +240,19 @@ def create_analysis_section():
             All requirements met. Click below to start your AI-powered resume analysis.
         </div>
         """, unsafe_allow_html=True)
-    
+
+        # The local engine runs in milliseconds, so show its estimate before the AI pass
+        estimate = analyze_resume_locally(
+            st.session_state.resume_text,
+            st.session_state.job_role,
+            st.session_state.resume_document
+        )
+        st.caption(
+            f"⚡ Instant estimate: {estimate['match_percentage']}% match · "
+            f"{len(estimate['found_skills'])} skills found · "
+            f"ATS score {estimate['ats_compatibility']['score']}/10"
+        )
+
     # Analysis button
     col1, col2, col3 = st.columns([1, 2, 1])
     with col2:
@@ -216,12 +261,20 @@ def create_analysis_section():
                     use_container_width=True,
                     disabled=not requirements_met):
             if requirements_met:
-                with st.spinner("🤖 AI is analyzing your resume... This may take a moment."):
+                llm_handler = LLMHandler()
+                spinner_text = "🤖 AI is analyzing your resume... This may take a moment."
+                queue = llm_handler.queue_status()
+                if queue["wait_seconds"] >= 1:
+                    spinner_text = (
+                        f"⏳ High demand: about {queue['wait_seconds']:.0f}s before analysis starts "
+                        f"({queue['queue_depth']} requests ahead)..."
+                    )
+                with st.spinner(spinner_text):
                     try:
-                        llm_handler = LLMHandler()
                         result = llm_handler.analyze_resume_comprehensive(
                             st.session_state.resume_text,
-                            st.session_state.job_role
+                            st.session_state.job_role,
+                            resume_document=st.session_state.resume_document
                         )
                         st.session_state.analysis_result = result
                         st.session_state.analysis_complete = True